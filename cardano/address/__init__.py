@@ -1,10 +1,37 @@
+from binascii import unhexlify
+import functools
+
 import base58
 
 from ..consts import Era
-from .shelley import AddressDeserializer, SHELLEY_ADDR_RE
+from .shelley import (
+    AddressDeserializer,
+    AddressSerializer,
+    AddressType,
+    Hash,
+    NetworkTag,
+    Pointer,
+    SHELLEY_ADDR_RE,
+)
+
+#: The maximal number of validated addresses kept by :func:`address` for reuse
+ADDRESS_CACHE_SIZE = 65536
+
+
+def address(addr, wallet=None, trusted=False):
+    """
+    Validates the address and returns an object of the proper :class:`Address` subclass.
 
+    Objects of addresses not bound to a wallet are cached, so that repeated calls for the same
+    address return the same object without validating it again. The least recently used ones
+    are dropped when the cache grows above :data:`ADDRESS_CACHE_SIZE`. Such shared objects
+    should be treated as immutable.
 
-def address(addr, wallet=None):
+    :param trusted: if ``True``, the address is known to be valid, e.g. it comes from the
+                    wallet server. Only its prefix is checked and the payload is decoded upon
+                    the first access to attributes that need it. Addresses of unrecognized
+                    kinds are returned as plain :class:`Address` objects.
+    """
     if isinstance(addr, Address):
         return addr  # already instatinated and should be of proper class
     elif isinstance(addr, (bytes, bytearray)):
@@ -13,6 +40,12 @@ def address(addr, wallet=None):
         raise TypeError(
             "address() argument must be str, bytes, bytearray or Address instance"
         )
+    if wallet is None:
+        return _cached_address(addr, None, trusted)
+    return _address(addr, wallet, trusted)
+
+
+def _address(addr, wallet=None, trusted=False):
     # validation
     if SHELLEY_ADDR_RE.match(addr):
         AddressClass = ShelleyAddress
@@ -20,9 +53,15 @@ def address(addr, wallet=None):
         AddressClass = ByronAddress
     elif addr.startswith("Ae2"):
         AddressClass = IcarusAddress
+    elif trusted:
+        # a valid address of a kind not recognized here, e.g. a testnet Byron one
+        AddressClass = Address
     else:
         raise ValueError("String {} is not a valid Cardano address".format(addr))
-    return AddressClass(addr, wallet=wallet)
+    return AddressClass(addr, wallet=wallet, trusted=trusted)
+
+
+_cached_address = functools.lru_cache(maxsize=ADDRESS_CACHE_SIZE)(_address)
 
 
 class Address(object):
@@ -31,41 +70,49 @@ class Address(object):
 
     Compares with ``str`` and ``bytes`` objects.
 
+    Subclasses may define a default ``wallet`` as class attribute, used when none is passed.
+
     :param addr:    the address as ``str`` or ``bytes`` or ``Address``
     :param wallet:  the ``Wallet`` object if address belongs to
+    :param trusted: if ``True``, the validation is skipped
     """
 
-    _address = ""
-    wallet = None
+    __slots__ = ("_address", "_hash", "wallet")
 
-    def __init__(self, addr, wallet=None):
-        self._address = addr
-        self.wallet = wallet or self.wallet
-        self._validate()
+    def __init__(self, addr, wallet=None, trusted=False):
+        if isinstance(addr, (bytes, bytearray)):
+            addr = addr.decode()
+        self._address = str(addr)
+        self._hash = hash(self._address)
+        self.wallet = wallet or getattr(self, "wallet", None)
+        if not trusted:
+            self._validate()
 
     def _validate(self):
         pass
 
     def __repr__(self):
-        return str(self._address)
+        return self._address
 
     def __eq__(self, other):
         if isinstance(other, Address):
-            return str(self) == str(other)
+            return self._address == other._address
         elif isinstance(other, str):
-            return str(self) == other
+            return self._address == other
         elif isinstance(other, bytes):
-            return str(self).encode() == other
+            return self._address.encode() == other
         return super(Address, self).__eq__(other)
 
     def __hash__(self):
-        return hash(str(self))
+        return self._hash
 
     def __format__(self, spec):
-        return format(str(self), spec)
+        return format(self._address, spec)
 
 
 class ByronAddress(Address):
+    __slots__ = ()
+
     era = Era.BYRON
 
     def _validate(self):
@@ -75,6 +122,8 @@ class ByronAddress(Address):
 
 
 class IcarusAddress(ByronAddress):
+    __slots__ = ()
+
     def _validate(self):
         if not self._address.startswith("Ae2"):
             raise ValueError(
@@ -83,15 +132,165 @@ class IcarusAddress(ByronAddress):
         data = base58.b58decode(self._address)
 
 
+def _decoded(name):
+    slot = "_" + name
+
+    def fget(self):
+        try:
+            return getattr(self, slot)
+        except AttributeError:
+            self._decode()
+            return getattr(self, slot)
+
+    return property(fget)
+
+
+def _credential(value):
+    if isinstance(value, Hash):
+        return value
+    elif isinstance(value, str):
+        value = unhexlify(value)
+    return Hash(value)
+
+
 class ShelleyAddress(Address):
+    """
+    Shelley era address. The ``hrp``, ``network_tag``, ``address_type``, ``components``
+    and ``raw_bytes`` are decoded from the address upon validation or, for trusted addresses,
+    upon the first access to any of them.
+
+    Addresses may be also built locally from the hashes of keys or scripts, given as
+    :class:`Hash <cardano.address.shelley.Hash>` objects, 28 ``bytes`` or hex strings, with
+    :meth:`base`, :meth:`enterprise`, :meth:`pointer` and :meth:`reward` constructors.
+    """
+
+    __slots__ = (
+        "_hrp",
+        "_network_tag",
+        "_address_type",
+        "_components",
+        "_raw_bytes",
+    )
+
     era = Era.SHELLEY
-    network_tag = None
-    address_type = None
 
-    def _validate(self):
+    hrp = _decoded("hrp")
+    network_tag = _decoded("network_tag")
+    address_type = _decoded("address_type")
+    components = _decoded("components")
+    #: The binary form of the address: the header byte followed by the payload.
+    raw_bytes = _decoded("raw_bytes")
+
+    def _decode(self):
+        deserializer = AddressDeserializer(self._address)
         (
-            self.hrp,
-            self.network_tag,
-            self.address_type,
-            self.components,
-        ) = AddressDeserializer(self._address).deserialized()
+            self._hrp,
+            self._network_tag,
+            self._address_type,
+            self._components,
+        ) = deserializer.deserialized()
+        self._raw_bytes = deserializer.raw_bytes
+
+    def _validate(self):
+        self._decode()
+
+    @classmethod
+    def from_components(
+        cls, network_tag, address_type, components, hrp=None, wallet=None
+    ):
+        """
+        Builds the address from its parts.
+
+        :param network_tag:     a :class:`NetworkTag <cardano.address.shelley.NetworkTag>`
+        :param address_type:    an :class:`AddressType <cardano.address.shelley.AddressType>`
+        :param components:      a pair of :class:`Hash <cardano.address.shelley.Hash>` and,
+                                depending on the type, another ``Hash``, a
+                                :class:`Pointer <cardano.address.shelley.Pointer>` or ``None``
+        :param hrp:             the prefix, by default ``addr`` or ``stake``, followed by
+                                ``_test`` for the testnet
+        """
+        network_tag, address_type = NetworkTag(network_tag), AddressType(address_type)
+        if hrp is None:
+            hrp = (
+                "stake"
+                if address_type
+                in (AddressType.Stake_StakeKeyHash, AddressType.Stake_ScriptHash)
+                else "addr"
+            )
+            if network_tag == NetworkTag.TESTNET:
+                hrp += "_test"
+        serializer = AddressSerializer(hrp, network_tag, address_type, components)
+        addr = cls(serializer.serialized(), wallet=wallet, trusted=True)
+        addr._hrp = hrp
+        addr._network_tag = network_tag
+        addr._address_type = address_type
+        addr._components = serializer.components
+        addr._raw_bytes = serializer.raw_bytes
+        return addr
+
+    @classmethod
+    def base(
+        cls,
+        payment,
+        stake,
+        network_tag=NetworkTag.MAINNET,
+        payment_script=False,
+        stake_script=False,
+        wallet=None,
+    ):
+        """
+        Builds a base address, paying to the ``payment`` key and delegating to the ``stake`` key.
+        The ``payment_script`` and ``stake_script`` flags tell the respective hash is of a script.
+        """
+        return cls.from_components(
+            network_tag,
+            AddressType.PaymentKeyHash_StakeKeyHash
+            + bool(payment_script)
+            + 2 * bool(stake_script),
+            (_credential(payment), _credential(stake)),
+            wallet=wallet,
+        )
+
+    @classmethod
+    def enterprise(
+        cls, payment, network_tag=NetworkTag.MAINNET, script=False, wallet=None
+    ):
+        """
+        Builds an enterprise address, which has no stake rights.
+        """
+        return cls.from_components(
+            network_tag,
+            AddressType.PaymentKeyHashOnly + bool(script),
+            (_credential(payment), None),
+            wallet=wallet,
+        )
+
+    @classmethod
+    def pointer(
+        cls, payment, pointer, network_tag=NetworkTag.MAINNET, script=False, wallet=None
+    ):
+        """
+        Builds a pointer address. The ``pointer`` is a :class:`Pointer
+        <cardano.address.shelley.Pointer>` or a tuple of slot number, transaction index and
+        output index of the stake key registration certificate.
+        """
+        if not isinstance(pointer, Pointer):
+            pointer = Pointer.from_values(*pointer)
+        return cls.from_components(
+            network_tag,
+            AddressType.PaymentKeyHash_Pointer + bool(script),
+            (_credential(payment), pointer),
+            wallet=wallet,
+        )
+
+    @classmethod
+    def reward(cls, stake, network_tag=NetworkTag.MAINNET, script=False, wallet=None):
+        """
+        Builds a reward (stake) address.
+        """
+        return cls.from_components(
+            network_tag,
+            AddressType.Stake_StakeKeyHash + bool(script),
+            (_credential(stake), None),
+            wallet=wallet,
+        )
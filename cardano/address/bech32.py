@@ -25,48 +25,127 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-"""Reference implementation for Bech32/Bech32m and segwit addresses."""
+"""Bech32 codec, based on the reference implementation.
+
+The checksum is computed with a table of generator combinations instead of bit-by-bit, the
+checksum state of the human-readable part is cached, and characters are mapped with a lookup
+table.
+"""
+import functools
+import re
 
 CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
 
+_GENERATOR = [0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3]
+# XOR of the generator values selected by each of the possible 5 top bits of the checksum
+_GENERATOR_TABLE = [
+    functools.reduce(
+        lambda acc, i: acc ^ (_GENERATOR[i] if (top >> i) & 1 else 0), range(5), 0
+    )
+    for top in range(32)
+]
+_CHARSET_VALUES = dict(
+    [(c, i) for i, c in enumerate(CHARSET)]
+    + [(c.upper(), i) for i, c in enumerate(CHARSET)]
+)
+_HRP_RE = re.compile("[\x21-\x7e]+")
+# the constant a valid Bech32 checksum leaves in the state
+_BECH32_CONST = 1
 
-def bech32_polymod(values):
-    """Internal function that computes the Bech32 checksum."""
-    generator = [0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3]
-    chk = 1
+
+def _polymod(values, chk=1):
+    table = _GENERATOR_TABLE
     for value in values:
-        top = chk >> 25
-        chk = (chk & 0x1FFFFFF) << 5 ^ value
-        for i in range(5):
-            chk ^= generator[i] if ((top >> i) & 1) else 0
+        chk = ((chk & 0x1FFFFFF) << 5 ^ value) ^ table[chk >> 25]
     return chk
 
 
+def bech32_polymod(values):
+    """Internal function that computes the Bech32 checksum."""
+    return _polymod(values)
+
+
 def bech32_hrp_expand(hrp):
     """Expand the HRP into values for checksum computation."""
     return [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
 
 
-def bech32_decode(bech):
-    """Validate a Bech32/Bech32m string, and determine HRP and data."""
-    if (any(ord(x) < 33 or ord(x) > 126 for x in bech)) or (
-        bech.lower() != bech and bech.upper() != bech
-    ):
-        return (None, None, None)
-    bech = bech.lower()
-    pos = bech.rfind("1")
-    if pos < 1 or pos + 7 > len(bech):
+@functools.lru_cache(maxsize=1024)
+def _hrp_state(hrp):
+    """The checksum state after processing the expanded HRP, cached as there are few HRPs."""
+    return _polymod(bech32_hrp_expand(hrp))
+
+
+def _decode(bech):
+    lower = bech.lower()
+    if lower != bech and bech.upper() != bech:
+        return None
+    pos = lower.rfind("1")
+    if pos < 1 or pos + 7 > len(lower):
         # Removed the 90 char limitation -- MS
-        return (None, None, None)
-    if not all(x in CHARSET for x in bech[pos + 1 :]):
-        return (None, None, None)
-    hrp = bech[:pos]
-    data = [CHARSET.find(x) for x in bech[pos + 1 :]]
-    if bech32_polymod(bech32_hrp_expand(hrp) + data) is None:
-        return (None, None, None)
+        return None
+    hrp = lower[:pos]
+    if not _HRP_RE.fullmatch(hrp):
+        return None
+    try:
+        data = [_CHARSET_VALUES[x] for x in bech[pos + 1 :]]
+    except KeyError:
+        return None
+    if _polymod(data, _hrp_state(hrp)) != _BECH32_CONST:
+        return None
+    return hrp, data
+
+
+def bech32_decode(bech):
+    """Validate a Bech32 string, and determine HRP and data."""
+    decoded = _decode(bech)
+    if decoded is None:
+        return (None, None)
+    hrp, data = decoded
     return (hrp, data[:-6])
 
 
+def bech32_validate(bech):
+    """Check whether the string is a valid Bech32 string."""
+    return _decode(bech) is not None
+
+
+def bech32_create_checksum(hrp, data):
+    """Compute the checksum values given HRP and data."""
+    polymod = _polymod(list(data) + [0] * 6, _hrp_state(hrp)) ^ _BECH32_CONST
+    return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+
+
+def bech32_encode(hrp, data):
+    """Compute a Bech32 string given HRP and data values."""
+    combined = list(data) + bech32_create_checksum(hrp, data)
+    return hrp + "1" + "".join([CHARSET[d] for d in combined])
+
+
+def decode_many(bechs):
+    """Decode an iterable of Bech32 strings, yielding ``(hrp, data)`` pairs. Invalid strings
+    yield ``(None, None)``."""
+    return map(bech32_decode, bechs)
+
+
+def validate_many(bechs):
+    """Validate an iterable of Bech32 strings, yielding a :class:`bool` for each of them."""
+    return map(bech32_validate, bechs)
+
+
+def to_bytes(data):
+    """Convert 5-bit values into :class:`bytes`, without padding. Return ``None`` if the
+    padding bits are invalid."""
+    val = 0
+    for value in data:
+        val = (val << 5) | value
+    nbits = 5 * len(data)
+    pad = nbits % 8
+    if pad >= 5 or val & ((1 << pad) - 1):
+        return None
+    return (val >> pad).to_bytes(nbits // 8, "big")
+
+
 def convertbits(data, frombits, tobits, pad=True):
     """General power-of-2 base conversion."""
     acc = 0
@@ -82,7 +161,7 @@ def convertbits(data, frombits, tobits, pad=True):
         while bits >= tobits:
             bits -= tobits
             ret.append((acc >> bits) & maxv)
-    if pad:  # pragma: no cover
+    if pad:
         if bits:
             ret.append((acc << (tobits - bits)) & maxv)
     elif bits >= frombits or ((acc << (tobits - bits)) & maxv):
@@ -76,18 +76,43 @@ class AddressType(enum.IntEnum):
 
 
 class Hash(object):
-    hex_repr = None
+    """
+    A 28-byte hash of a key or script. The raw bytes are kept and the hex representation is
+    computed upon the first use.
+
+    :param data:    28 bytes as ``bytes``, ``bytearray``, ``memoryview`` or a list of ints
+    """
+
+    __slots__ = ("raw", "_hex_repr")
 
     def __init__(self, data):
         if len(data) != 28:
             raise ValueError(
                 "Hash object needs 28 bytes, {:d} provided".format(len(data))
             )
-        self.hex_repr = hexlify(bytes(data)).decode()
+        self.raw = bytes(data)
+        self._hex_repr = None
+
+    @property
+    def hex_repr(self):
+        if self._hex_repr is None:
+            self._hex_repr = hexlify(self.raw).decode()
+        return self._hex_repr
 
     def __str__(self):
         return self.hex_repr
 
+    def __bytes__(self):
+        return self.raw
+
+    def __eq__(self, other):
+        if isinstance(other, Hash):
+            return self.raw == other.raw
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.raw)
+
 
 class Pointer(object):
     slot_num = 0
@@ -95,23 +120,49 @@ class Pointer(object):
     output_index = None
 
     def __init__(self, data):
-        data = data.copy()
-        self.slot_num, data = self._popint(data)
-        self.transaction_index, data = self._popint(data)
-        self.output_index, data = self._popint(data)
-
-    def _popint(self, data):
-        _intbytes = []
-        while data:
-            b = data[0]
-            data = data[1:]
-            _intbytes.append(b & 0x7F)
+        pos = 0
+        self.slot_num, pos = self._readint(data, pos)
+        self.transaction_index, pos = self._readint(data, pos)
+        self.output_index, pos = self._readint(data, pos)
+
+    @classmethod
+    def from_values(cls, slot_num, transaction_index, output_index):
+        """
+        Creates the pointer to the certificate at the given chain position.
+        """
+        ptr = cls.__new__(cls)
+        ptr.slot_num = slot_num
+        ptr.transaction_index = transaction_index
+        ptr.output_index = output_index
+        return ptr
+
+    def __bytes__(self):
+        return b"".join(
+            map(
+                self._intbytes,
+                (self.slot_num, self.transaction_index, self.output_index),
+            )
+        )
+
+    def _intbytes(self, val):
+        if val < 0:
+            raise ValueError("Pointer values must not be negative, got {}".format(val))
+        _intbytes = [val & 0x7F]
+        val >>= 7
+        while val:
+            _intbytes.append(0x80 | (val & 0x7F))
+            val >>= 7
+        return bytes(reversed(_intbytes))
+
+    def _readint(self, data, pos):
+        val = 0
+        while pos < len(data):
+            b = data[pos]
+            pos += 1
+            val = (val << 7) | (b & 0x7F)
             if b & 0x80 == 0:
                 break
-        val = 0
-        for idx, b in enumerate(reversed(_intbytes)):
-            val = val | (b << (8 * idx) - idx)
-        return val, data
+        return val, pos
 
 
 class AddressDeserializer(object):
@@ -132,6 +183,7 @@ class AddressDeserializer(object):
     components = None
     hrp = None
     payload = None
+    raw_bytes = None
 
     def __init__(self, address):
         """
@@ -142,9 +194,12 @@ class AddressDeserializer(object):
         self.hrp, binaddr5bit = bech32.bech32_decode(address)
         if not binaddr5bit:
             raise ValueError("{:s} is not a valid Shelley address".format(address))
-        binaddr = bech32.convertbits(binaddr5bit, 5, 8, False)
-        header = binaddr[0]
-        self.payload = binaddr[1:]
+        self.raw_bytes = bech32.to_bytes(binaddr5bit)
+        if not self.raw_bytes:
+            raise ValueError("{:s} is not a valid Shelley address".format(address))
+        header = self.raw_bytes[0]
+        # slices of the view share the buffer, the components copy only what they keep
+        self.payload = memoryview(self.raw_bytes)[1:]
         self.address_type, self.network_tag = (header & 0xF0) >> 4, header & 0xF
         if self.address_type not in AddressType.__members__.values():
             raise ValueError(
@@ -191,3 +246,59 @@ class AddressDeserializer(object):
             part2 = Hash(part2) if part2 else None
         self.components = (part1, part2)
         return (self.hrp, self.network_tag, self.address_type, self.components)
+
+
+class AddressSerializer(object):
+    """
+    Builds a Shelley address from its parts, the reverse of :class:`AddressDeserializer`.
+
+    :param hrp:             the human-readable prefix, like ``addr`` or ``stake_test``
+    :param network_tag:     a :class:`NetworkTag`
+    :param address_type:    an :class:`AddressType`
+    :param components:      a pair of :class:`Hash` and, depending on the type, another
+                            :class:`Hash`, a :class:`Pointer` or ``None``
+    """
+
+    def __init__(self, hrp, network_tag, address_type, components):
+        self.hrp = hrp
+        self.network_tag = NetworkTag(network_tag)
+        self.address_type = AddressType(address_type)
+        self.components = tuple(components)
+        if (self.network_tag == NetworkTag.TESTNET) != hrp.endswith("_test"):
+            raise ValueError(
+                "Prefix {:s} doesn't match the network tag {:s}".format(
+                    hrp, self.network_tag.name
+                )
+            )
+        part1, part2 = self.components
+        if self.address_type in (
+            AddressType.PaymentKeyHash_Pointer,
+            AddressType.ScriptHash_Pointer,
+        ):
+            types = (Hash, Pointer)
+        elif self.address_type in (
+            AddressType.PaymentKeyHashOnly,
+            AddressType.ScriptHashOnly,
+            AddressType.Stake_StakeKeyHash,
+            AddressType.Stake_ScriptHash,
+        ):
+            types = (Hash, type(None))
+        else:
+            types = (Hash, Hash)
+        if not (isinstance(part1, types[0]) and isinstance(part2, types[1])):
+            raise ValueError(
+                "Address of type {:s} needs components of types {:s} and {:s}".format(
+                    self.address_type.name, types[0].__name__, types[1].__name__
+                )
+            )
+        header = (self.address_type << 4) | self.network_tag
+        # the binary form of the address, i.e. the header byte followed by the payload
+        self.raw_bytes = bytes([header]) + b"".join(
+            bytes(c) for c in self.components if c is not None
+        )
+
+    def serialized(self):
+        """
+        Returns the address as a :class:`str`.
+        """
+        return bech32.bech32_encode(self.hrp, bech32.convertbits(self.raw_bytes, 8, 5))
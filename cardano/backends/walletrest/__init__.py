@@ -1,4 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
+import datetime
 from decimal import Decimal
+import functools
 import json
 import logging
 import operator
@@ -7,7 +10,7 @@ import urllib
 
 from ... import exceptions as main_exceptions
 from ...metadata import Metadata
-from ...numbers import from_lovelaces, to_lovelaces
+from ...numbers import Lovelace, from_lovelaces, to_lovelaces
 from ...simpletypes import (
     AssetID,
     Balance,
@@ -15,10 +18,14 @@ from ...simpletypes import (
     StakePoolStatus,
     StakeRewardMetrics,
     StakingStatus,
+    WalletInfo,
 )
-from ...transaction import Transaction
+from ...transaction import Deferred, Transaction
 from . import exceptions
+from . import jsonstream
+from .cache import AddressCache, WalletSnapshotCache
 from . import serializers
+from .singleflight import SingleFlight
 
 _log = logging.getLogger(__name__)
 
@@ -31,8 +38,35 @@ class JSONWithDecimalEncoder(json.JSONEncoder):
 
 
 class WalletREST(object):
+    """
+    The backend using REST API of ``cardano-wallet``.
+
+    :param protocol:            the protocol, ``http`` or ``https``
+    :param host:                the host name
+    :param port:                the port number
+    :param timeout:             the request timeout in seconds
+    :param session:             an optional :class:`requests.Session` to be used for requests
+    :param wallet_max_age:      the number of seconds the wallet state (balance, sync progress,
+                                staking status etc.) retrieved from the server is reused for,
+                                ``0`` (the default) disables caching
+    :param coalesce_requests:   if ``True``, concurrent identical ``GET`` requests share
+                                a single HTTP call and its result
+    :param lazy_transactions:   if ``True``, inputs, outputs and metadata of transactions are
+                                decoded only upon the first access
+    :param lovelace_amounts:    if ``True``, amounts are returned as integer
+                                :class:`Lovelace <cardano.numbers.Lovelace>` instead of
+                                :class:`Decimal` ADA
+    """
+
     base_url = None
     timeout = 10
+    wallet_max_age = 0
+    coalesce_requests = False
+    lazy_transactions = False
+    lovelace_amounts = False
+    tx_window = datetime.timedelta(days=7)
+    stream_chunk_size = 65536
+    lookup_workers = 8
 
     ERR2EXCEPTION = {
         403: {
@@ -52,52 +86,120 @@ class WalletREST(object):
         },
     }
 
-    def __init__(self, protocol="http", host="localhost", port=8090, timeout=None):
+    def __init__(
+        self,
+        protocol="http",
+        host="localhost",
+        port=8090,
+        timeout=None,
+        session=None,
+        wallet_max_age=None,
+        coalesce_requests=None,
+        lazy_transactions=None,
+        lovelace_amounts=None,
+    ):
         self.base_url = "{protocol}://{host}:{port}/v2/".format(
             protocol=protocol, host=host, port=port
         )
         self.timeout = timeout or self.timeout
-        self.session = requests.Session()
-        self.session.headers = {"Content-Type": "application/json"}
-        _log.debug("WalletREST backend url: {:s}".format(self.base_url))
+        self.session = session or self._create_session()
+        self._address_cache = AddressCache()
+        self._wallet_cache = WalletSnapshotCache(
+            wallet_max_age if wallet_max_age is not None else self.wallet_max_age
+        )
+        if coalesce_requests is not None:
+            self.coalesce_requests = coalesce_requests
+        if lazy_transactions is not None:
+            self.lazy_transactions = lazy_transactions
+        if lovelace_amounts is not None:
+            self.lovelace_amounts = lovelace_amounts
+        self._inflight = self._create_inflight()
+        self._netparams = None
+        _log.debug(
+            "{:s} backend url: {:s}".format(self.__class__.__name__, self.base_url)
+        )
 
-    def raw_request(self, method, path, params=None):
+    def _create_session(self):
+        session = requests.Session()
+        session.headers = {"Content-Type": "application/json"}
+        return session
+
+    def _create_inflight(self):
+        return SingleFlight()
+
+    def _request_key(self, method, path, params):
+        if not self.coalesce_requests or method.upper() != "GET":
+            return None
+        return (
+            path,
+            json.dumps(params or {}, cls=JSONWithDecimalEncoder, sort_keys=True),
+        )
+
+    def raw_request(self, method, path, params=None, stream=False):
+        """
+        Sends a request to the server and returns the decoded result.
+
+        :param stream:  if ``True``, the result is expected to be a JSON array and an iterator
+                        over its elements is returned. They are decoded while the response
+                        is being received, so the whole document is never held in memory.
+        """
+        if stream:
+            return self._raw_request(method, path, params, stream=True)
+        key = self._request_key(method, path, params)
+        if key is None:
+            return self._raw_request(method, path, params)
+        return self._inflight.do(key, lambda: self._raw_request(method, path, params))
+
+    def _raw_request(self, method, path, params=None, stream=False):
         url = "".join([self.base_url, path])
         params = params or {}
         _log.debug(
-            u"{method} {url}\nParams:\n{params}".format(
+            "{method} {url}\nParams:\n{params}".format(
                 method=method,
                 url=url,
                 params=json.dumps(params, indent=2, sort_keys=True),
             )
         )
         rsp = getattr(self.session, method.lower())(
-            url, data=json.dumps(params), timeout=self.timeout
+            url, data=json.dumps(params), timeout=self.timeout, stream=stream
         )
+        if stream and rsp.status_code == 200:
+            _log.debug("Streaming result")
+            return self._iter_result(rsp)
         if rsp.status_code != 204:  # if content exists
             result = rsp.json(parse_float=Decimal)
-            _ppresult = json.dumps(
-                rsp.json(), cls=JSONWithDecimalEncoder, indent=2, sort_keys=True
-            )
-            _log.debug(u"Result:\n{result}".format(result=_ppresult))
+            if _log.isEnabledFor(logging.DEBUG):
+                _ppresult = json.dumps(
+                    result, cls=JSONWithDecimalEncoder, indent=2, sort_keys=True
+                )
+                _log.debug("Result:\n{result}".format(result=_ppresult))
         else:
             result = None
-            _log.debug(u"No result (HTTP 204)")
-        if rsp.status_code == 400:
+            _log.debug("No result (HTTP 204)")
+        return self._check_result(rsp.status_code, result)
+
+    def _iter_result(self, rsp):
+        try:
+            yield from jsonstream.iter_array(
+                rsp.iter_content(chunk_size=self.stream_chunk_size)
+            )
+        finally:
+            rsp.close()
+
+    def _check_result(self, status_code, result):
+        if status_code == 400:
             raise exceptions.BadRequest(result["message"], result=result)
-        if rsp.status_code in (403, 409):
+        if status_code in (403, 409):
             try:
-                raise self.ERR2EXCEPTION[rsp.status_code][result["code"]](
-                    result["message"]
-                )
+                raise self.ERR2EXCEPTION[status_code][result["code"]](result["message"])
             except KeyError:
                 pass
             raise exceptions.RESTServerError(result.get("message", "* NO MESSAGE *"))
-        if rsp.status_code == 404:
+        if status_code == 404:
             raise exceptions.NotFound(result["message"], result=result)
-        if rsp.status_code == 500:
+        if status_code == 500:
             try:
-                raise self.ERR2EXCEPTION[rsp.status_code][result["code"]](
+                raise self.ERR2EXCEPTION[status_code][result["code"]](
                     result["message"], result=result
                 )
             except KeyError:
@@ -110,14 +212,31 @@ class WalletREST(object):
     def wallet_ids(self):
         return map(operator.itemgetter("id"), self.raw_request("GET", "wallets"))
 
+    def _wallet_data(self, wid):
+        wdata = self._wallet_cache.get(wid)
+        if wdata is None:
+            generation = self._wallet_cache.generation(wid)
+            wdata = self._wallet_cache.set(
+                wid, self.raw_request("GET", "wallets/{:s}".format(wid)), generation
+            )
+        return wdata
+
+    def invalidate_wallet(self, wid=None):
+        """
+        Drops the cached state of the given wallet, or of all wallets if ``wid`` is ``None``.
+        It is done automatically after operations made through the backend which change the
+        wallet state.
+        """
+        self._wallet_cache.invalidate(wid)
+
     def wallet_exists(self, wid):
         try:
-            self.raw_request("GET", "wallets/{:s}".format(wid))
+            self._wallet_data(wid)
         except exceptions.NotFound:
             return False
         return True
 
-    def create_wallet(self, name, mnemonic, passphrase, mnemonic_2f=None):
+    def _createwalletdata(self, name, mnemonic, passphrase, mnemonic_2f=None):
         data = {
             "name": name,
             "mnemonic_sentence": mnemonic.split(),
@@ -126,92 +245,216 @@ class WalletREST(object):
         }
         if mnemonic_2f:
             data["mnemonic_second_factor"] = mnemonic_2f.split()
-        wdata = self.raw_request("POST", "wallets", data)
+        return data
+
+    def create_wallet(self, name, mnemonic, passphrase, mnemonic_2f=None):
+        wdata = self.raw_request(
+            "POST",
+            "wallets",
+            self._createwalletdata(name, mnemonic, passphrase, mnemonic_2f),
+        )
         return wdata["id"]
 
     def delete_wallet(self, wid):
+        self.invalidate_addresses(wid)
+        self.invalidate_wallet(wid)
         try:
             self.raw_request("DELETE", "wallets/{:s}".format(wid))
         except exceptions.NotFound:
             return False
         return True
 
-    def sync_progress(self, wid):
-        wdata = self.raw_request("GET", "wallets/{:s}".format(wid))
+    def _syncprogress(self, wdata):
         return (
             1.0
             if wdata["state"]["status"] == "ready"
             else wdata["state"]["progress"]["quantity"] / Decimal(100)
         )
 
-    def balance(self, wid):
-        bdata = self.raw_request("GET", "wallets/{:s}".format(wid))["balance"]
+    def sync_progress(self, wid):
+        return self._syncprogress(self._wallet_data(wid))
+
+    def _lovelaces(self, quantity):
+        return Lovelace(quantity) if self.lovelace_amounts else from_lovelaces(quantity)
+
+    def _amount(self, data):
+        return serializers.get_amount(data, self.lovelace_amounts)
+
+    def _balance(self, wdata):
+        bdata = wdata["balance"]
         return Balance(
-            from_lovelaces(bdata["total"]["quantity"]),
-            from_lovelaces(bdata["available"]["quantity"]),
-            from_lovelaces(bdata["reward"]["quantity"]),
+            self._lovelaces(bdata["total"]["quantity"]),
+            self._lovelaces(bdata["available"]["quantity"]),
+            self._lovelaces(bdata["reward"]["quantity"]),
         )
 
-    def asset_balances(self, wid):
-        data = self.raw_request("GET", "wallets/{:s}".format(wid))
+    def balance(self, wid):
+        return self._balance(self._wallet_data(wid))
+
+    def _assetbalances(self, data):
         try:
             bdata = data["assets"]
         except KeyError:
             raise exceptions.NotSupported("Extra assets are not supported")
-        assets = {}
-        for ast in bdata["total"]:
-            aid = AssetID(ast["asset_name"], ast["policy_id"])
-            assets[aid] = assets[aid] if aid in assets else {}
-            assets[aid]["total"] = ast["quantity"]
-        for ast in bdata["available"]:
-            aid = AssetID(ast["asset_name"], ast["policy_id"])
-            assets[aid] = assets[aid] if aid in assets else {}
-            assets[aid]["available"] = ast["quantity"]
+        total = serializers.get_multiasset(bdata["total"])
+        available = serializers.get_multiasset(bdata["available"])
         return {
-            # NOTE: The get() below is due to suspected missing field reported in #14
-            aid: Balance(bal["total"], bal.get("available", Decimal(0)), None)
-            for aid, bal in assets.items()
+            # NOTE: The default below is due to suspected missing field reported in #14
+            aid: Balance(qty, available[aid] if aid in available else Decimal(0), None)
+            for aid, qty in total
         }
 
-    def addresses(self, wid):
-        adata = self.raw_request("GET", "wallets/{:s}/addresses".format(wid))
+    def asset_balances(self, wid):
+        return self._assetbalances(self._wallet_data(wid))
+
+    def _addresses(self, adata):
         return [(ad["id"], True if ad["state"] == "used" else False) for ad in adata]
 
-    def _addresses_set(self, wid):
-        return set(map(operator.itemgetter(0), self.addresses(wid)))
+    def _fetch_addresses(self, wid):
+        addresses = self._addresses(
+            self.raw_request("GET", "wallets/{:s}/addresses".format(wid), stream=True)
+        )
+        return addresses, self._address_cache.set(wid, addresses)
+
+    def addresses(self, wid):
+        return self._fetch_addresses(wid)[0]
+
+    def invalidate_addresses(self, wid=None):
+        """
+        Drops the cached address set of the given wallet, or of all wallets if ``wid`` is
+        ``None``. The set will be retrieved again when needed.
+
+        The cache is maintained automatically, as the set is extended with change addresses of
+        spends made through the backend and retrieved again whenever the history shows it may
+        have grown. Invalidation is necessary only when the wallet's address pool is changed by
+        other means.
+        """
+        self._address_cache.invalidate(wid)
+
+    def _cached_addresses(self, wid, refresh=False):
+        """
+        Returns a tuple of the wallet's :class:`WalletAddresses
+        <cardano.backends.walletrest.cache.WalletAddresses>` and a flag indicating whether they
+        have just been retrieved from the server.
+        """
+        addresses = None if refresh else self._address_cache.get(wid)
+        if addresses is not None:
+            return addresses, False
+        return self._fetch_addresses(wid)[1], True
+
+    def _update_spend_addresses(self, addresses, txd, destinations=()):
+        # All inputs of a transaction created by the wallet belong to it, as well as all outputs
+        # other than the requested payments, which carry the change.
+        dests = set(map(str, destinations))
+        addresses.add_used(
+            inp["address"] for inp in txd.get("inputs", []) if "address" in inp
+        )
+        addresses.add_used(
+            out["address"]
+            for out in txd.get("outputs", [])
+            if out["address"] not in dests
+        )
+        addresses.add_foreign(dests)
+
+    def _txaddresses(self, txd, addresses):
+        """
+        Returns the addresses of the raw transaction data relevant to the wallet's address set,
+        as accepted by :meth:`WalletAddresses.addresses_may_have_grown
+        <cardano.backends.walletrest.cache.WalletAddresses.addresses_may_have_grown>`.
+        """
+        outputs = [out["address"] for out in txd.get("outputs", [])]
+        return [addr for addr in outputs if addr in addresses], outputs
 
     def _txdata2tx(self, txd, addresses=None):
+        if self.lazy_transactions:
+            return self._txdata2lazytx(txd, addresses=addresses)
         inputs = (
-            [serializers.get_input(inp) for inp in txd["inputs"]]
+            [
+                serializers.get_input(inp, lovelace=self.lovelace_amounts)
+                for inp in txd["inputs"]
+            ]
             if "inputs" in txd
             else []
         )
         outputs = (
-            [serializers.get_output(outp) for outp in txd["outputs"]]
+            [
+                serializers.get_output(
+                    outp, txid=txd["id"], index=i, lovelace=self.lovelace_amounts
+                )
+                for i, outp in enumerate(txd["outputs"])
+            ]
             if "outputs" in txd
             else []
         )
         local_inputs = set()
         local_outputs = set()
-        amount = Decimal(0)
         if addresses:
             for out in outputs:
                 if out.address and out.address in addresses:
                     local_outputs.add(out)
-                    amount += out.amount
             for inp in inputs:
                 if inp.address and inp.address in addresses:
                     local_inputs.add(inp)
-        fee = serializers.get_amount(txd["fee"])
         metadata = (
             Metadata.deserialize(txd["metadata"])
             if txd.get("metadata", None) is not None
             else None
         )
+        return self._txdata2txobj(
+            txd,
+            inputs=inputs,
+            outputs=outputs,
+            local_inputs=local_inputs,
+            local_outputs=local_outputs,
+            metadata=metadata,
+        )
+
+    def _txdata2lazytx(self, txd, addresses=None):
+        # Only the positions of local inputs and outputs are found upfront, by comparing the raw
+        # address strings. The objects are built upon the first access.
+        local_inputs, local_outputs = (), ()
+        if addresses:
+            local_inputs = [
+                i
+                for i, inp in enumerate(txd.get("inputs", []))
+                if inp.get("address") and inp["address"] in addresses
+            ]
+            local_outputs = [
+                i
+                for i, out in enumerate(txd.get("outputs", []))
+                if out["address"] in addresses
+            ]
+        return self._txdata2txobj(
+            txd,
+            inputs=Deferred(
+                lambda tx: [
+                    serializers.get_input(inp, lovelace=self.lovelace_amounts)
+                    for inp in txd.get("inputs", [])
+                ]
+            ),
+            outputs=Deferred(
+                lambda tx: [
+                    serializers.get_output(
+                        outp, txid=txd["id"], index=i, lovelace=self.lovelace_amounts
+                    )
+                    for i, outp in enumerate(txd.get("outputs", []))
+                ]
+            ),
+            local_inputs=Deferred(lambda tx: set(tx.inputs[i] for i in local_inputs)),
+            local_outputs=Deferred(
+                lambda tx: set(tx.outputs[i] for i in local_outputs)
+            ),
+            metadata=Deferred(
+                lambda tx: Metadata.deserialize(txd["metadata"])
+                if txd.get("metadata", None) is not None
+                else Metadata()
+            ),
+        )
+
+    def _txdata2txobj(self, txd, **kwargs):
         return Transaction(
             txid=txd["id"],
-            amount=amount,
-            fee=fee,
+            fee=self._amount(txd["fee"]),
             inserted_at=serializers.get_block_position(txd["inserted_at"])
             if "inserted_at" in txd
             else None,
@@ -221,28 +464,209 @@ class WalletREST(object):
             pending_since=serializers.get_block_position(txd["pending_since"])
             if "pending_since" in txd
             else None,
-            inputs=inputs,
-            outputs=outputs,
-            local_inputs=local_inputs,
-            local_outputs=local_outputs,
             withdrawals=[
-                (serializers.get_amount(w["amount"]), w["stake_address"])
+                (self._amount(w["amount"]), w["stake_address"])
                 for w in txd.get("withdrawals", [])
             ],
             status=txd["status"],
-            metadata=metadata,
+            **kwargs
         )
 
-    def transactions(self, wid):
+    def _txdata2txns(self, wid, txdata):
+        addresses, fresh = self._cached_addresses(wid)
+        for txd in txdata:
+            if not fresh and addresses.addresses_may_have_grown(
+                *self._txaddresses(txd, addresses)
+            ):
+                addresses, fresh = self._cached_addresses(wid, refresh=True)
+            if fresh:
+                addresses.learn_addresses(*self._txaddresses(txd, addresses))
+            yield self._txdata2tx(txd, addresses=addresses)
+
+    def _epochstart(self, netparams, epoch):
+        """
+        Returns the start time of the epoch, calculated from the network parameters, or ``None``
+        if it cannot be determined. Only the eras since Shelley are considered, as they share
+        the same epoch length.
+        """
+        eras = sorted(
+            (era["epoch_number"], serializers.get_time(era["epoch_start_time"]))
+            for name, era in netparams.get("eras", {}).items()
+            if era is not None and name != "byron"
+        )
+        if not eras or epoch < eras[0][0]:
+            return None
+        number, starts = max(era for era in eras if era[0] <= epoch)
+        length = (
+            netparams["epoch_length"]["quantity"] * netparams["slot_length"]["quantity"]
+        )
+        try:
+            return starts + datetime.timedelta(seconds=int((epoch - number) * length))
+        except (OverflowError, ValueError):
+            return None
+
+    def _txtimerange(self, txfilter, netparams=None):
+        """
+        Translates the :class:`TxFilter <cardano.transaction.TxFilter>` into the time range
+        of transactions to be retrieved from the server. The range is never narrower than the
+        filter, hence the filter still has to be applied to the results.
+        """
+        starts, ends = [txfilter.min_time], [txfilter.max_time]
+        if netparams is not None:
+            if txfilter.min_epoch is not None:
+                starts.append(self._epochstart(netparams, txfilter.min_epoch))
+            if txfilter.max_epoch is not None:
+                ends.append(self._epochstart(netparams, txfilter.max_epoch + 1))
+        starts = [t for t in starts if t is not None]
+        ends = [t for t in ends if t is not None]
+        return max(starts, default=None), min(ends, default=None)
+
+    def _asks_epochs(self, txfilter):
+        return txfilter is not None and (
+            txfilter.min_epoch is not None or txfilter.max_epoch is not None
+        )
+
+    def _transactionsquery(self, wid, start, txfilter, netparams):
+        end = None
+        if txfilter is not None:
+            fstart, end = self._txtimerange(txfilter, netparams)
+            if fstart is not None and (start is None or fstart > start):
+                start = fstart
+        if start is None and end is None:
+            return "wallets/{:s}/transactions".format(wid)
+        if start is not None and end is not None and start > end:
+            return None
+        return self._transactionspath(wid, start=start, end=end)
+
+    def transactions(self, wid, start=None, txfilter=None):
+        """
+        Returns the list of the wallet's transactions.
+
+        :param start:       the earliest time of transactions to be retrieved
+        :param txfilter:    an optional :class:`TxFilter <cardano.transaction.TxFilter>`, its
+                            time and epoch bounds are passed to the server so that fewer
+                            transactions are transferred, the rest of it is not applied
+        """
+        netparams = self.network_parameters() if self._asks_epochs(txfilter) else None
+        path = self._transactionsquery(wid, start, txfilter, netparams)
+        if path is None:
+            return []
         data = {"order": "ascending"}
-        return [
-            self._txdata2tx(txd, addresses=self._addresses_set(wid))
-            for txd in self.raw_request(
-                "GET", "wallets/{:s}/transactions".format(wid), data
+        return list(
+            self._txdata2txns(wid, self.raw_request("GET", path, data, stream=True))
+        )
+
+    def _txlookupdata(self, wid, txid):
+        try:
+            return self.raw_request(
+                "GET", "wallets/{:s}/transactions/{:s}".format(wid, txid)
             )
-        ]
+        except exceptions.NotFound as e:
+            if e.result and e.result.get("code") == "no_such_wallet":
+                raise
+            return None
 
-    def transfer(self, wid, destinations, metadata, allow_withdrawal, ttl, passphrase):
+    def transactions_by_id(self, wid, txids):
+        """
+        Returns the list of the wallet's transactions of given IDs, retrieved one by one.
+        Multiple transactions are retrieved concurrently. IDs not found in the wallet are skipped.
+
+        :param txids:   a sequence of transaction IDs
+        """
+        txids = list(dict.fromkeys(txids))
+        if len(txids) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.lookup_workers, len(txids))
+            ) as pool:
+                txdata = list(
+                    pool.map(functools.partial(self._txlookupdata, wid), txids)
+                )
+        else:
+            txdata = [self._txlookupdata(wid, txid) for txid in txids]
+        return list(self._txdata2txns(wid, filter(None, txdata)))
+
+    def network_parameters(self):
+        """
+        Returns the raw network parameters as reported by the server. They never change while
+        the server is running, so they are retrieved only once.
+        """
+        if self._netparams is None:
+            self._netparams = self.raw_request("GET", "network/parameters")
+        return self._netparams
+
+    def _txwindows(self, start, end, window):
+        """
+        Splits the time range into consecutive ``(start, end)`` windows. If the range is
+        open-ended, the last window has ``None`` as the end so that it includes all transactions
+        from the mempool too.
+        """
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=datetime.timezone.utc)
+        if end is not None and end.tzinfo is None:
+            end = end.replace(tzinfo=datetime.timezone.utc)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        while True:
+            wend = start + window
+            if end is not None and wend >= end:
+                yield start, end
+                return
+            if end is None and wend > now:
+                yield start, None
+                return
+            yield start, wend
+            start = wend
+
+    def _transactionspath(self, wid, start=None, end=None):
+        urldata = {"order": "ascending"}
+        if start is not None:
+            urldata["start"] = serializers.store_time(start)
+        if end is not None:
+            urldata["end"] = serializers.store_time(end)
+        return "?".join(
+            (
+                "wallets/{:s}/transactions".format(wid),
+                urllib.parse.urlencode(urldata),
+            )
+        )
+
+    def iter_transactions(self, wid, start=None, end=None, window=None):
+        """
+        Yields transactions of the wallet in ascending order, retrieving the history in
+        consecutive time windows, so that the memory usage doesn't depend on its length.
+
+        :param start:   the earliest time of transactions, defaults to the blockchain start
+        :param end:     the latest time of transactions, defaults to none, which also includes
+                        the transactions still in the mempool
+        :param window:  the length of the windows as :class:`datetime.timedelta`
+        """
+        window = self._txwindow(window)
+        if start is None:
+            start = serializers.get_time(
+                self.network_parameters()["blockchain_start_time"]
+            )
+        seen = set()
+        for wstart, wend in self._txwindows(start, end, window):
+            txdata = self.raw_request(
+                "GET", self._transactionspath(wid, wstart, wend), stream=True
+            )
+            # the bounds are inclusive, so the transactions at the border of two windows
+            # would be listed twice
+            prev, seen = seen, set()
+            # Each window is checked against the address set separately, as the set may only
+            # be trusted for the data retrieved before it.
+            for tx in self._txdata2txns(
+                wid, (txd for txd in txdata if txd["id"] not in prev)
+            ):
+                seen.add(tx.txid)
+                yield tx
+
+    def _txwindow(self, window):
+        window = self.tx_window if window is None else window
+        if window <= datetime.timedelta(0):
+            raise ValueError("The window must be positive, got {}".format(window))
+        return window
+
+    def _transferdata(self, destinations, metadata, allow_withdrawal, ttl, passphrase):
         data = {
             "passphrase": passphrase,
             "withdrawal": "self" if allow_withdrawal else None,
@@ -250,14 +674,7 @@ class WalletREST(object):
                 {
                     "address": str(address),
                     "amount": serializers.store_amount(amount),
-                    "assets": [
-                        {
-                            "policy_id": asset.policy_id,
-                            "asset_name": asset.asset_name,
-                            "quantity": asset_amount,
-                        }
-                        for (asset, asset_amount) in assets
-                    ],
+                    "assets": serializers.store_multiasset(assets),
                 }
                 for (address, amount, assets) in destinations
             ],
@@ -268,11 +685,22 @@ class WalletREST(object):
             data["metadata"] = metadata.serialize()
         if ttl is not None:
             data["time_to_live"] = serializers.store_interval(ttl)
+        return data
+
+    def transfer(self, wid, destinations, metadata, allow_withdrawal, ttl, passphrase):
+        data = self._transferdata(
+            destinations, metadata, allow_withdrawal, ttl, passphrase
+        )
         # NOTE: the order of the following two requests is important
         txd = self.raw_request("POST", "wallets/{:s}/transactions".format(wid), data)
-        return self._txdata2tx(txd, addresses=self._addresses_set(wid))
+        self.invalidate_wallet(wid)
+        addresses, fresh = self._cached_addresses(wid)
+        self._update_spend_addresses(
+            addresses, txd, map(operator.itemgetter(0), destinations)
+        )
+        return self._txdata2tx(txd, addresses=addresses)
 
-    def estimate_fee(self, wid, destinations, metadata):
+    def _feedata(self, destinations, metadata):
         data = {
             "payments": [
                 {
@@ -286,13 +714,21 @@ class WalletREST(object):
             if not isinstance(metadata, Metadata):
                 metadata = Metadata(metadata.items())
             data["metadata"] = metadata.serialize()
-        feedata = self.raw_request(
-            "POST", "wallets/{:s}/payment-fees".format(wid), data
-        )
+        return data
+
+    def _feeestimate(self, feedata):
         return (
-            serializers.get_amount(feedata["estimated_min"]),
-            serializers.get_amount(feedata["estimated_max"]),
+            self._amount(feedata["estimated_min"]),
+            self._amount(feedata["estimated_max"]),
+        )
+
+    def estimate_fee(self, wid, destinations, metadata):
+        feedata = self.raw_request(
+            "POST",
+            "wallets/{:s}/payment-fees".format(wid),
+            self._feedata(destinations, metadata),
         )
+        return self._feeestimate(feedata)
 
     def _stakepoolinfo(self, pooldata, stake):
         retirement = (
@@ -315,7 +751,7 @@ class WalletREST(object):
         else:
             ticker = name = description = homepage = None
         rewards = StakeRewardMetrics(
-            serializers.get_amount(pooldata["metrics"]["non_myopic_member_rewards"]),
+            self._amount(pooldata["metrics"]["non_myopic_member_rewards"]),
             stake,
         )
         return StakePoolInfo(
@@ -326,20 +762,21 @@ class WalletREST(object):
             description,
             homepage,
             rewards,
-            serializers.get_amount(pooldata["cost"]),
+            self._amount(pooldata["cost"]),
             serializers.get_percent(pooldata["margin"]),
-            serializers.get_amount(pooldata["pledge"]),
+            self._amount(pooldata["pledge"]),
             serializers.get_percent(pooldata["metrics"]["relative_stake"]),
             pooldata["metrics"]["saturation"],
             pooldata["metrics"]["produced_blocks"]["quantity"],
             retirement,
         )
 
-    def stake_pools(self, wid, stake):
+    def _stakepoolspath(self, stake):
         urldata = {"stake": to_lovelaces(stake)}
-        poolsdata = self.raw_request(
-            "GET", "?".join(("stake-pools", urllib.parse.urlencode(urldata)))
-        )
+        return "?".join(("stake-pools", urllib.parse.urlencode(urldata)))
+
+    def stake_pools(self, wid, stake):
+        poolsdata = self.raw_request("GET", self._stakepoolspath(stake), stream=True)
         return [self._stakepoolinfo(pool, stake) for pool in poolsdata]
 
     def _stakingstatus(self, data):
@@ -349,21 +786,27 @@ class WalletREST(object):
             serializers.get_epoch(data["changes_at"]) if "changes_at" in data else None,
         )
 
-    def staking_status(self, wid):
-        sdata = self.raw_request("GET", "wallets/{:s}".format(wid))["delegation"]
+    def _delegation(self, wdata):
+        sdata = wdata["delegation"]
         active = sdata["active"]
         return (
             self._stakingstatus(active),
             [self._stakingstatus(ss) for ss in sdata["next"]],
         )
 
+    def staking_status(self, wid):
+        return self._delegation(self._wallet_data(wid))
+
     def stake(self, wid, pool_id, passphrase):
         txdata = self.raw_request(
             "PUT",
             "stake-pools/{:s}/wallets/{:s}".format(pool_id, wid),
             {"passphrase": passphrase},
         )
-        return self._txdata2tx(txdata, addresses=self._addresses_set(wid))
+        self.invalidate_wallet(wid)
+        addresses, fresh = self._cached_addresses(wid)
+        self._update_spend_addresses(addresses, txdata)
+        return self._txdata2tx(txdata, addresses=addresses)
 
     def unstake(self, wid, passphrase):
         txdata = self.raw_request(
@@ -371,21 +814,48 @@ class WalletREST(object):
             "stake-pools/*/wallets/{:s}".format(wid),
             {"passphrase": passphrase},
         )
-        return self._txdata2tx(txdata, addresses=self._addresses_set(wid))
+        self.invalidate_wallet(wid)
+        addresses, fresh = self._cached_addresses(wid)
+        self._update_spend_addresses(addresses, txdata)
+        return self._txdata2tx(txdata, addresses=addresses)
 
-    def utxo_stats(self, wid):
-        sdata = self.raw_request(
-            "GET",
-            "wallets/{:s}/statistics/utxos".format(wid),
-            {},
-        )
+    def _utxostats(self, sdata):
         return (
-            serializers.get_amount(sdata["total"]),
+            self._amount(sdata["total"]),
             {
-                from_lovelaces(int(lvl)): num
+                self._lovelaces(int(lvl)): num
                 for (lvl, num) in sorted(
                     sdata["distribution"].items(), key=operator.itemgetter(0)
                 )
             },
             sdata["scale"],
         )
+
+    def _walletinfo(self, wdata):
+        try:
+            assets = self._assetbalances(wdata)
+        except exceptions.NotSupported:
+            assets = None
+        status, nexts = self._delegation(wdata)
+        return WalletInfo(
+            wdata["id"],
+            wdata["name"],
+            self._balance(wdata),
+            assets,
+            status,
+            nexts,
+            self._syncprogress(wdata),
+            serializers.get_block_position(wdata["tip"]) if "tip" in wdata else None,
+            wdata.get("address_pool_gap"),
+        )
+
+    def wallet_info(self, wid):
+        return self._walletinfo(self._wallet_data(wid))
+
+    def utxo_stats(self, wid):
+        sdata = self.raw_request(
+            "GET",
+            "wallets/{:s}/statistics/utxos".format(wid),
+            {},
+        )
+        return self._utxostats(sdata)
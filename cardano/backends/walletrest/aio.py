@@ -0,0 +1,281 @@
+import asyncio
+from decimal import Decimal
+import json
+import logging
+import operator
+
+import aiohttp
+
+from . import exceptions
+from . import serializers
+from . import WalletREST, JSONWithDecimalEncoder
+from .singleflight import AsyncSingleFlight
+
+_log = logging.getLogger(__name__)
+
+
+class AsyncWalletREST(WalletREST):
+    """
+    The :mod:`asyncio` flavor of the :class:`WalletREST <cardano.backends.walletrest.WalletREST>`
+    backend. It offers the same methods but all of them that talk to the server are coroutines.
+    Requests and responses are (de)serialized by exactly the same code as in the blocking backend,
+    so both produce identical objects.
+
+    Requires the optional `aiohttp <https://docs.aiohttp.org/>`_ package.
+
+    :param session:     an optional :class:`aiohttp.ClientSession` to be used for requests. If not
+                        given, one will be created upon the first request. Use your own session
+                        to tune connection limits, keep-alive etc.
+    """
+
+    def _create_session(self):
+        # aiohttp sessions have to be created within a running event loop
+        return None
+
+    def _create_inflight(self):
+        return AsyncSingleFlight()
+
+    def _get_session(self):
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self.session
+
+    async def close(self):
+        """
+        Closes the underlying HTTP session.
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def raw_request(self, method, path, params=None):
+        key = self._request_key(method, path, params)
+        if key is None:
+            return await self._raw_request(method, path, params)
+        return await self._inflight.do(
+            key, lambda: self._raw_request(method, path, params)
+        )
+
+    async def _raw_request(self, method, path, params=None):
+        url = "".join([self.base_url, path])
+        params = params or {}
+        _log.debug(
+            "{method} {url}\nParams:\n{params}".format(
+                method=method,
+                url=url,
+                params=json.dumps(params, indent=2, sort_keys=True),
+            )
+        )
+        async with self._get_session().request(
+            method.upper(), url, data=json.dumps(params)
+        ) as rsp:
+            status_code = rsp.status
+            body = await rsp.text() if status_code != 204 else None
+        if body is not None:  # if content exists
+            result = json.loads(body, parse_float=Decimal)
+            if _log.isEnabledFor(logging.DEBUG):
+                _ppresult = json.dumps(
+                    result, cls=JSONWithDecimalEncoder, indent=2, sort_keys=True
+                )
+                _log.debug("Result:\n{result}".format(result=_ppresult))
+        else:
+            result = None
+            _log.debug("No result (HTTP 204)")
+        return self._check_result(status_code, result)
+
+    async def wallet_ids(self):
+        return map(operator.itemgetter("id"), await self.raw_request("GET", "wallets"))
+
+    async def _wallet_data(self, wid):
+        wdata = self._wallet_cache.get(wid)
+        if wdata is None:
+            generation = self._wallet_cache.generation(wid)
+            wdata = self._wallet_cache.set(
+                wid,
+                await self.raw_request("GET", "wallets/{:s}".format(wid)),
+                generation,
+            )
+        return wdata
+
+    async def wallet_exists(self, wid):
+        try:
+            await self._wallet_data(wid)
+        except exceptions.NotFound:
+            return False
+        return True
+
+    async def create_wallet(self, name, mnemonic, passphrase, mnemonic_2f=None):
+        wdata = await self.raw_request(
+            "POST",
+            "wallets",
+            self._createwalletdata(name, mnemonic, passphrase, mnemonic_2f),
+        )
+        return wdata["id"]
+
+    async def delete_wallet(self, wid):
+        self.invalidate_addresses(wid)
+        self.invalidate_wallet(wid)
+        try:
+            await self.raw_request("DELETE", "wallets/{:s}".format(wid))
+        except exceptions.NotFound:
+            return False
+        return True
+
+    async def sync_progress(self, wid):
+        return self._syncprogress(await self._wallet_data(wid))
+
+    async def balance(self, wid):
+        return self._balance(await self._wallet_data(wid))
+
+    async def asset_balances(self, wid):
+        return self._assetbalances(await self._wallet_data(wid))
+
+    async def _fetch_addresses(self, wid):
+        addresses = self._addresses(
+            await self.raw_request("GET", "wallets/{:s}/addresses".format(wid))
+        )
+        return addresses, self._address_cache.set(wid, addresses)
+
+    async def addresses(self, wid):
+        return (await self._fetch_addresses(wid))[0]
+
+    async def _cached_addresses(self, wid, refresh=False):
+        addresses = None if refresh else self._address_cache.get(wid)
+        if addresses is not None:
+            return addresses, False
+        return (await self._fetch_addresses(wid))[1], True
+
+    async def _txdata2txns(self, wid, txdata):
+        addresses, fresh = await self._cached_addresses(wid)
+        for txd in txdata:
+            if not fresh and addresses.addresses_may_have_grown(
+                *self._txaddresses(txd, addresses)
+            ):
+                addresses, fresh = await self._cached_addresses(wid, refresh=True)
+            if fresh:
+                addresses.learn_addresses(*self._txaddresses(txd, addresses))
+            yield self._txdata2tx(txd, addresses=addresses)
+
+    async def transactions(self, wid, start=None, txfilter=None):
+        netparams = (
+            await self.network_parameters() if self._asks_epochs(txfilter) else None
+        )
+        path = self._transactionsquery(wid, start, txfilter, netparams)
+        if path is None:
+            return []
+        data = {"order": "ascending"}
+        txdata = await self.raw_request("GET", path, data)
+        return [tx async for tx in self._txdata2txns(wid, txdata)]
+
+    async def _txlookupdata(self, wid, txid):
+        try:
+            return await self.raw_request(
+                "GET", "wallets/{:s}/transactions/{:s}".format(wid, txid)
+            )
+        except exceptions.NotFound as e:
+            if e.result and e.result.get("code") == "no_such_wallet":
+                raise
+            return None
+
+    async def transactions_by_id(self, wid, txids):
+        txdata = await asyncio.gather(
+            *(self._txlookupdata(wid, txid) for txid in dict.fromkeys(txids))
+        )
+        return [tx async for tx in self._txdata2txns(wid, filter(None, txdata))]
+
+    async def network_parameters(self):
+        if self._netparams is None:
+            self._netparams = await self.raw_request("GET", "network/parameters")
+        return self._netparams
+
+    async def iter_transactions(self, wid, start=None, end=None, window=None):
+        window = self._txwindow(window)
+        if start is None:
+            start = serializers.get_time(
+                (await self.network_parameters())["blockchain_start_time"]
+            )
+        seen = set()
+        for wstart, wend in self._txwindows(start, end, window):
+            txdata = await self.raw_request(
+                "GET", self._transactionspath(wid, wstart, wend)
+            )
+            txdata = [txd for txd in txdata if txd["id"] not in seen]
+            seen = set(txd["id"] for txd in txdata)
+            # Each window is checked against the address set separately, as the set may only
+            # be trusted for the data retrieved before it.
+            async for tx in self._txdata2txns(wid, txdata):
+                yield tx
+
+    async def transfer(
+        self, wid, destinations, metadata, allow_withdrawal, ttl, passphrase
+    ):
+        data = self._transferdata(
+            destinations, metadata, allow_withdrawal, ttl, passphrase
+        )
+        # NOTE: the order of the following two requests is important
+        txd = await self.raw_request(
+            "POST", "wallets/{:s}/transactions".format(wid), data
+        )
+        self.invalidate_wallet(wid)
+        addresses, fresh = await self._cached_addresses(wid)
+        self._update_spend_addresses(
+            addresses, txd, map(operator.itemgetter(0), destinations)
+        )
+        return self._txdata2tx(txd, addresses=addresses)
+
+    async def estimate_fee(self, wid, destinations, metadata):
+        feedata = await self.raw_request(
+            "POST",
+            "wallets/{:s}/payment-fees".format(wid),
+            self._feedata(destinations, metadata),
+        )
+        return self._feeestimate(feedata)
+
+    async def stake_pools(self, wid, stake):
+        poolsdata = await self.raw_request("GET", self._stakepoolspath(stake))
+        return [self._stakepoolinfo(pool, stake) for pool in poolsdata]
+
+    async def staking_status(self, wid):
+        return self._delegation(await self._wallet_data(wid))
+
+    async def stake(self, wid, pool_id, passphrase):
+        txdata = await self.raw_request(
+            "PUT",
+            "stake-pools/{:s}/wallets/{:s}".format(pool_id, wid),
+            {"passphrase": passphrase},
+        )
+        self.invalidate_wallet(wid)
+        addresses, fresh = await self._cached_addresses(wid)
+        self._update_spend_addresses(addresses, txdata)
+        return self._txdata2tx(txdata, addresses=addresses)
+
+    async def unstake(self, wid, passphrase):
+        txdata = await self.raw_request(
+            "DELETE",
+            "stake-pools/*/wallets/{:s}".format(wid),
+            {"passphrase": passphrase},
+        )
+        self.invalidate_wallet(wid)
+        addresses, fresh = await self._cached_addresses(wid)
+        self._update_spend_addresses(addresses, txdata)
+        return self._txdata2tx(txdata, addresses=addresses)
+
+    async def wallet_info(self, wid):
+        return self._walletinfo(await self._wallet_data(wid))
+
+    async def utxo_stats(self, wid):
+        sdata = await self.raw_request(
+            "GET",
+            "wallets/{:s}/statistics/utxos".format(wid),
+            {},
+        )
+        return self._utxostats(sdata)
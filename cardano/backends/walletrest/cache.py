@@ -0,0 +1,180 @@
+import threading
+import time
+
+
+class WalletAddresses(object):
+    """
+    The set of addresses belonging to a single wallet, as known to the backend.
+
+    Besides the addresses themselves it tracks which of them were unused at the time of
+    retrieval, and which addresses seen in the history were confirmed not to belong to the wallet.
+    This allows to tell whether the set may have grown since it was retrieved.
+
+    The foreign addresses are forgotten once there are more than :attr:`max_foreign` of them,
+    which at worst causes an extra retrieval of the set.
+
+    :param addresses:   a sequence of ``(address, used)`` pairs
+    """
+
+    #: The maximal number of foreign addresses remembered
+    max_foreign = 100000
+
+    def __init__(self, addresses):
+        self.all = set()
+        self.unused = set()
+        self.foreign = set()
+        for addr, used in addresses:
+            self.all.add(addr)
+            if not used:
+                self.unused.add(addr)
+
+    def __contains__(self, addr):
+        return addr in self.all
+
+    def __len__(self):
+        return len(self.all)
+
+    def add_used(self, addresses):
+        """
+        Adds addresses known to belong to the wallet and to be already used.
+        """
+        for addr in addresses:
+            addr = str(addr)
+            self.all.add(addr)
+            self.unused.discard(addr)
+            self.foreign.discard(addr)
+
+    def add_foreign(self, addresses):
+        """
+        Records addresses known not to belong to the wallet.
+        """
+        self.foreign.update(str(addr) for addr in addresses if addr not in self.all)
+        if len(self.foreign) > self.max_foreign:
+            self.foreign.clear()
+
+    def addresses_may_have_grown(self, received, outputs):
+        """
+        Checks whether the wallet's address set may have grown because of a transaction, given
+        the addresses of its local outputs and those of all its outputs. That happens when:
+
+            * a previously unused address receives funds, hence the address pool gets extended,
+            * the transaction has outputs to addresses neither known to the wallet nor
+              confirmed to be foreign, which may be new receiving or change addresses.
+        """
+        for addr in received:
+            if addr in self.unused:
+                return True
+        for addr in outputs:
+            if addr and addr not in self.all and addr not in self.foreign:
+                return True
+        return False
+
+    def learn_addresses(self, received, outputs):
+        """
+        Updates the state with the addresses of a transaction, like
+        :meth:`addresses_may_have_grown`, after checking them against an up-to-date address
+        set. The output addresses still unknown are recorded as foreign.
+        """
+        for addr in received:
+            self.unused.discard(addr)
+        self.add_foreign(filter(None, outputs))
+
+
+class AddressCache(object):
+    """
+    A thread-safe per-wallet cache of :class:`WalletAddresses`.
+    """
+
+    def __init__(self):
+        self._wallets = {}
+        self._lock = threading.Lock()
+
+    def get(self, wid):
+        """
+        Returns :class:`WalletAddresses` of the wallet or ``None`` if not cached.
+        """
+        return self._wallets.get(wid)
+
+    def set(self, wid, addresses):
+        """
+        Stores the sequence of ``(address, used)`` pairs as the wallet's address set.
+
+        :rtype: :class:`WalletAddresses`
+        """
+        entry = WalletAddresses(addresses)
+        with self._lock:
+            self._wallets[wid] = entry
+        return entry
+
+    def invalidate(self, wid=None):
+        """
+        Drops the cached set of given wallet, or of all wallets if ``wid`` is ``None``.
+        """
+        with self._lock:
+            if wid is None:
+                self._wallets.clear()
+            else:
+                self._wallets.pop(wid, None)
+
+
+class WalletSnapshotCache(object):
+    """
+    A thread-safe per-wallet cache of the wallet documents returned by the server, each of which
+    is considered valid for ``max_age`` seconds. Zero age disables caching.
+
+    :param max_age:     the maximal age of a snapshot, in seconds
+    """
+
+    def __init__(self, max_age=0):
+        self.max_age = max_age
+        self._wallets = {}
+        self._generations = {}
+        self._cleared = 0
+        self._lock = threading.Lock()
+
+    def get(self, wid):
+        """
+        Returns the wallet document or ``None`` if missing or expired.
+        """
+        try:
+            stored, wdata = self._wallets[wid]
+        except KeyError:
+            return None
+        if time.monotonic() - stored > self.max_age:
+            return None
+        return wdata
+
+    def generation(self, wid):
+        """
+        Returns the current generation of the wallet's snapshot, which changes upon each
+        invalidation. It should be taken before requesting the document and passed to
+        :meth:`set`.
+        """
+        with self._lock:
+            return (self._cleared, self._generations.get(wid, 0))
+
+    def set(self, wid, wdata, generation=None):
+        """
+        Stores the wallet document, unless the snapshot has been invalidated since the
+        ``generation`` was taken, as the document may then predate the change.
+        """
+        if self.max_age > 0:
+            with self._lock:
+                if generation is None or generation == (
+                    self._cleared,
+                    self._generations.get(wid, 0),
+                ):
+                    self._wallets[wid] = (time.monotonic(), wdata)
+        return wdata
+
+    def invalidate(self, wid=None):
+        """
+        Drops the snapshot of given wallet, or of all wallets if ``wid`` is ``None``.
+        """
+        with self._lock:
+            if wid is None:
+                self._wallets.clear()
+                self._cleared += 1
+            else:
+                self._wallets.pop(wid, None)
+                self._generations[wid] = self._generations.get(wid, 0) + 1
@@ -0,0 +1,111 @@
+import codecs
+from decimal import Decimal
+import json
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_START = "-0123456789"
+# characters which may follow an element of the array
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+class ArrayParser(object):
+    """
+    An incremental parser of a top-level JSON array. Chunks of the encoded document are fed
+    as they arrive and the complete elements are returned as soon as they are decoded, so that
+    neither the whole document nor the whole decoded list has to be kept in memory.
+
+    :param parse_float:     the constructor of floating point numbers, :class:`Decimal` by
+                            default
+    """
+
+    def __init__(self, parse_float=Decimal):
+        self._decoder = json.JSONDecoder(parse_float=parse_float)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._started = False
+        self._finished = False
+        self._expect_value = True
+        self._empty = True
+
+    def _skip_whitespace(self):
+        buf, pos = self._buf, self._pos
+        while pos < len(buf) and buf[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+
+    def _parse(self, final=False):
+        items = []
+        while not self._finished:
+            self._skip_whitespace()
+            if self._pos >= len(self._buf):
+                break
+            char = self._buf[self._pos]
+            if not self._started:
+                if char != "[":
+                    raise ValueError("Expected JSON array, got {!r}".format(char))
+                self._started = True
+                self._pos += 1
+                continue
+            if char == "]" and (not self._expect_value or self._empty):
+                self._finished = True
+                self._pos += 1
+                break
+            if not self._expect_value:
+                if char != ",":
+                    raise ValueError("Expected ',' or ']', got {!r}".format(char))
+                self._expect_value = True
+                self._pos += 1
+                continue
+            try:
+                item, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break
+            if not final and (
+                end >= len(self._buf)
+                or char in _NUMBER_START
+                and self._buf[end] not in _DELIMITERS
+            ):
+                # a number at the end of the buffer may be incomplete, e.g. "1.5e" decodes
+                # as 1.5 but may continue with the exponent in the next chunk
+                break
+            items.append(item)
+            self._empty = False
+            self._expect_value = False
+            self._pos = end
+        return items
+
+    def feed(self, data):
+        """
+        Feeds a chunk of bytes and returns the list of elements completed by it.
+        """
+        self._buf = self._buf[self._pos :] + self._utf8.decode(data)
+        self._pos = 0
+        return self._parse()
+
+    def close(self):
+        """
+        Signals the end of the document and returns the remaining elements.
+        Raises :class:`ValueError` if the document is incomplete.
+        """
+        self._buf = self._buf[self._pos :] + self._utf8.decode(b"", final=True)
+        self._pos = 0
+        items = self._parse(final=True)
+        self._skip_whitespace()
+        if not self._finished:
+            raise ValueError("Incomplete JSON array")
+        if self._pos < len(self._buf):
+            raise ValueError("Extra data after JSON array")
+        return items
+
+
+def iter_array(chunks, parse_float=Decimal):
+    """
+    Yields elements of a JSON array encoded in the iterable of byte chunks.
+    """
+    parser = ArrayParser(parse_float=parse_float)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
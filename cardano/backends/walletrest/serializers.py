@@ -1,13 +1,16 @@
+import datetime
 from dateutil.parser import isoparse
 from decimal import Decimal
-from ...address import Address
-from ...numbers import from_lovelaces, to_lovelaces
-from ...simpletypes import AssetID, BlockPosition, Epoch
+from ...address import address
+from ...numbers import Lovelace, from_lovelaces, to_lovelaces
+from ...simpletypes import AssetID, BlockPosition, Epoch, MultiAsset
 from ...transaction import Input, Output
 
 
-def get_amount(data):
+def get_amount(data, lovelace=False):
     assert data["unit"] == "lovelace"
+    if lovelace:
+        return Lovelace(data["quantity"])
     return from_lovelaces(data["quantity"])
 
 
@@ -31,6 +34,7 @@ def get_block_position(data):
         data["slot_number"],
         data["absolute_slot_number"],
         get_height(data["height"]) if "height" in data else None,
+        get_time(data["time"]) if "time" in data else None,
     )
 
 
@@ -54,26 +58,50 @@ def get_asset_with_quantity(data):
     return get_asset_id(data), data["quantity"]
 
 
-def get_input(data):
+def get_multiasset(data):
+    return MultiAsset(get_asset_with_quantity(a) for a in data)
+
+
+def store_multiasset(assets):
+    return [
+        {
+            "policy_id": aid.policy_id,
+            "asset_name": aid.asset_name,
+            "quantity": qty,
+        }
+        for aid, qty in MultiAsset(assets)
+    ]
+
+
+def get_input(data, lovelace=False):
     return Input(
         iid=data["id"],
-        address=Address(data["address"]) if "address" in data else None,
-        amount=get_amount(data["amount"]) if "amount" in data else None,
-        assets=[get_asset_with_quantity(a) for a in data["assets"]]
-        if "assets" in data
-        else [],
+        address=address(data["address"], trusted=True) if "address" in data else None,
+        amount=get_amount(data["amount"], lovelace) if "amount" in data else None,
+        assets=get_multiasset(data["assets"]) if "assets" in data else None,
+        index=data.get("index"),
     )
 
 
-def get_output(data):
+def get_output(data, txid=None, index=None, lovelace=False):
     return Output(
-        address=Address(data["address"]),
-        amount=get_amount(data["amount"]),
-        assets=[get_asset_with_quantity(a) for a in data["assets"]]
-        if "assets" in data
-        else None,
+        address=address(data["address"], trusted=True),
+        amount=get_amount(data["amount"], lovelace),
+        assets=get_multiasset(data["assets"]) if "assets" in data else None,
+        txid=txid,
+        index=index,
     )
 
 
 def store_interval(seconds):
     return {"quantity": int(seconds), "unit": "second"}
+
+
+def get_time(val):
+    return isoparse(val)
+
+
+def store_time(dt):
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=datetime.timezone.utc)
+    return dt.astimezone(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
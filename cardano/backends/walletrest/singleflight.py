@@ -0,0 +1,75 @@
+import asyncio
+import threading
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    Coalesces concurrent calls identified by the same key, so that only the first one is actually
+    executed while the others wait for it to finish and share its result or exception.
+    Calls made after the first one has finished are executed again.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        """
+        Returns the result of ``fn()``, possibly shared with other threads calling with the
+        same ``key`` at the same time.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight(object):
+    """
+    The :mod:`asyncio` flavor of :class:`SingleFlight`, coalescing concurrent coroutines.
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key, fn):
+        """
+        Returns the result of ``await fn()``, possibly shared with other tasks calling with the
+        same ``key`` at the same time.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            # The call runs as a task of its own, so that cancelling any of the callers,
+            # including the first one, affects neither the call nor the other callers.
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda t: self._done(key, t))
+        return await asyncio.shield(task)
+
+    def _done(self, key, task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # mark as retrieved, all the callers may have been cancelled
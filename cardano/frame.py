@@ -0,0 +1,218 @@
+import collections
+import datetime
+
+import numpy as np
+
+from .numbers import to_lovelaces
+from .transaction import TxFilter
+
+__all__ = ("TransactionFrame",)
+
+#: The value of integer columns of transactions not in the ledger or with the data missing
+MISSING = -1
+
+
+class TransactionFrame(object):
+    """
+    Represents a list of :class:`Transaction <cardano.transaction.Transaction>` objects as
+    a set of NumPy arrays of equal length, one per attribute. Amounts are stored as ``int64``
+    numbers of Lovelaces, chain positions as ``int64`` with :data:`MISSING` for the
+    transactions not in the ledger, and times as ``datetime64`` in UTC.
+
+    The available columns are: ``txid``, ``status``, ``confirmed``, ``epoch``, ``slot``,
+    ``absolute_slot``, ``height``, ``time``, ``fee``, ``local_inputs_sum``,
+    ``local_outputs_sum``, ``amount_in`` and ``amount_out``.
+
+    Columns are accessed by indexing the frame with their names. Indexing with a boolean
+    mask or an array of positions returns a new frame.
+
+    :param columns:         a mapping of column names to arrays
+    :param transactions:    the sequence of the original transactions, used for address
+                            filtering
+
+    Requires the optional `NumPy <https://numpy.org/>`_ package.
+    """
+
+    INT_COLUMNS = (
+        "epoch",
+        "slot",
+        "absolute_slot",
+        "height",
+        "fee",
+        "local_inputs_sum",
+        "local_outputs_sum",
+        "amount_in",
+        "amount_out",
+    )
+
+    def __init__(self, columns, transactions):
+        self.columns = columns
+        self.transactions = transactions
+        self._address_rows = {}
+
+    @classmethod
+    def from_transactions(cls, txns):
+        """
+        Builds the frame from an iterable of :class:`Transaction
+        <cardano.transaction.Transaction>` objects, e.g. the result of ``wallet.transactions()``.
+        """
+        txns = list(txns)
+        n = len(txns)
+        cols = {name: np.full(n, MISSING, dtype=np.int64) for name in cls.INT_COLUMNS}
+        cols["time"] = np.full(n, np.datetime64("NaT"), dtype="datetime64[us]")
+        cols["confirmed"] = np.zeros(n, dtype=bool)
+        has_fee = np.zeros(n, dtype=bool)
+        txids, statuses = [], []
+        for i, tx in enumerate(txns):
+            txids.append(tx.txid)
+            statuses.append(tx.status or "")
+            ht = tx.inserted_at
+            if ht is not None:
+                cols["confirmed"][i] = True
+                for name in ("epoch", "slot", "absolute_slot", "height"):
+                    val = getattr(ht, name)
+                    if val is not None:
+                        cols[name][i] = val
+                if ht.time is not None:
+                    cols["time"][i] = _datetime64(ht.time)
+            if tx.fee is not None:
+                cols["fee"][i] = to_lovelaces(tx.fee)
+                has_fee[i] = True
+            else:
+                cols["fee"][i] = 0
+            cols["local_inputs_sum"][i] = to_lovelaces(tx.local_inputs_sum)
+            cols["local_outputs_sum"][i] = to_lovelaces(tx.local_outputs_sum)
+        cols["txid"] = np.array(txids, dtype="U64")
+        cols["status"] = np.array(statuses, dtype="U16")
+        balance = cols["local_outputs_sum"] - cols["local_inputs_sum"]
+        cols["amount_in"] = np.maximum(0, balance)
+        cols["amount_out"] = np.where(has_fee, np.maximum(0, -balance - cols["fee"]), 0)
+        return cls(cols, txns)
+
+    def __len__(self):
+        return len(self.transactions)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.columns[key]
+        key = np.asarray(key)
+        if key.dtype == bool:
+            key = np.flatnonzero(key)
+        else:
+            key = key.astype(np.intp)
+        return self.__class__(
+            {name: col[key] for name, col in self.columns.items()},
+            [self.transactions[i] for i in key],
+        )
+
+    def __iter__(self):
+        return iter(self.transactions)
+
+    def _rows_by_address(self, kind):
+        if kind not in self._address_rows:
+            rows = collections.defaultdict(list)
+            for i, tx in enumerate(self.transactions):
+                for io in getattr(tx, kind):
+                    if io.address is not None:
+                        rows[io.address].append(i)
+            self._address_rows[kind] = rows
+        return self._address_rows[kind]
+
+    def _address_mask(self, kind, addrs):
+        mask = np.zeros(len(self), dtype=bool)
+        rows = self._rows_by_address(kind)
+        for addr in addrs:
+            mask[rows.get(addr, [])] = True
+        return mask
+
+    def mask(self, txfilter=None, **filterparams):
+        """
+        Returns the boolean array telling which transactions match the filter. The filter is
+        either a :class:`TxFilter <cardano.transaction.TxFilter>` instance or the keyword
+        arguments accepted by it, but not both.
+        """
+        if txfilter is not None and filterparams:
+            raise TypeError("Pass either a TxFilter or the filter arguments, not both")
+        f = txfilter or TxFilter(**filterparams)
+        confirmed = self.columns["confirmed"]
+        mask = confirmed.copy() if f.confirmed else np.zeros(len(self), dtype=bool)
+        if f.unconfirmed and not f._asks_chain_position:
+            mask |= ~confirmed
+        for name in ("epoch", "slot", "absolute_slot", "height"):
+            low, high = getattr(f, "min_" + name), getattr(f, "max_" + name)
+            col = self.columns[name]
+            if low is not None:
+                mask &= (col != MISSING) & (col >= _bound(low))
+            if high is not None:
+                mask &= (col != MISSING) & (col <= _bound(high))
+        if f.min_time is not None:
+            mask &= self.columns["time"] >= _datetime64(f.min_time)
+        if f.max_time is not None:
+            mask &= self.columns["time"] <= _datetime64(f.max_time)
+        if f.txids:
+            mask &= np.isin(self.columns["txid"], list(f.txids))
+        if f.src_addrs:
+            mask &= self._address_mask("inputs", f.src_addrs)
+        if f.dest_addrs:
+            mask &= self._address_mask("outputs", f.dest_addrs)
+        return mask
+
+    def order(self):
+        """
+        Returns the array of positions which sorts the frame the same way as
+        :meth:`TxFilter.filter() <cardano.transaction.TxFilter.filter>` does: the mempool first,
+        then by descending slot.
+        """
+        key = np.where(
+            self.columns["confirmed"],
+            -self.columns["absolute_slot"],
+            np.iinfo(np.int64).min,
+        )
+        return np.argsort(key, kind="stable")
+
+    def filter(self, txfilter=None, **filterparams):
+        """
+        Returns a new frame of the transactions matching the filter, ordered like the result of
+        :meth:`TxFilter.filter() <cardano.transaction.TxFilter.filter>`.
+        """
+        frame = self[self.mask(txfilter, **filterparams)]
+        return frame[frame.order()]
+
+    def sum(self, column):
+        """
+        Returns the sum of the column as :class:`int`.
+        """
+        return int(self.columns[column].sum())
+
+    def sum_by(self, key, column):
+        """
+        Groups the transactions by values of the ``key`` column and sums the ``column`` within
+        each group. Returns a pair of arrays: the sorted unique keys and the sums.
+
+        For example, ``frame.sum_by("epoch", "amount_in")`` returns incoming Lovelaces
+        per epoch.
+        """
+        keys = self.columns[key]
+        if len(keys) == 0:
+            return keys[:0], np.zeros(0, dtype=np.int64)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(
+            np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))
+        )
+        return sorted_keys[starts], np.add.reduceat(self.columns[column][order], starts)
+
+
+def _bound(value):
+    try:
+        if value == int(value):
+            return int(value)
+    except (OverflowError, ValueError):
+        pass
+    return float(value)
+
+
+def _datetime64(dt):
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return np.datetime64(dt, "us")
@@ -4,14 +4,106 @@ from warnings import warn
 LOVELACE = Decimal("0.000001")
 
 
+class Lovelace(int):
+    """
+    An integer amount of Lovelaces. It behaves like :class:`int` and keeps its type in
+    arithmetic with numbers on its right-hand side, e.g. when added to, divided or multiplied
+    by :class:`int`, :class:`Decimal` or :class:`float`, as well as when negated or rounded.
+    Results which are not a whole number of Lovelaces raise :class:`ValueError`, use ``//`` to
+    round down. A ratio of two amounts, like ``a / b`` or ``a // b``, is a plain number.
+
+    Functions of this module recognize the type, so it is not mistaken for an amount of ADA.
+    Note that a :class:`Decimal` or :class:`float` on the left-hand side, as in
+    ``Decimal(1) + amount``, makes the result of that type.
+    """
+
+    __slots__ = ()
+
+    @property
+    def ada(self):
+        """
+        The amount of ADA.
+
+        :rtype: :class:`Decimal` with 6 decimal places precision
+        """
+        return from_lovelaces(self)
+
+    def __repr__(self):
+        return "Lovelace({:d})".format(self)
+
+    def __str__(self):
+        return int.__repr__(self)
+
+    def __add__(self, other):
+        return _lovelace_op(self, other, "__add__", "__radd__")
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return _lovelace_op(self, other, "__sub__", "__rsub__")
+
+    def __rsub__(self, other):
+        return _lovelace_op(self, other, "__rsub__", "__sub__")
+
+    def __mul__(self, other):
+        return _lovelace_op(self, other, "__mul__", "__rmul__")
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Lovelace):
+            return int.__truediv__(self, other)
+        return _lovelace_op(self, other, "__truediv__", "__rtruediv__")
+
+    def __floordiv__(self, other):
+        if isinstance(other, Lovelace):
+            return int.__floordiv__(self, other)
+        return _lovelace_op(self, other, "__floordiv__", "__rfloordiv__")
+
+    def __mod__(self, other):
+        return _lovelace_op(self, other, "__mod__", "__rmod__")
+
+    def __neg__(self):
+        return Lovelace(int.__neg__(self))
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Lovelace(int.__abs__(self))
+
+    def __round__(self, ndigits=None):
+        if ndigits is None:
+            return self
+        return Lovelace(int.__round__(self, ndigits))
+
+
+def _lovelace_op(amount, other, name, reflected):
+    if isinstance(other, int):
+        result = getattr(int, name)(amount, other)
+    elif isinstance(other, (Decimal, float)):
+        result = getattr(other, reflected)(int(amount))
+    else:
+        return NotImplemented
+    if result is NotImplemented:
+        return result
+    if result != int(result):
+        raise ValueError(
+            "{!r} is not a whole number of Lovelaces, use // to round down".format(result)
+        )
+    return Lovelace(int(result))
+
+
 def to_lovelaces(amount):
     """
-    Convert ADA to Lovelaces.
+    Convert ADA to Lovelaces. A :class:`Lovelace` amount is returned unchanged.
 
     :param Decimal,int amount:    the amount of ADA
     :rtype: :class:`int`
 
     """
+    if isinstance(amount, Lovelace):
+        return amount
     if not isinstance(amount, (Decimal, int, float)):
         raise ValueError(
             "Amount '{}' doesn't have numeric type. Only Decimal, int and "
@@ -40,11 +132,14 @@ def from_lovelaces(amount):
 
 def as_ada(amount):
     """
-    Return the amount rounded to maximal ADA precision.
+    Return the amount rounded to maximal ADA precision. A :class:`Lovelace` amount is converted
+    to ADA.
 
     :param Decimal,int amount:  the amount to be sanitized
     :rtype: :class:`Decimal` with 6 decimal places precision
     """
+    if isinstance(amount, Lovelace):
+        return amount.ada
     if isinstance(amount, float):
         warn(
             "as_ada() received amount of float type ({:f}). It is STRONGLY DISCOURAGED "
@@ -1,6 +1,8 @@
 import binascii
 import collections
 import enum
+import threading
+import weakref
 
 
 Balance = collections.namedtuple("Balance", ["total", "available", "reward"])
@@ -11,13 +13,16 @@ Balance.reward.__doc__ = "The staking rewards (interest)"
 
 
 BlockPosition = collections.namedtuple(
-    "BlockPosition", ["epoch", "slot", "absolute_slot", "height"]
+    "BlockPosition", ["epoch", "slot", "absolute_slot", "height", "time"]
 )
+# the ``defaults`` argument of namedtuple() is not available in Python 3.6
+BlockPosition.__new__.__defaults__ = (None,)
 BlockPosition.__doc__ = "Represents block's position within the blockchain"
 BlockPosition.epoch.__doc__ = "Epoch number"
 BlockPosition.slot.__doc__ = "Slot number"
 BlockPosition.absolute_slot.__doc__ = "Absolute slot number"
 BlockPosition.height.__doc__ = "Block number (height of the chain) [optional]"
+BlockPosition.time.__doc__ = "Time of the slot as :class:`datetime.datetime` [optional]"
 
 
 Epoch = collections.namedtuple("Epoch", ["number", "starts"])
@@ -34,45 +39,218 @@ class AssetID(object):
     The ``.name_bytes`` property is a :class:`bytes` decoded representation of the hex.
     Because Cardano allows full ASCII set to be used in asset names, some of them are not
     safe to be displayed directly.
+
+    Instances are interned: constructing the ID of an asset which is already in use returns
+    the existing object. They should be treated as immutable.
+
+    A subclass may set ``asset_name`` or ``policy_id`` as class attributes; they are used
+    when the constructor gets ``None`` or an empty policy ID.
     """
 
-    asset_name = ""
-    policy_id = None
-    name_bytes = None
+    __slots__ = (
+        "asset_name",
+        "policy_id",
+        "name_bytes",
+        "_str",
+        "_hash",
+        "__weakref__",
+    )
 
-    def __init__(self, asset_name, policy_id):
-        asset_name = asset_name if asset_name is not None else self.asset_name
-        policy_id = policy_id or self.policy_id
+    _interned = weakref.WeakValueDictionary()
+    _intern_lock = threading.Lock()
+
+    def __new__(cls, asset_name, policy_id):
+        if asset_name is None or not policy_id:
+            # read the defaults of a subclass
+            probe = object.__new__(cls)
+            if asset_name is None:
+                asset_name = getattr(probe, "asset_name", "")
+            policy_id = policy_id or getattr(probe, "policy_id", None)
         # binascii.hexlify() returns bytes() for some unknown reason. We may expect them to be
         # passed here:
         if isinstance(asset_name, bytes):
-            self.name_bytes = binascii.unhexlify(asset_name)
-            self.asset_name = asset_name.decode()
-        elif isinstance(asset_name, str):
-            self.name_bytes = binascii.unhexlify(asset_name.encode())
-            self.asset_name = asset_name
-        else:
+            asset_name = asset_name.decode()
+        elif not isinstance(asset_name, str):
             raise ValueError(
-                "The asset_name is neither str or bytes but {}".format(
-                    type(self.asset_name)
-                )
+                "The asset_name is neither str or bytes but {}".format(type(asset_name))
             )
+        key = (cls, policy_id, asset_name)
+        self = cls._interned.get(key)
+        if self is not None:
+            return self
+        self = object.__new__(cls)
+        self.name_bytes = binascii.unhexlify(asset_name.encode())
+        self.asset_name = asset_name
         self.policy_id = policy_id
+        self._str = "{}:{}".format(asset_name, policy_id)
+        self._hash = hash(self._str)
+        with cls._intern_lock:
+            return cls._interned.setdefault(key, self)
+
+    def __reduce__(self):
+        return (self.__class__, (self.asset_name, self.policy_id))
 
     def __repr__(self):
-        return "{:s}:{:s}".format(self.asset_name, self.policy_id)
+        return self._str
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, AssetID):
-            return str(self) == str(other)
+            return self._str == other._str
         elif isinstance(other, str):
-            return str(self) == other
+            return self._str == other
         elif isinstance(other, bytes):
-            return str(self).encode() == other
+            return self._str.encode() == other
         return super(AssetID, self).__eq__(other)
 
     def __hash__(self):
-        return hash(str(self))
+        return self._hash
+
+
+class MultiAsset(object):
+    """
+    An immutable bundle of native assets, mapping :class:`AssetID` to integer quantities.
+    Assets of zero quantity are dropped, so equal bundles always compare and hash equal.
+
+    Iterating over the bundle yields ``(AssetID, quantity)`` pairs, so it may be used wherever
+    a sequence of such pairs is accepted. Bundles support addition, subtraction and negation,
+    while comparison tells whether one bundle contains at most (or at least) as much of each
+    asset as the other. Missing assets have zero quantity.
+
+    :param assets:  a sequence of :class:`AssetID` and quantity pairs, or a :class:`dict`
+                    mapping them
+    """
+
+    __slots__ = ("_quantities", "_hash")
+
+    def __init__(self, assets=()):
+        if isinstance(assets, MultiAsset):
+            quantities = assets._quantities
+        else:
+            if hasattr(assets, "items"):
+                assets = assets.items()
+            quantities = {}
+            for aid, qty in assets:
+                qty += quantities.get(aid, 0)
+                if qty:
+                    quantities[aid] = qty
+                else:
+                    quantities.pop(aid, None)
+        self._quantities = quantities
+        self._hash = None
+
+    @classmethod
+    def _from_quantities(cls, quantities):
+        obj = cls.__new__(cls)
+        obj._quantities = quantities
+        obj._hash = None
+        return obj
+
+    @classmethod
+    def total(cls, bundles):
+        """
+        Returns the sum of an iterable of bundles. Unlike the built-in :func:`sum` it doesn't
+        create intermediate bundles, so it is much faster for many of them.
+        """
+        quantities = collections.defaultdict(int)
+        for bundle in bundles:
+            for aid, qty in bundle._quantities.items():
+                quantities[aid] += qty
+        return cls._from_quantities(
+            {aid: qty for aid, qty in quantities.items() if qty}
+        )
+
+    def __repr__(self):
+        return "MultiAsset({!r})".format(self._quantities)
+
+    def __iter__(self):
+        return iter(self._quantities.items())
+
+    def __len__(self):
+        return len(self._quantities)
+
+    def __bool__(self):
+        return bool(self._quantities)
+
+    def __contains__(self, aid):
+        return aid in self._quantities
+
+    def __getitem__(self, aid):
+        return self._quantities.get(aid, 0)
+
+    def items(self):
+        return self._quantities.items()
+
+    def by_policy(self):
+        """
+        Returns the quantities grouped by policy, as :class:`dict` of policy IDs mapped to
+        :class:`dict` of asset names and quantities.
+        """
+        policies = {}
+        for aid, qty in self._quantities.items():
+            policies.setdefault(aid.policy_id, {})[aid.asset_name] = qty
+        return policies
+
+    def _merge(self, other, sign):
+        if not isinstance(other, MultiAsset):
+            if isinstance(other, int) and other == 0:
+                # makes sum() work without the start argument
+                return self
+            return NotImplemented
+        quantities = dict(self._quantities)
+        for aid, qty in other._quantities.items():
+            qty = quantities.get(aid, 0) + sign * qty
+            if qty:
+                quantities[aid] = qty
+            else:
+                del quantities[aid]
+        return self._from_quantities(quantities)
+
+    def __add__(self, other):
+        return self._merge(other, 1)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._merge(other, -1)
+
+    def __neg__(self):
+        return self._from_quantities(
+            {aid: -qty for aid, qty in self._quantities.items()}
+        )
+
+    def __eq__(self, other):
+        if isinstance(other, MultiAsset):
+            return self._quantities == other._quantities
+        if isinstance(other, dict):
+            return self == MultiAsset(other)
+        return NotImplemented
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(frozenset(self._quantities.items()))
+        return self._hash
+
+    def __le__(self, other):
+        if not isinstance(other, MultiAsset):
+            return NotImplemented
+        return all(qty <= 0 for aid, qty in self - other)
+
+    def __ge__(self, other):
+        if not isinstance(other, MultiAsset):
+            return NotImplemented
+        return other <= self
+
+    def __lt__(self, other):
+        if not isinstance(other, MultiAsset):
+            return NotImplemented
+        return self != other and self <= other
+
+    def __gt__(self, other):
+        if not isinstance(other, MultiAsset):
+            return NotImplemented
+        return self != other and other <= self
 
 
 StakePoolStatus = enum.Enum("StakePoolStatus", "ACTIVE RETIRING DELISTED")
@@ -142,3 +320,39 @@ StakingStatus.__doc__ = "Wallet's staking status"
 StakingStatus.delegating.__doc__ = "Whether the wallet is actively delegating"
 StakingStatus.target_id.__doc__ = "The ID of the pool the wallet is delegating to"
 StakingStatus.changes_at.__doc__ = ":class:`Epoch` since which the change comes live"
+
+WalletInfo = collections.namedtuple(
+    "WalletInfo",
+    [
+        "id",
+        "name",
+        "balance",
+        "assets",
+        "staking_status",
+        "staking_next",
+        "sync_progress",
+        "tip",
+        "address_pool_gap",
+    ],
+)
+WalletInfo.__doc__ = "Wallet's state retrieved at once"
+WalletInfo.id.__doc__ = "The wallet ID"
+WalletInfo.name.__doc__ = "Name of the wallet"
+WalletInfo.balance.__doc__ = "The :class:`Balance` of ADA"
+WalletInfo.assets.__doc__ = (
+    "Balances of native assets, as :class:`dict` of :class:`AssetID`: :class:`Balance` pairs, "
+    "or ``None`` if not supported by the backend"
+)
+WalletInfo.staking_status.__doc__ = "The current :class:`StakingStatus`"
+WalletInfo.staking_next.__doc__ = (
+    "A :class:`list` of upcoming :class:`StakingStatus` changes"
+)
+WalletInfo.sync_progress.__doc__ = (
+    "Progress of synchronization with the blockchain, ranging from ``0.0`` to ``1.0``"
+)
+WalletInfo.tip.__doc__ = (
+    "The :class:`BlockPosition` of the last block known to the wallet"
+)
+WalletInfo.address_pool_gap.__doc__ = (
+    "Number of consecutive unused addresses kept by the wallet"
+)
@@ -1,18 +1,74 @@
+import bisect
+import collections
+import datetime
+import heapq
+import itertools
 import operator
 import re
 import warnings
 
-from .address import Address, address
+from .address import address
+
+# the parameters of IOBase shadow the function
+_address = address
 from .metadata import Metadata
-from .numbers import as_ada
+from .numbers import Lovelace, from_lovelaces, to_lovelaces
+from .simpletypes import MultiAsset
+
+__all__ = (
+    "Transaction",
+    "Input",
+    "Output",
+    "Deferred",
+    "TransactionIndex",
+    "validate_txid",
+)
+
+
+class Deferred(object):
+    """
+    A value of a :class:`Transaction` attribute decoded only upon the first access.
+    The function is called with the transaction as the only argument.
+
+    :param fn:      the decoding function
+    """
+
+    __slots__ = ("fn",)
+
+    def __init__(self, fn):
+        self.fn = fn
+
 
-__all__ = ("Transaction", "Input", "Output", "validate_txid")
+def _deferrable(name):
+    slot = "_" + name
+
+    def fget(self):
+        val = getattr(self, slot)
+        if isinstance(val, Deferred):
+            val = val.fn(self)
+            setattr(self, slot, val)
+        return val
+
+    def fset(self, val):
+        setattr(self, slot, val)
+        # drop the cached aggregates
+        self._totals = None
+        self._assets = None
+
+    return property(fget, fset)
 
 
 class Transaction(object):
     """
     Represents a Cardano transaction.
 
+    Any of ``inputs``, ``outputs``, ``local_inputs``, ``local_outputs`` and ``metadata`` may be
+    given as a :class:`Deferred` value, which is decoded upon the first access.
+
+    The class defines ``__slots__`` to keep long histories small in memory. Subclasses keep
+    a ``__dict__``, so they may still provide defaults of the attributes as class attributes,
+    which the constructor falls back to.
+
     :param txid:            the ID of the transaction
     :param fee:             fee amount in ADA
     :param inputs:          a sequence of :class:`Input` objects
@@ -24,46 +80,56 @@ class Transaction(object):
     :param metadata:        an instance of :class:`Metadata <cardano.metadata.Metadata>`
     """
 
-    txid = None
-    fee = None
-    inputs = None
-    outputs = None
-    local_inputs = None
-    local_outputs = None
-    withdrawals = None
-    inserted_at = None
-    expires_at = None
-    pending_since = None
-    status = None
-    metadata = None
+    __slots__ = (
+        "txid",
+        "_fee",
+        "_inputs",
+        "_outputs",
+        "_local_inputs",
+        "_local_outputs",
+        "withdrawals",
+        "inserted_at",
+        "expires_at",
+        "pending_since",
+        "status",
+        "_metadata",
+        "_totals",
+        "_assets",
+    )
+
+    fee = _deferrable("fee")
+    inputs = _deferrable("inputs")
+    outputs = _deferrable("outputs")
+    local_inputs = _deferrable("local_inputs")
+    local_outputs = _deferrable("local_outputs")
+    metadata = _deferrable("metadata")
 
     def __init__(self, txid=None, **kwargs):
-        self.txid = txid or self.txid
+        self.txid = txid or getattr(self, "txid", None)
         validate_txid(self.txid)
         fee = kwargs.pop("fee", None)
-        self.fee = fee if fee is not None else self.fee
-        self.inputs = kwargs.pop("inputs", []) or (
-            self.inputs if self.inputs is not None else []
-        )
-        self.outputs = kwargs.pop("outputs", []) or (
-            self.outputs if self.outputs is not None else []
-        )
-        self.local_inputs = kwargs.pop("local_inputs", []) or (
-            self.local_inputs if self.local_inputs is not None else []
-        )
-        self.local_outputs = kwargs.pop("local_outputs", []) or (
-            self.local_outputs if self.local_outputs is not None else []
-        )
-        self.withdrawals = kwargs.pop("withdrawals", []) or (
-            self.withdrawals if self.withdrawals is not None else []
-        )
-        self.inserted_at = kwargs.pop("inserted_at", None) or self.inserted_at
-        self.expires_at = kwargs.pop("expires_at", None) or self.expires_at
-        self.pending_since = kwargs.pop("pending_since", None) or self.pending_since
-        self.status = kwargs.pop("status", None) or self.status
-        self.metadata = kwargs.pop("metadata", Metadata()) or (
-            self.metadata if self.metadata is not None else Metadata()
+        self.fee = fee if fee is not None else getattr(self, "fee", None)
+        for name in (
+            "inputs",
+            "outputs",
+            "local_inputs",
+            "local_outputs",
+            "withdrawals",
+        ):
+            default = getattr(self, name, None)
+            setattr(
+                self,
+                name,
+                kwargs.pop(name, []) or (default if default is not None else []),
+            )
+        for name in ("inserted_at", "expires_at", "pending_since", "status"):
+            setattr(self, name, kwargs.pop(name, None) or getattr(self, name, None))
+        default = getattr(self, "metadata", None)
+        self.metadata = kwargs.pop("metadata", None) or (
+            default if default is not None else Metadata()
         )
+        self._totals = None
+        self._assets = None
 
     def __repr__(self):
         return "<Cardano tx: {:s}>".format(self.txid)
@@ -71,61 +137,72 @@ class Transaction(object):
     def __format__(self, spec):
         return format(str(self), spec)
 
+    def _get_totals(self):
+        # The sums are calculated once, in Lovelaces, and dropped whenever any of the local
+        # inputs, outputs or the fee is replaced. They are given as Lovelace if the amounts are.
+        if self._totals is None:
+            ins = sum(to_lovelaces(inp.amount) for inp in self.local_inputs)
+            outs = sum(to_lovelaces(out.amount) for out in self.local_outputs)
+            fee = to_lovelaces(self.fee) if self.fee is not None else None
+            convert = (
+                Lovelace
+                if any(isinstance(amount, Lovelace) for amount in (fee, ins, outs))
+                else from_lovelaces
+            )
+            self._totals = (
+                convert(ins),
+                convert(outs),
+                convert(max(0, outs - ins)),
+                convert(max(0, ins - outs - fee) if fee is not None else 0),
+            )
+        return self._totals
+
     @property
     def local_inputs_sum(self):
-        return as_ada(sum(map(operator.attrgetter("amount"), self.local_inputs)))
+        return self._get_totals()[0]
 
     @property
     def local_outputs_sum(self):
-        return as_ada(sum(map(operator.attrgetter("amount"), self.local_outputs)))
+        return self._get_totals()[1]
 
     @property
     def amount_in(self):
-        return as_ada(max(0, self.local_outputs_sum - self.local_inputs_sum))
+        return self._get_totals()[2]
 
     @property
     def amount_out(self):
-        return as_ada(
-            max(
-                0,
-                self.local_inputs_sum - self.local_outputs_sum - self.fee
-                if self.fee is not None
-                else 0,
-            )
-        )
+        return self._get_totals()[3]
 
-    #    @property
-    #    def assets(self):
-    #        _assets = collections.defaultdict(int)
-    #        print("i")
-    #        for inp in self.inputs:
-    #            print(inp.assets)
-    #            for aid, aqty in inp.assets:
-    #                _assets[aid] += -aqty if inp in self.local_inputs else aqty
-    #                print(dict(_assets))
-    #        print("o")
-    #        for outp in self.outputs:
-    #            print(outp.assets)
-    #            for aid, aqty in outp.assets:
-    #                print(outp in self.local_outputs)
-    #                _assets[aid] += aqty if outp in self.local_outputs else -aqty
-    #                print(dict(_assets))
-    #        return dict(_assets)
+    @property
+    def assets(self):
+        """
+        The net change of native assets of the wallet, as :class:`MultiAsset
+        <cardano.simpletypes.MultiAsset>`. Assets received are positive, those sent away
+        negative.
+        """
+        if self._assets is None:
+            self._assets = MultiAsset.total(
+                out.assets for out in self.local_outputs
+            ) - MultiAsset.total(inp.assets for inp in self.local_inputs)
+        return self._assets
 
     def hash(self):
         return self.txid
 
 
 class IOBase(object):
+    __slots__ = ("address", "amount", "assets")
+
     def __init__(self, address=None, amount=None, assets=None):
-        self.address = None if address is None else Address(address)
+        self.address = None if address is None else _address(address)
         self.amount = amount
-        self.assets = assets or []
+        self.assets = MultiAsset(assets or ())
 
 
 class Input(IOBase):
     """
-    Represents a :class:`Transaction` input.
+    Represents a :class:`Transaction` input. Inputs are equal when they spend the same output,
+    i.e. have the same ID and index.
 
     :param iid:     the input ID
     :type iid:      :class:`str` hex
@@ -134,27 +211,62 @@ class Input(IOBase):
     :param amount:  the amount in ADA
     :type amount:   :class:`Decimal`
     :param assets:  a sequence of :class:`AssetID <cardano.simpletypes.AssetID>` quantity pairs
-    :type assets:   :class:`list`
+    :type assets:   :class:`MultiAsset <cardano.simpletypes.MultiAsset>` or :class:`list`
+    :param index:   the index of the spent output within its transaction
+    :type index:    :class:`int`
     """
 
-    def __init__(self, iid=None, address=None, amount=None, assets=None):
+    __slots__ = ("iid", "index", "_hash")
+
+    def __init__(self, iid=None, address=None, amount=None, assets=None, index=None):
         super(Input, self).__init__(address=address, amount=amount, assets=assets)
         self.iid = iid
+        self.index = index
+        self._hash = hash((iid, index))
+
+    def __eq__(self, other):
+        if not isinstance(other, Input):
+            return NotImplemented
+        return self.iid == other.iid and self.index == other.index
+
+    def __hash__(self):
+        return self._hash
 
 
 class Output(IOBase):
     """
-    Represents a :class:`Transaction` output.
+    Represents a :class:`Transaction` output. Outputs are equal when all their attributes are.
 
     :param address: the destination address
     :type address:  :class:`cardano.address.Address`
     :param amount:  the amount in ADA
     :type amount:   :class:`Decimal`
     :param assets:  a sequence of :class:`AssetID <cardano.simpletypes.AssetID>` quantity pairs
-    :type assets:   :class:`list`
+    :type assets:   :class:`MultiAsset <cardano.simpletypes.MultiAsset>` or :class:`list`
+    :param txid:    the ID of the transaction the output belongs to
+    :type txid:     :class:`str` hex
+    :param index:   the index of the output within the transaction
+    :type index:    :class:`int`
     """
 
-    pass
+    __slots__ = ("txid", "index", "_hash")
+
+    def __init__(self, address=None, amount=None, assets=None, txid=None, index=None):
+        super(Output, self).__init__(address=address, amount=amount, assets=assets)
+        self.txid = txid
+        self.index = index
+        self._hash = hash(self._key())
+
+    def _key(self):
+        return (self.txid, self.index, self.address, self.amount, self.assets)
+
+    def __eq__(self, other):
+        if not isinstance(other, Output):
+            return NotImplemented
+        return self._hash == other._hash and self._key() == other._key()
+
+    def __hash__(self):
+        return self._hash
 
 
 def validate_txid(txid):
@@ -167,58 +279,213 @@ def validate_txid(txid):
 
 
 class TransactionManager(object):
+    """
+    Provides access to the wallet's history. Calling it returns the list of transactions
+    matching the filter given as keyword arguments. The mempool goes on top, followed by
+    the ledger in descending order. ``order="ascending"`` reverses the list, while ``limit`` and
+    ``offset`` select a page of it.
+
+    :param wid:         the wallet ID
+    :param backend:     the backend used to retrieve the transactions
+    :param incremental: if ``True``, the history is kept in memory and each call retrieves only
+                        the transactions added or changed since the previous one
+    :param rollback_margin: how far back before the newest known transaction the incremental
+                        retrieval starts, as :class:`datetime.timedelta`, so that transactions
+                        removed from the ledger by a rollback are noticed
+    """
+
     wid = None
     backend = None
+    incremental = False
+    rollback_margin = datetime.timedelta(hours=1)
 
-    def __init__(self, wid, backend):
+    def __init__(self, wid, backend, incremental=None, rollback_margin=None):
         self.wid = wid
         self.backend = backend
-
-    def __call__(self, **filterparams):
+        if incremental is not None:
+            self.incremental = incremental
+        if rollback_margin is not None:
+            self.rollback_margin = rollback_margin
+        self._history = None
+        self._pending = {}
+        self._newest = None
+        #: The list of transactions removed from the history by the last :meth:`sync`.
+        self.removed = []
+
+    def __call__(self, limit=None, offset=0, order="descending", **filterparams):
         filter_ = TxFilter(**filterparams)
-        return filter_.filter(self.backend.transactions(self.wid))
+        page = dict(limit=limit, offset=offset, order=order)
+        if self.incremental:
+            self.sync()
+            return filter_.filter(self._history, **page)
+        if filter_.txids:
+            return filter_.filter(
+                self.backend.transactions_by_id(self.wid, filter_.txids), **page
+            )
+        return filter_.filter(
+            self.backend.transactions(self.wid, txfilter=filter_), **page
+        )
 
+    def _sync_start(self):
+        """
+        Returns the time since which the history has to be retrieved again, or ``None`` if
+        it has to be retrieved entirely.
+        """
+        if self._history is None:
+            return None
+        positions = [tx.pending_since for tx in self._pending.values()]
+        if self._newest is not None:
+            positions.append(self._newest)
+        if not positions or any(p is None or p.time is None for p in positions):
+            return None
+        return min(p.time for p in positions) - self.rollback_margin
+
+    def _merge(self, txns, start):
+        if start is None:
+            old = self._history if self._history is not None else TransactionIndex()
+            self._history = TransactionIndex()
+            self._pending = {}
+            self._newest = None
+        else:
+            old = self._history
+        changed = []
+        seen = set()
+        for tx in txns:
+            seen.add(tx.txid)
+            prev = old.get(tx.txid)
+            if (
+                prev is None
+                or prev.status != tx.status
+                or prev.inserted_at != tx.inserted_at
+            ):
+                changed.append(tx)
+            else:
+                tx = prev
+            if self._history.get(tx.txid) is not tx:
+                self._history.add(tx)
+            if tx.status == "pending":
+                self._pending[tx.txid] = tx
+            else:
+                self._pending.pop(tx.txid, None)
+            if tx.inserted_at is not None and (
+                self._newest is None
+                or tx.inserted_at.absolute_slot > self._newest.absolute_slot
+            ):
+                self._newest = tx.inserted_at
+        if start is None:
+            self.removed = [tx for tx in old if tx.txid not in seen]
+        else:
+            self.removed = self._forget_unlisted(start, seen)
+        return changed
+
+    def _forget_unlisted(self, start, seen):
+        # All pending transactions are newer than the start, so if not listed, they have been
+        # dropped from the mempool and forgotten by the wallet. Transactions in the ledger since
+        # the start which are not listed have been removed by a rollback.
+        gone = [txid for txid in self._pending if txid not in seen]
+        for tx in reversed(self._history._confirmed):
+            time = tx.inserted_at.time
+            if time is None:
+                continue
+            if time < start:
+                break
+            if tx.txid not in seen:
+                gone.append(tx.txid)
+        removed = []
+        for txid in gone:
+            self._pending.pop(txid, None)
+            removed.append(self._history.remove(txid))
+        if gone:
+            confirmed = self._history._confirmed
+            self._newest = confirmed[-1].inserted_at if confirmed else None
+        return removed
+
+    def sync(self):
+        """
+        Updates the history kept in memory. Upon the first call the entire history is retrieved,
+        later only the transactions since the newest one already known, or since the oldest
+        of still pending ones, whichever is earlier, minus the ``rollback_margin``. Transactions
+        since then which are no longer listed are removed from the history.
+
+        Returns the list of transactions which are new or have changed their status since the
+        previous call. Those removed from the history, i.e. dropped from the mempool or rolled
+        back, are stored in the :attr:`removed` attribute.
+        """
+        start = self._sync_start()
+        return self._merge(self.backend.transactions(self.wid, start=start), start)
+
+    def iter(self, start=None, end=None, window=None, **filterparams):
+        """
+        Yields transactions matching the filter in ascending order, without loading the entire
+        history at once. The history is retrieved in consecutive time windows.
+
+        :param start:   the earliest time of transactions as :class:`datetime.datetime`,
+                        defaults to the start of the blockchain
+        :param end:     the latest time of transactions, defaults to none which also includes
+                        the transactions not yet in the ledger
+        :param window:  the length of a single window as :class:`datetime.timedelta`
+        """
+        filter_ = TxFilter(**filterparams)
+        for tx in self.backend.iter_transactions(
+            self.wid, start=start, end=end, window=window
+        ):
+            if filter_.check(tx):
+                yield tx
 
-class _ByHeight(object):
-    """A helper class used as key in sorting of payments by height.
-    Mempool goes on top, blockchain payments are ordered with descending block numbers.
 
-    **WARNING:** Integer sorting is reversed here.
+class AsyncTransactionManager(TransactionManager):
+    """
+    The :mod:`asyncio` counterpart of :class:`TransactionManager`, to be used with asynchronous
+    backends. Calling it returns a coroutine.
     """
 
-    def __init__(self, tx):
-        self.tx = tx
-
-    def _cmp(self, other):
-        sh = self.tx.inserted_at
-        oh = other.tx.inserted_at
-        if sh is oh is None:
-            return 0
-        if sh is None:
-            return 1
-        if oh is None:
-            return -1
-        return (sh.absolute_slot > oh.absolute_slot) - (
-            sh.absolute_slot < oh.absolute_slot
+    async def __call__(self, limit=None, offset=0, order="descending", **filterparams):
+        filter_ = TxFilter(**filterparams)
+        page = dict(limit=limit, offset=offset, order=order)
+        if self.incremental:
+            await self.sync()
+            return filter_.filter(self._history, **page)
+        if filter_.txids:
+            return filter_.filter(
+                await self.backend.transactions_by_id(self.wid, filter_.txids), **page
+            )
+        return filter_.filter(
+            await self.backend.transactions(self.wid, txfilter=filter_), **page
+        )
+
+    async def sync(self):
+        start = self._sync_start()
+        return self._merge(
+            await self.backend.transactions(self.wid, start=start), start
         )
 
-    def __lt__(self, other):
-        return self._cmp(other) > 0
+    async def iter(self, start=None, end=None, window=None, **filterparams):
+        filter_ = TxFilter(**filterparams)
+        async for tx in self.backend.iter_transactions(
+            self.wid, start=start, end=end, window=window
+        ):
+            if filter_.check(tx):
+                yield tx
 
-    def __le__(self, other):
-        return self._cmp(other) >= 0
 
-    def __eq__(self, other):
-        return self._cmp(other) == 0
+def _height_key(tx):
+    """The sort key of transactions by height.
+    Mempool goes on top, blockchain payments are ordered with descending absolute slots.
+    """
+    ht = tx.inserted_at
+    return (0, 0) if ht is None else (1, -ht.absolute_slot)
+
 
-    def __ge__(self, other):
-        return self._cmp(other) <= 0
+def _indexed_height_key(item):
+    return (_height_key(item[1]), item[0])
 
-    def __gt__(self, other):
-        return self._cmp(other) < 0
 
-    def __ne__(self, other):
-        return self._cmp(other) != 0
+def _is_ascending(order):
+    if order not in ("ascending", "descending"):
+        raise ValueError(
+            "Order must be 'ascending' or 'descending', not {!r}".format(order)
+        )
+    return order == "ascending"
 
 
 class TxFilter(object):
@@ -235,6 +502,8 @@ class TxFilter(object):
     # - max_absolute_slot
     # - min_height
     # - max_height
+    # - min_time
+    # - max_time
     # - confirmed
     # - unconfirmed
     #
@@ -247,6 +516,8 @@ class TxFilter(object):
         self.max_absolute_slot = filterparams.pop("max_absolute_slot", None)
         self.min_height = filterparams.pop("min_height", None)
         self.max_height = filterparams.pop("max_height", None)
+        self.min_time = self._get_time(filterparams.pop("min_time", None))
+        self.max_time = self._get_time(filterparams.pop("max_time", None))
         self.unconfirmed = filterparams.pop("unconfirmed", False)
         self.confirmed = filterparams.pop("confirmed", True)
         _txid = filterparams.pop("txid", None)
@@ -268,6 +539,8 @@ class TxFilter(object):
                     self.max_absolute_slot,
                     self.min_height,
                     self.max_height,
+                    self.min_time,
+                    self.max_time,
                 ),
             )
         )
@@ -283,18 +556,25 @@ class TxFilter(object):
         self.src_addrs = self._get_addrset(_src_addr)
         self.dest_addrs = self._get_addrset(_dest_addr)
         if _txid is None:
-            self.txids = []
+            self.txids = frozenset()
         else:
             if isinstance(_txid, (bytes, str)):
                 txids = [_txid]
             else:
                 iter(_txid)
                 txids = _txid
-            self.txids = list(map(validate_txid, txids))
+            self.txids = frozenset(map(validate_txid, txids))
+        self._predicate = self._compile()
+
+    def _get_time(self, dt):
+        if dt is not None and dt.tzinfo is None:
+            # naive times are considered to be UTC
+            dt = dt.replace(tzinfo=datetime.timezone.utc)
+        return dt
 
     def _get_addrset(self, addr):
         if addr is None:
-            return set()
+            return frozenset()
         else:
             if isinstance(addr, (str, bytes)):
                 addrs = [addr]
@@ -304,53 +584,275 @@ class TxFilter(object):
                     addrs = addr
                 except TypeError:
                     addrs = [addr]
-            return set(map(address, addrs))
+            return frozenset(map(address, addrs))
+
+    @staticmethod
+    def _lower_bound(getter, bound):
+        def check(ht):
+            val = getter(ht)
+            return val is not None and val >= bound
+
+        return check
+
+    @staticmethod
+    def _upper_bound(getter, bound):
+        def check(ht):
+            val = getter(ht)
+            return val is not None and val <= bound
+
+        return check
+
+    def _compile(self):
+        """
+        Builds the predicate consisting of the active conditions only.
+        """
+        position = []
+        for attr, low, high in (
+            ("epoch", self.min_epoch, self.max_epoch),
+            ("slot", self.min_slot, self.max_slot),
+            ("absolute_slot", self.min_absolute_slot, self.max_absolute_slot),
+            ("height", self.min_height, self.max_height),
+            ("time", self.min_time, self.max_time),
+        ):
+            getter = operator.attrgetter(attr)
+            if low is not None:
+                position.append(self._lower_bound(getter, low))
+            if high is not None:
+                position.append(self._upper_bound(getter, high))
+        conditions = []
+        if self.txids:
+            txids = self.txids
+            conditions.append(lambda tx: tx.txid in txids)
+        if self.src_addrs:
+            src_addrs = self.src_addrs
+            conditions.append(
+                lambda tx: not src_addrs.isdisjoint(inp.address for inp in tx.inputs)
+            )
+        if self.dest_addrs:
+            dest_addrs = self.dest_addrs
+            conditions.append(
+                lambda tx: not dest_addrs.isdisjoint(out.address for out in tx.outputs)
+            )
+        confirmed = self.confirmed
+        # mempool txns are filtered out if any height range check is present
+        unconfirmed = self.unconfirmed and not self._asks_chain_position
+
+        def predicate(tx):
+            ht = tx.inserted_at
+            if ht is None:
+                if not unconfirmed:
+                    return False
+            else:
+                if not confirmed:
+                    return False
+                for cond in position:
+                    if not cond(ht):
+                        return False
+            for cond in conditions:
+                if not cond(tx):
+                    return False
+            return True
+
+        return predicate
 
     def check(self, tx):
         assert (tx.status == "in_ledger" and tx.inserted_at is not None) or (
             tx.status != "in_ledger" and tx.inserted_at is None
         )
-        ht = tx.inserted_at
-        if ht is None:
-            if not self.unconfirmed:
-                return False
-            if self._asks_chain_position:
-                # mempool txns are filtered out if any height range check is present
-                return False
+        return self._predicate(tx)
+
+    def filter(self, txns, limit=None, offset=0, order="descending"):
+        """
+        Returns the list of transactions matching the filter. By default the mempool goes on top
+        and the rest is ordered by descending position in the ledger. The ``"ascending"`` order
+        returns the very same list reversed.
+
+        :param txns:    an iterable of :class:`Transaction` objects or a
+                        :class:`TransactionIndex`
+        :param limit:   the maximum number of transactions returned
+        :param offset:  the number of leading transactions skipped
+        :param order:   either ``"descending"`` or ``"ascending"``
+        """
+        ascending = _is_ascending(order)
+        if isinstance(txns, TransactionIndex):
+            return txns.query(self, limit=limit, offset=offset, order=order)
+        matching = filter(self._predicate, txns)
+        if limit is None:
+            result = sorted(matching, key=_height_key)
+            return result[::-1][offset:] if ascending else result[offset:]
+        if ascending:
+            # the tail of the descending order, ties included, is where the keys and positions
+            # are the largest
+            return [
+                tx
+                for i, tx in heapq.nlargest(
+                    offset + limit, enumerate(matching), key=_indexed_height_key
+                )[offset:]
+            ]
+        return heapq.nsmallest(offset + limit, matching, key=_height_key)[offset:]
+
+
+class TransactionIndex(object):
+    """
+    An in-memory collection of transactions, indexed for fast querying with :class:`TxFilter`.
+    Transactions in the ledger are kept sorted by their absolute slot, so that the slot range
+    is found with bisection. The mempool is kept separately. Transaction IDs as well as
+    source and destination addresses are mapped to the transactions, so that such queries don't
+    need to scan the entire collection. The addresses are indexed upon the first query for them,
+    so that adding transactions doesn't decode their deferred inputs and outputs.
+
+    Adding a transaction with ID already present replaces the old one.
+
+    :param txns:    an optional iterable of :class:`Transaction` objects
+    """
+
+    def __init__(self, txns=()):
+        self._keys = []
+        self._confirmed = []
+        self._mempool = {}
+        self._by_txid = {}
+        self._txkeys = {}
+        self._by_src = collections.defaultdict(set)
+        self._by_dest = collections.defaultdict(set)
+        self._unindexed = set()
+        self._seq = 0
+        for tx in txns:
+            self.add(tx)
+
+    def __len__(self):
+        return len(self._by_txid)
+
+    def __iter__(self):
+        return iter(self._by_txid.values())
+
+    def __contains__(self, txid):
+        return txid in self._by_txid
+
+    def get(self, txid, default=None):
+        """
+        Returns the transaction of given ID or ``default`` if not present.
+        """
+        return self._by_txid.get(txid, default)
+
+    def _key(self, tx):
+        # descending sequence keeps the order of addition in reversed (newest first) slices
+        self._seq += 1
+        return (tx.inserted_at.absolute_slot, -self._seq)
+
+    def add(self, tx):
+        """
+        Adds the transaction to the index, replacing the one of the same ID if present.
+        """
+        self.remove(tx.txid)
+        self._by_txid[tx.txid] = tx
+        if tx.inserted_at is None:
+            self._mempool[tx.txid] = tx
         else:
-            if not self.confirmed:
-                return False
-            if self.min_epoch is not None and ht.epoch < self.min_epoch:
-                return False
-            if self.max_epoch is not None and ht.epoch > self.max_epoch:
-                return False
-            if self.min_slot is not None and ht.slot < self.min_slot:
-                return False
-            if self.max_slot is not None and ht.slot > self.max_slot:
-                return False
-            if (
-                self.min_absolute_slot is not None
-                and ht.absolute_slot < self.min_absolute_slot
-            ):
-                return False
-            if (
-                self.max_absolute_slot is not None
-                and ht.absolute_slot > self.max_absolute_slot
-            ):
-                return False
-            if self.min_height is not None and ht.height < self.min_height:
-                return False
-            if self.max_height is not None and ht.height > self.max_height:
-                return False
-        if self.txids and tx.txid not in self.txids:
-            return False
-        srcs = set(filter(None, map(operator.attrgetter("address"), tx.inputs)))
-        dests = set(filter(None, map(operator.attrgetter("address"), tx.inputs)))
-        if self.src_addrs and not self.src_addrs.intersection(srcs):
-            return False
-        if self.dest_addrs and not self.dest_addrs.intersection(dests):
-            return False
-        return True
-
-    def filter(self, txns):
-        return sorted(filter(self.check, txns), key=_ByHeight)
+            key = self._key(tx)
+            pos = bisect.bisect_left(self._keys, key)
+            self._keys.insert(pos, key)
+            self._confirmed.insert(pos, tx)
+            self._txkeys[tx.txid] = key
+        self._unindexed.add(tx.txid)
+
+    def _index_addresses(self):
+        for txid in self._unindexed:
+            tx = self._by_txid[txid]
+            for inp in tx.inputs:
+                if inp.address is not None:
+                    self._by_src[inp.address].add(txid)
+            for out in tx.outputs:
+                if out.address is not None:
+                    self._by_dest[out.address].add(txid)
+        self._unindexed.clear()
+
+    def remove(self, txid):
+        """
+        Removes the transaction of given ID from the index. Returns the removed transaction or
+        ``None`` if not present.
+        """
+        tx = self._by_txid.pop(txid, None)
+        if tx is None:
+            return None
+        if self._mempool.pop(txid, None) is None:
+            key = self._txkeys.pop(txid)
+            pos = bisect.bisect_left(self._keys, key)
+            del self._keys[pos]
+            del self._confirmed[pos]
+        if txid in self._unindexed:
+            self._unindexed.discard(txid)
+            return tx
+        for addrs, ios in ((self._by_src, tx.inputs), (self._by_dest, tx.outputs)):
+            for io in ios:
+                txids = addrs.get(io.address)
+                if txids is not None:
+                    txids.discard(txid)
+                    if not txids:
+                        del addrs[io.address]
+        return tx
+
+    def _range(self, txfilter):
+        """
+        Returns the range of positions in the ledger part which may contain transactions
+        matching the filter's absolute slot bounds.
+        """
+        lo, hi = 0, len(self._confirmed)
+        if txfilter.min_absolute_slot is not None:
+            lo = bisect.bisect_left(self._keys, (txfilter.min_absolute_slot,))
+        if txfilter.max_absolute_slot is not None:
+            # the sequence part of the keys is always negative
+            hi = bisect.bisect_left(self._keys, (txfilter.max_absolute_slot, 0))
+        return lo, hi
+
+    def _candidates(self, txfilter):
+        """
+        Returns the set of IDs of transactions which may match the filter's ID and address
+        criteria, or ``None`` if there are no such criteria.
+        """
+        candidates = None
+        if txfilter.txids:
+            candidates = set(txfilter.txids.intersection(self._by_txid))
+        if self._unindexed and (txfilter.src_addrs or txfilter.dest_addrs):
+            self._index_addresses()
+        for index, addrs in (
+            (self._by_src, txfilter.src_addrs),
+            (self._by_dest, txfilter.dest_addrs),
+        ):
+            if addrs:
+                txids = set()
+                for addr in addrs:
+                    txids.update(index.get(addr, ()))
+                candidates = txids if candidates is None else candidates & txids
+        return candidates
+
+    def query(self, txfilter, limit=None, offset=0, order="descending"):
+        """
+        Returns the list of transactions matching the :class:`TxFilter`, ordered and sliced in
+        the same way as :meth:`TxFilter.filter` does. Only as many transactions as necessary
+        are checked against the filter.
+        """
+        ascending = _is_ascending(order)
+        candidates = self._candidates(txfilter)
+        if candidates is not None:
+            mempool = [tx for txid, tx in self._mempool.items() if txid in candidates]
+            confirmed = sorted(
+                (self._by_txid[txid] for txid in candidates if txid in self._txkeys),
+                key=lambda tx: self._txkeys[tx.txid],
+                reverse=not ascending,
+            )
+        else:
+            mempool = list(self._mempool.values())
+            lo, hi = self._range(txfilter)
+            positions = range(lo, hi) if ascending else range(hi - 1, lo - 1, -1)
+            confirmed = map(self._confirmed.__getitem__, positions)
+        if ascending:
+            txns = itertools.chain(confirmed, reversed(mempool))
+        else:
+            txns = itertools.chain(mempool, confirmed)
+        return list(
+            itertools.islice(
+                filter(txfilter._predicate, txns),
+                offset,
+                None if limit is None else offset + limit,
+            )
+        )
@@ -1,6 +1,6 @@
 from .address import Address
 from .simpletypes import StakePoolInfo
-from .transaction import TransactionManager
+from .transaction import AsyncTransactionManager, TransactionManager
 from . import exceptions
 
 
@@ -78,6 +78,15 @@ class Wallet(object):
         """
         return self.backend.sync_progress(self.wid)
 
+    def info(self):
+        """
+        Returns the complete state of the wallet, retrieved at once. It contains balances,
+        staking status, sync progress and more.
+
+        :rtype:     :class:`WalletInfo <cardano.simpletypes.WalletInfo>`
+        """
+        return self.backend.wallet_info(self.wid)
+
     def addresses(self, with_usage=False):
         """
         Returns full list of already generated addresses.
@@ -284,3 +293,92 @@ class Wallet(object):
         Returns UTXO statistics as a tuple of ``(total_balance, histogram, scale)``.
         """
         return self.backend.utxo_stats(self.wid)
+
+
+class AsyncWalletService(WalletService):
+    """
+    The :mod:`asyncio` counterpart of :class:`WalletService`, to be used with asynchronous
+    backends like :class:`AsyncWalletREST <cardano.backends.walletrest.aio.AsyncWalletREST>`.
+    All methods are coroutines.
+
+    :param backend: the asynchronous backend used to handle the underlying service layer
+    """
+
+    async def wallets(self):
+        """
+        Returns the list of all :class:`AsyncWallets <AsyncWallet>` handled by the backend.
+        """
+        return [
+            AsyncWallet(wid, backend=self.backend)
+            for wid in await self.backend.wallet_ids()
+        ]
+
+    async def wallet(self, wid, passphrase=None):
+        """
+        Returns the wallet of given ID, connected to the backend and equipped with the passphrase
+        if given. Raises :class:`ValueError` if the wallet doesn't exist.
+
+        :param wid:             The wallet ID (hex string)
+        :param passphrase:      The wallet passphrase for spending operations (plain text string)
+        :rtype:                 :class:`AsyncWallet`
+        """
+        if not await self.backend.wallet_exists(wid):
+            raise ValueError("Wallet of id '{:s}' doesn't exist.".format(wid))
+        return AsyncWallet(wid, backend=self.backend, passphrase=passphrase)
+
+
+class AsyncWallet(Wallet):
+    """
+    The :mod:`asyncio` counterpart of :class:`Wallet`. It offers the same methods, however all
+    of those which involve the backend are coroutines and have to be awaited.
+
+    As the constructor cannot query the backend, it doesn't check whether the wallet exists.
+    Use :meth:`AsyncWalletService.wallet` to obtain a verified instance.
+
+    :param wid:         the wallet ID
+    :param backend:     the asynchronous backend used to handle the underlying service layer
+    :param passphrase:  the passphrase protecting the wallet's spending functionality, not required
+                        for read-only operations.
+    """
+
+    def __init__(self, wid, backend, passphrase=None):
+        self.wid = wid
+        self.backend = backend
+        self.passphrase = passphrase or self.passphrase
+        self.transactions = AsyncTransactionManager(self.wid, self.backend)
+
+    async def addresses(self, with_usage=False):
+        """
+        Returns full list of already generated addresses.
+
+        :param with_usage:  A :class:`bool` indicating whether to retrieve used/unused address
+                            status too.
+        :rtype:     :class:`list` of :class:`Address <cardano.address.Address>` objects when
+                    ``with_usage == False`` and of (:class:`Address <cardano.address.address>`,
+                    :class:`bool`) tuples otherwise.
+        """
+        addresses = await self.backend.addresses(self.wid)
+        if with_usage:
+            return [(Address(addr[0], wallet=self), addr[1]) for addr in addresses]
+        return [Address(addr[0], wallet=self) for addr in addresses]
+
+    async def first_unused_address(self):
+        """
+        Returns the first unused address. See :meth:`Wallet.first_unused_address` for details.
+        """
+        return next(filter(lambda a: not a[1], await self.addresses(with_usage=True)))[
+            0
+        ]
+
+    async def stake_pools(self, stake=None):
+        """
+        Returns a list of known stake pools ordered by descending rewards.
+
+        :param stake:   The amount of ADA to be staked. Optional. If omitted, the wallet's total
+                        balance will be used instead.
+        :type stake:    :class:`Decimal`
+        :rtype:         :class:`list`
+        """
+        return await self.backend.stake_pools(
+            self.wid, stake if stake is not None else (await self.balance()).total
+        )
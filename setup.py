@@ -30,6 +30,10 @@ setup(
     url="https://github.com/emesik/cardano-python/",
     long_description=open("README.rst", "rb").read().decode("utf-8"),
     install_requires=open("requirements.txt", "r").read().splitlines(),
+    extras_require={
+        "async": ["aiohttp"],
+        "frame": ["numpy"],
+    },
     tests_require=open("test_requirements.txt", "r").read().splitlines(),
     setup_requires=[
         "pytest-runner",
@@ -84,6 +84,8 @@ SHELLEY_ERR = [
     #    "stake_test1ura3dk68y6echdmfmnvm8mej8u5truwv8ufmv830w5a45tcsfhtt2",
     # specShelley defaultPhrase "1852H/1815H/0H/2/0" 3
     "stake1u0a3dk68y6echdmfmnvm8mej8u5truwv8ufmv830w5a45tchw5z0e",
+    # a trailing newline in the prefix, with a checksum valid for it
+    "addr\n1vyqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqquuru2g",
 ]
 
 GENERAL_ERR = [
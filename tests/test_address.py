@@ -114,6 +114,42 @@ class TestComparisons(unittest.TestCase):
         self.assertNotEqual(addr1, None)
 
 
+class TestCache(unittest.TestCase):
+    def test_same_object(self):
+        addr = "addr1v8fet8gavr6elqt6q50skkjf025zthqu6vr56l5k39sp9aqlvz2g4"
+        addrobj = address(addr)
+        self.assertIs(address(addr), addrobj)
+        self.assertIs(address(addr.encode()), addrobj)
+        self.assertFalse(hasattr(addrobj, "__dict__"))
+        self.assertEqual(hash(addrobj), hash(addr))
+        wallet = object()
+        bound = address(addr, wallet=wallet)
+        self.assertIsNot(bound, addrobj)
+        self.assertIs(bound.wallet, wallet)
+        self.assertIsNone(addrobj.wallet)
+        self.assertEqual(bound, addrobj)
+
+    def test_trusted(self):
+        addr = "addr1v8fet8gavr6elqt6q50skkjf025zthqu6vr56l5k39sp9aqlvz2g4"
+        trusted = address(addr, trusted=True)
+        self.assertIsInstance(trusted, ShelleyAddress)
+        self.assertIs(address(addr, trusted=True), trusted)
+        self.assertEqual(trusted, address(addr))
+        self.assertEqual(trusted.network_tag, NetworkTag.MAINNET)
+        self.assertEqual(trusted.address_type, AddressType.PaymentKeyHashOnly)
+        self.assertEqual(trusted.hrp, "addr")
+        # not validated until decoded
+        bogus = address("addr1XXX", trusted=True)
+        self.assertEqual(bogus, "addr1XXX")
+        with self.assertRaises(ValueError):
+            bogus.network_tag
+        self.assertRaises(ValueError, address, "addr1XXX")
+
+    def test_invalid_not_cached(self):
+        for _ in range(2):
+            self.assertRaises(ValueError, address, "addr1XXX")
+
+
 class TestShelleyAddressDeserialization(unittest.TestCase):
     def test_mainnet_PaymentKeyHash_StakeKeyHash(self):
         addr = ShelleyAddress(
@@ -326,3 +362,121 @@ class TestShelleyAddressDeserialization(unittest.TestCase):
         self.assertEqual(addr.address_type, AddressType.Stake_ScriptHash)
         self.assertIsInstance(addr.components[0], Hash)
         self.assertIsNone(addr.components[1])
+
+
+class TestShelleyAddressSerialization(unittest.TestCase):
+    PAYMENT = "9493315cd92eb5d8c4304e67b7e16ae36d61d34502694657811a2c8e"
+    STAKE = "337b62cfff6403a06a3acbc34f8c46003c69fe79a3628cefa9c47251"
+    SCRIPT = "c37b1b5dc0669f1d3c61a6fddb2e8fde96be87b881c60bce8e8d542f"
+
+    def test_base(self):
+        self.assertEqual(
+            ShelleyAddress.base(self.PAYMENT, self.STAKE),
+            "addr1qx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer3n0d3vllmyqwsx5wktcd8cc3sq835lu7drv2xwl2wywfgse35a3x",
+        )
+        self.assertEqual(
+            ShelleyAddress.base(self.SCRIPT, self.STAKE, payment_script=True),
+            "addr1z8phkx6acpnf78fuvxn0mkew3l0fd058hzquvz7w36x4gten0d3vllmyqwsx5wktcd8cc3sq835lu7drv2xwl2wywfgs9yc0hh",
+        )
+        self.assertEqual(
+            ShelleyAddress.base(self.PAYMENT, self.SCRIPT, stake_script=True),
+            "addr1yx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzerkr0vd4msrxnuwnccdxlhdjar77j6lg0wypcc9uar5d2shs2z78ve",
+        )
+        addr = ShelleyAddress.base(
+            bytes.fromhex(self.PAYMENT),
+            self.STAKE,
+            network_tag=NetworkTag.TESTNET,
+        )
+        self.assertEqual(
+            addr,
+            "addr_test1qz2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer3n0d3vllmyqwsx5wktcd8cc3sq835lu7drv2xwl2wywfgs68faae",
+        )
+        self.assertEqual(addr.hrp, "addr_test")
+        self.assertEqual(addr.address_type, AddressType.PaymentKeyHash_StakeKeyHash)
+        self.assertEqual(str(addr.components[1]), self.STAKE)
+
+    def test_pointer(self):
+        addr = ShelleyAddress.pointer(self.PAYMENT, (2498243, 27, 3))
+        self.assertEqual(
+            addr, "addr1gx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer5pnz75xxcrzqf96k"
+        )
+        self.assertEqual(addr.components[1].slot_num, 2498243)
+        self.assertEqual(
+            ShelleyAddress.pointer(
+                self.SCRIPT, Pointer.from_values(2498243, 27, 3), script=True
+            ),
+            "addr128phkx6acpnf78fuvxn0mkew3l0fd058hzquvz7w36x4gtupnz75xxcrtw79hu",
+        )
+        self.assertRaises(ValueError, ShelleyAddress.pointer, self.PAYMENT, (-1, 0, 0))
+
+    def test_enterprise_and_reward(self):
+        self.assertEqual(
+            ShelleyAddress.enterprise(self.PAYMENT),
+            "addr1vx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzers66hrl8",
+        )
+        self.assertEqual(
+            ShelleyAddress.enterprise(self.SCRIPT, script=True),
+            "addr1w8phkx6acpnf78fuvxn0mkew3l0fd058hzquvz7w36x4gtcyjy7wx",
+        )
+        self.assertEqual(
+            ShelleyAddress.reward(self.STAKE),
+            "stake1uyehkck0lajq8gr28t9uxnuvgcqrc6070x3k9r8048z8y5gh6ffgw",
+        )
+        self.assertEqual(
+            ShelleyAddress.reward(self.SCRIPT, script=True),
+            "stake178phkx6acpnf78fuvxn0mkew3l0fd058hzquvz7w36x4gtcccycj5",
+        )
+
+    def test_roundtrip(self):
+        for addrstr in (
+            "addr_test1gz2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer5pnz75xxcrdw5vky",
+            "stake_test17rphkx6acpnf78fuvxn0mkew3l0fd058hzquvz7w36x4gtcljw6kf",
+        ):
+            addr = ShelleyAddress(addrstr)
+            self.assertEqual(
+                ShelleyAddress.from_components(
+                    addr.network_tag, addr.address_type, addr.components, hrp=addr.hrp
+                ),
+                addrstr,
+            )
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, ShelleyAddress.enterprise, self.PAYMENT[:-2])
+        self.assertRaises(
+            ValueError,
+            ShelleyAddress.from_components,
+            NetworkTag.MAINNET,
+            AddressType.PaymentKeyHash_Pointer,
+            (Hash(bytes.fromhex(self.PAYMENT)), None),
+        )
+        self.assertRaises(
+            ValueError,
+            ShelleyAddress.from_components,
+            NetworkTag.MAINNET,
+            AddressType.PaymentKeyHashOnly,
+            (Hash(bytes.fromhex(self.PAYMENT)), None),
+            hrp="addr_test",
+        )
+
+    def test_raw_bytes(self):
+        addrstr = "addr1gx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer5pnz75xxcrzqf96k"
+        raw = bytes.fromhex("41" + self.PAYMENT + "8198bd431b03")
+        self.assertEqual(ShelleyAddress(addrstr).raw_bytes, raw)
+        self.assertEqual(address(addrstr, trusted=True).raw_bytes, raw)
+        self.assertEqual(
+            ShelleyAddress.pointer(self.PAYMENT, (2498243, 27, 3)).raw_bytes, raw
+        )
+        ptr = Pointer(memoryview(raw)[29:])
+        self.assertEqual(
+            (ptr.slot_num, ptr.transaction_index, ptr.output_index), (2498243, 27, 3)
+        )
+        self.assertEqual(bytes(ptr), raw[29:])
+
+    def test_hash(self):
+        h = Hash(memoryview(bytes.fromhex(self.PAYMENT)))
+        self.assertEqual(h.raw, bytes.fromhex(self.PAYMENT))
+        self.assertEqual(str(h), self.PAYMENT)
+        self.assertEqual(h, Hash(bytes.fromhex(self.PAYMENT)))
+        self.assertNotEqual(h, Hash(bytes.fromhex(self.STAKE)))
+        self.assertEqual(len({h, Hash(bytes.fromhex(self.PAYMENT))}), 1)
+        self.assertEqual(ShelleyAddress.enterprise(self.PAYMENT).components[0], h)
@@ -0,0 +1,326 @@
+import asyncio
+import datetime
+from decimal import Decimal
+import re
+import unittest
+
+from aioresponses import aioresponses
+import responses
+
+from cardano import exceptions
+from cardano.address import Address
+from cardano.backends.walletrest import WalletREST
+from cardano.backends.walletrest.aio import AsyncWalletREST
+from cardano.simpletypes import Balance, StakingStatus
+from cardano.transaction import AsyncTransactionManager, Transaction
+from cardano.wallet import AsyncWalletService, AsyncWallet, WalletService
+
+from .base import JSONTestCase
+
+
+class TestAsyncSinglewallet(JSONTestCase, unittest.IsolatedAsyncioTestCase):
+    service = None
+    passphrase = "pass.12345678"
+    data_subdir = "test_rest_backend"
+    wid = "eff9cc89621111677a501493ace8c3f05608c0ce"
+
+    async def asyncSetUp(self):
+        self.service = AsyncWalletService(AsyncWalletREST())
+
+    async def asyncTearDown(self):
+        await self.service.backend.close()
+
+    def _url(self, path):
+        return "".join([self.service.backend.base_url, path])
+
+    async def test_retrieve_wallet(self):
+        with aioresponses() as m:
+            m.get(
+                self._url("wallets/{:s}".format(self.wid)),
+                payload=self._read(
+                    "test_retrieve_wallet-00-GET_wallets_{:s}.json".format(self.wid)
+                ),
+                repeat=True,
+            )
+            wallet = await self.service.wallet(self.wid)
+            self.assertIsInstance(wallet, AsyncWallet)
+            self.assertEqual(wallet.wid, self.wid)
+            self.assertAlmostEqual(await wallet.sync_progress(), Decimal(1), places=2)
+            self.assertIsInstance(await wallet.balance(), Balance)
+            status, nexts = await wallet.staking_status()
+            self.assertIsInstance(status, StakingStatus)
+            self.assertFalse(status.delegating)
+            self.assertEqual(len(nexts), 0)
+
+    async def test_wallet_not_found(self):
+        with aioresponses() as m:
+            m.get(
+                self._url("wallets/{:s}".format(self.wid)),
+                status=404,
+                payload={"code": "no_such_wallet", "message": "No such wallet"},
+            )
+            with self.assertRaises(ValueError):
+                await self.service.wallet(self.wid)
+
+    async def test_coalesce_requests(self):
+        backend = AsyncWalletREST(coalesce_requests=True)
+
+        async def _slow(url, **kwargs):
+            await asyncio.sleep(0.1)
+
+        with aioresponses() as m:
+            m.get(
+                self._url("wallets/{:s}".format(self.wid)),
+                payload=self._read(
+                    "test_retrieve_wallet-00-GET_wallets_{:s}.json".format(self.wid)
+                ),
+                callback=_slow,
+                repeat=True,
+            )
+            results = await asyncio.gather(
+                *(backend.balance(self.wid) for i in range(5))
+            )
+            calls = sum(len(c) for c in m.requests.values())
+        await backend.close()
+        self.assertEqual(len(results), 5)
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(calls, 1)
+
+    async def test_coalesce_requests_leader_cancelled(self):
+        backend = AsyncWalletREST(coalesce_requests=True)
+
+        async def _slow(url, **kwargs):
+            await asyncio.sleep(0.1)
+
+        with aioresponses() as m:
+            m.get(
+                self._url("wallets/{:s}".format(self.wid)),
+                payload=self._read(
+                    "test_retrieve_wallet-00-GET_wallets_{:s}.json".format(self.wid)
+                ),
+                callback=_slow,
+                repeat=True,
+            )
+            leader = asyncio.ensure_future(backend.balance(self.wid))
+            await asyncio.sleep(0.01)
+            follower = asyncio.ensure_future(backend.balance(self.wid))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            balance = await follower
+        await backend.close()
+        self.assertTrue(leader.cancelled())
+        self.assertIsInstance(balance, Balance)
+
+    async def test_list_addresses_with_usage(self):
+        wallet = AsyncWallet(self.wid, backend=self.service.backend)
+        with aioresponses() as m:
+            m.get(
+                self._url("wallets/{:s}/addresses".format(self.wid)),
+                payload=self._read(
+                    "test_list_addresses_with_usage-10-GET_addresses_{:s}.json".format(
+                        self.wid
+                    )
+                ),
+            )
+            addresses = await wallet.addresses(with_usage=True)
+        for addr, used in addresses:
+            self.assertIsInstance(addr, Address)
+            self.assertIsInstance(used, bool)
+
+    @responses.activate
+    async def test_list_transactions_same_as_sync(self):
+        txdata = self._read(
+            "test_list_transactions_with_assets-10-GET_transactions_{:s}.json".format(
+                self.wid
+            )
+        )
+        adata = self._read(
+            "test_list_transactions_with_assets-20-GET_addresses_{:s}.json".format(
+                self.wid
+            )
+        )
+        sync_backend = WalletREST()
+        responses.add(
+            responses.GET,
+            "".join([sync_backend.base_url, "wallets/{:s}".format(self.wid)]),
+            json=self._read(
+                "test_list_transactions_with_assets-00-GET_wallets_{:s}.json".format(
+                    self.wid
+                )
+            ),
+        )
+        responses.add(
+            responses.GET,
+            "".join(
+                [sync_backend.base_url, "wallets/{:s}/transactions".format(self.wid)]
+            ),
+            json=txdata,
+        )
+        responses.add(
+            responses.GET,
+            "".join([sync_backend.base_url, "wallets/{:s}/addresses".format(self.wid)]),
+            json=adata,
+        )
+        sync_txns = WalletService(sync_backend).wallet(self.wid).transactions()
+
+        wallet = AsyncWallet(self.wid, backend=self.service.backend)
+        with aioresponses() as m:
+            m.get(
+                self._url("wallets/{:s}/transactions".format(self.wid)), payload=txdata
+            )
+            m.get(
+                self._url("wallets/{:s}/addresses".format(self.wid)),
+                payload=adata,
+            )
+            txns = await wallet.transactions()
+        self.assertEqual(len(txns), 4)
+        for tx, stx in zip(txns, sync_txns):
+            self.assertIsInstance(tx, Transaction)
+            self.assertEqual(tx.txid, stx.txid)
+            self.assertEqual(tx.inserted_at, stx.inserted_at)
+            self.assertEqual(tx.amount_in, stx.amount_in)
+            self.assertEqual(tx.amount_out, stx.amount_out)
+            self.assertEqual(len(tx.local_outputs), len(stx.local_outputs))
+
+    async def test_iter_transactions(self):
+        txmanager = AsyncTransactionManager(self.wid, self.service.backend)
+        with aioresponses() as m:
+            m.get(
+                self._url("network/parameters"),
+                payload=self._read(
+                    "test_iter_transactions-00-GET_network_parameters.json"
+                ),
+            )
+            m.get(
+                re.compile(
+                    re.escape(self._url("wallets/{:s}/transactions?".format(self.wid)))
+                ),
+                payload=list(
+                    reversed(
+                        self._read(
+                            "test_list_transactions_with_assets-10-GET_transactions_{:s}.json".format(
+                                self.wid
+                            )
+                        )
+                    )
+                ),
+            )
+            m.get(
+                self._url("wallets/{:s}/addresses".format(self.wid)),
+                payload=self._read(
+                    "test_list_transactions_with_assets-20-GET_addresses_{:s}.json".format(
+                        self.wid
+                    )
+                ),
+            )
+            txns = [
+                tx
+                async for tx in txmanager.iter(
+                    window=datetime.timedelta(days=36500),
+                    txid="88633270f854eea5b2f35a863d748b294299deecf62ec9629ff08fca87fff45c",
+                )
+            ]
+        self.assertEqual(len(txns), 1)
+        self.assertIsInstance(txns[0], Transaction)
+        with self.assertRaises(ValueError):
+            async for tx in txmanager.iter(window=datetime.timedelta(0)):
+                pass
+
+    async def test_transactions_by_id(self):
+        wallet = AsyncWallet(self.wid, backend=self.service.backend)
+        txdata = self._read(
+            "test_list_transactions_with_assets-10-GET_transactions_{:s}.json".format(
+                self.wid
+            )
+        )
+        with aioresponses() as m:
+            for txd in txdata:
+                m.get(
+                    self._url(
+                        "wallets/{:s}/transactions/{:s}".format(self.wid, txd["id"])
+                    ),
+                    payload=txd,
+                )
+            m.get(
+                self._url("wallets/{:s}/addresses".format(self.wid)),
+                payload=self._read(
+                    "test_list_transactions_with_assets-20-GET_addresses_{:s}.json".format(
+                        self.wid
+                    )
+                ),
+            )
+            txns = await wallet.transactions(txid=[txd["id"] for txd in txdata])
+        self.assertEqual([tx.txid for tx in txns], [txd["id"] for txd in txdata])
+
+    async def test_transfer_multiple(self):
+        wallet = AsyncWallet(self.wid, backend=self.service.backend)
+        with aioresponses() as m:
+            m.post(
+                self._url("wallets/{:s}/transactions".format(self.wid)),
+                payload=self._read(
+                    "test_transfer_multiple-10-POST_transfer_{:s}.json".format(self.wid)
+                ),
+            )
+            m.get(
+                self._url("wallets/{:s}/addresses".format(self.wid)),
+                payload=self._read(
+                    "test_transfer_multiple-20-GET_addresses_{:s}.json".format(self.wid)
+                ),
+            )
+            txn = await wallet.transfer_multiple(
+                (
+                    (
+                        "addr_test1qqr585tvlc7ylnqvz8pyqwauzrdu0mxag3m7q56grgmgu7sxu2hyfhlkwuxupa9d5085eunq2qywy7hvmvej456flknswgndm3",
+                        Decimal("1.234567"),
+                    ),
+                    (
+                        "addr_test1qqd86dlwasc5kwe39m0qvu4v6krd24qek0g9pv9f2kq9x28d56vd3zqzthdaweyrktfm3h5cz4je9h5j6s0f24pryswqgepa9e",
+                        Decimal("2.345678"),
+                    ),
+                ),
+                passphrase=self.passphrase,
+            )
+        self.assertIsInstance(txn, Transaction)
+        self.assertEqual(len(txn.local_inputs), 1)
+        self.assertEqual(len(txn.local_outputs), 3)
+        self.assertEqual(txn.amount_in, Decimal("0"))
+        self.assertEqual(txn.amount_out, Decimal("1.234567"))
+
+    async def test_stake_pools(self):
+        wallet = AsyncWallet(self.wid, backend=self.service.backend)
+        with aioresponses() as m:
+            m.get(
+                self._url("wallets/{:s}".format(self.wid)),
+                payload=self._read(
+                    "test_stake_pools-00-GET_wallets_{:s}.json".format(self.wid)
+                ),
+            )
+            m.get(
+                self._url("stake-pools?stake=1054211650"),
+                payload=self._read(
+                    "test_stake_pools-10-GET_stake_pools_{:s}.json".format(self.wid)
+                ),
+            )
+            pools = await wallet.stake_pools()
+        self.assertEqual(len(pools), 11)
+        self.assertEqual(pools[0].rewards.expected, Decimal("0.193229"))
+
+    async def test_unstake_without_withdrawal(self):
+        wallet = AsyncWallet(self.wid, backend=self.service.backend)
+        with aioresponses() as m:
+            m.delete(
+                self._url("stake-pools/*/wallets/{:s}".format(self.wid)),
+                status=403,
+                payload=self._read(
+                    "test_unstake_without_withdrawal-10-DELETE_stake-pools_wallets_{:s}.json".format(
+                        self.wid
+                    )
+                ),
+            )
+            with self.assertRaises(exceptions.NonNullRewards):
+                await wallet.unstake(passphrase=self.passphrase)
+
+    async def test_missing_passphrase(self):
+        wallet = AsyncWallet(self.wid, backend=self.service.backend)
+        with self.assertRaises(exceptions.MissingPassphrase):
+            await wallet.unstake()
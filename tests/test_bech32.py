@@ -0,0 +1,44 @@
+import unittest
+
+from cardano.address import address
+from cardano.address import bech32
+
+ADDR = "addr1qx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer3n0d3vllmyqwsx5wktcd8cc3sq835lu7drv2xwl2wywfgse35a3x"
+# the same address with one character changed, making the checksum invalid
+BAD_ADDR = ADDR[:10] + ("q" if ADDR[10] != "q" else "p") + ADDR[11:]
+
+
+class TestBech32(unittest.TestCase):
+    def test_decode(self):
+        hrp, data = bech32.bech32_decode(ADDR)
+        self.assertEqual(hrp, "addr")
+        self.assertEqual(len(data), len(ADDR) - len("addr1") - 6)
+        self.assertEqual(bech32.bech32_decode(ADDR.upper()), (hrp, data))
+
+    def test_polymod(self):
+        hrp, data = bech32.bech32_decode(ADDR)
+        checksum = [bech32.CHARSET.index(c) for c in ADDR[-6:]]
+        self.assertEqual(
+            bech32.bech32_polymod(bech32.bech32_hrp_expand(hrp) + data + checksum), 1
+        )
+
+    def test_invalid(self):
+        for bech in (
+            BAD_ADDR,
+            "addr1",
+            "1qqqqqqqq",
+            ADDR[:20] + ADDR[20:].upper(),
+            ADDR[:-1] + "b",
+            "addr \x7f1" + ADDR[5:],
+        ):
+            self.assertEqual(bech32.bech32_decode(bech), (None, None))
+            self.assertFalse(bech32.bech32_validate(bech))
+        self.assertRaises(ValueError, address, BAD_ADDR)
+
+    def test_many(self):
+        bechs = [ADDR, BAD_ADDR, ADDR.upper()]
+        self.assertEqual(list(bech32.validate_many(bechs)), [True, False, True])
+        decoded = list(bech32.decode_many(iter(bechs)))
+        self.assertEqual(decoded[0], bech32.bech32_decode(ADDR))
+        self.assertEqual(decoded[1], (None, None))
+        self.assertEqual(decoded[2], decoded[0])
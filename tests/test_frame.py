@@ -0,0 +1,107 @@
+import collections
+import datetime
+import unittest
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from cardano.backends.walletrest import WalletREST
+from cardano.numbers import to_lovelaces
+from cardano.transaction import Transaction, TxFilter
+
+from .base import JSONTestCase
+
+if numpy is not None:
+    from cardano.frame import TransactionFrame
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestTransactionFrame(JSONTestCase):
+    data_subdir = "test_rest_backend"
+
+    def setUp(self):
+        backend = WalletREST()
+        addresses = [
+            ad["id"]
+            for ad in self._read(
+                "test_list_transactions_with_assets-20-GET_addresses_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            )
+        ]
+        self.txns = [
+            backend._txdata2tx(txd, addresses=addresses)
+            for txd in self._read(
+                "test_list_transactions_with_assets-10-GET_transactions_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            )
+        ]
+        self.txns.append(
+            Transaction(
+                txid="7000bceff12b142009d6967259bddfb93afea9c3d1bfac7cc3a0306785c24ee8",
+                status="pending",
+            )
+        )
+        self.frame = TransactionFrame.from_transactions(self.txns)
+
+    def test_columns(self):
+        self.assertEqual(len(self.frame), 5)
+        self.assertEqual(self.frame["absolute_slot"].dtype, numpy.int64)
+        self.assertEqual(list(self.frame["txid"]), [tx.txid for tx in self.txns])
+        self.assertEqual(list(self.frame["confirmed"]), [True] * 4 + [False])
+        self.assertEqual(self.frame["epoch"][-1], -1)
+        for name in ("amount_in", "amount_out", "fee"):
+            self.assertEqual(
+                list(self.frame[name]),
+                [to_lovelaces(getattr(tx, name) or 0) for tx in self.txns],
+            )
+        self.assertEqual(
+            self.frame.sum("amount_in"),
+            sum(to_lovelaces(tx.amount_in) for tx in self.txns),
+        )
+
+    def test_filter_same_as_txfilter(self):
+        for params in (
+            {},
+            {"unconfirmed": True},
+            {"unconfirmed": True, "confirmed": False},
+            {"min_epoch": 120},
+            {"max_epoch": 122, "min_slot": 100000},
+            {"min_absolute_slot": 21530800, "max_height": 2447816},
+            {"max_epoch": float("inf")},
+            {"min_time": datetime.datetime(2021, 3, 16, 13, 6, 56)},
+            {
+                "txid": [
+                    "0b048162778e29e98d833d948a3be7f18f9ce8693d7ee407c7d38b6ef2a5a264",
+                    "d194e4944f84792b37cb4ceb4f6efc2c6107adc52a05b7bffa6b2d72571a4570",
+                ]
+            },
+            {
+                "src_addr": "addr_test1qr9ujxmsvdya6r4e9lxlu4n37svn52us7z8uzqdkhw8muqld56vd3zqzthdaweyrktfm3h5cz4je9h5j6s0f24pryswqzuzvzt"
+            },
+            {
+                "dest_addr": [
+                    "addr_test1qqr585tvlc7ylnqvz8pyqwauzrdu0mxag3m7q56grgmgu7sxu2hyfhlkwuxupa9d5085eunq2qywy7hvmvej456flknswgndm3",
+                    "addr_test1qqaaeru7xswhg9n9653ajpcryxl0334ryfp3kpuvd6aw0hhd56vd3zqzthdaweyrktfm3h5cz4je9h5j6s0f24pryswqukuem0",
+                ],
+                "max_epoch": 122,
+            },
+        ):
+            self.assertEqual(
+                list(self.frame.filter(**params)["txid"]),
+                [tx.txid for tx in TxFilter(**params).filter(self.txns)],
+                params,
+            )
+        self.assertEqual(len(self.frame.filter(TxFilter(min_epoch=200))), 0)
+        with self.assertRaises(TypeError):
+            self.frame.mask(TxFilter(min_epoch=200), max_epoch=122)
+
+    def test_sum_by(self):
+        epochs, sums = self.frame.filter().sum_by("epoch", "amount_in")
+        expected = collections.defaultdict(int)
+        for tx in TxFilter().filter(self.txns):
+            expected[tx.inserted_at.epoch] += to_lovelaces(tx.amount_in)
+        self.assertEqual(list(epochs), sorted(expected))
+        self.assertEqual(list(sums), [expected[e] for e in sorted(expected)])
+        epochs, sums = self.frame.filter(min_epoch=200).sum_by("epoch", "fee")
+        self.assertEqual(len(epochs), 0)
+        self.assertEqual(len(sums), 0)
@@ -0,0 +1,66 @@
+from decimal import Decimal
+import json
+import unittest
+
+from cardano.backends.walletrest.jsonstream import ArrayParser, iter_array
+
+
+class ArrayParserTestCase(unittest.TestCase):
+    document = [
+        {"amount": 1.5, "name": "żółw ✓", "nested": [{"a": None}, []]},
+        [1, 2],
+        3,
+        "x",
+        None,
+        True,
+        12345,
+    ]
+
+    def _chunks(self, data, size):
+        return (data[i : i + size] for i in range(0, len(data), size))
+
+    def test_chunk_sizes(self):
+        data = json.dumps(self.document, indent=2).encode()
+        expected = json.loads(data, parse_float=Decimal)
+        for size in (1, 2, 3, 7, 64, len(data)):
+            self.assertEqual(list(iter_array(self._chunks(data, size))), expected)
+
+    def test_split_numbers(self):
+        data = b"[1.5e3, -12.25E-2,0.001 ,7]"
+        expected = json.loads(data, parse_float=Decimal)
+        for pos in range(1, len(data)):
+            self.assertEqual(
+                list(iter_array([data[:pos], data[pos:]])), expected, data[:pos]
+            )
+        self.assertEqual(list(iter_array([b"[1.5e", b"3]"])), [Decimal("1.5e3")])
+
+    def test_decimal(self):
+        (item,) = iter_array([b'[{"amount": 0.1}]'])
+        self.assertIsInstance(item["amount"], Decimal)
+        self.assertEqual(item["amount"], Decimal("0.1"))
+
+    def test_elements_as_they_arrive(self):
+        parser = ArrayParser()
+        self.assertEqual(parser.feed(b'[{"a": 1}, {"b"'), [{"a": 1}])
+        self.assertEqual(parser.feed(b": 2}, 12"), [{"b": 2}])
+        self.assertEqual(parser.feed(b"3]"), [123])
+        self.assertEqual(parser.close(), [])
+
+    def test_empty(self):
+        self.assertEqual(list(iter_array([b" [ ", b"] "])), [])
+        self.assertEqual(list(iter_array([b"[]"])), [])
+
+    def test_invalid(self):
+        for doc in (
+            b"",
+            b"{}",
+            b"[1",
+            b"[1,]",
+            b"[,1]",
+            b"[1 2]",
+            b"[1] x",
+            b'["a',
+            b"[1.5e]",
+        ):
+            with self.assertRaises(ValueError):
+                list(iter_array(self._chunks(doc, 2)))
@@ -1,7 +1,7 @@
 from decimal import Decimal
 import unittest
 
-from cardano.numbers import to_lovelaces, from_lovelaces, as_ada
+from cardano.numbers import Lovelace, to_lovelaces, from_lovelaces, as_ada
 
 
 class NumbersTestCase(unittest.TestCase):
@@ -24,3 +24,43 @@ class NumbersTestCase(unittest.TestCase):
     def test_rounding(self):
         self.assertEqual(to_lovelaces(Decimal("1.0000004")), 1000000)
         self.assertEqual(as_ada(Decimal("1.0000014")), Decimal("1.000001"))
+
+    def test_lovelace(self):
+        amount = Lovelace(1500000)
+        self.assertEqual(amount.ada, Decimal("1.5"))
+        self.assertEqual(to_lovelaces(amount), 1500000)
+        self.assertEqual(as_ada(amount), Decimal("1.5"))
+        self.assertEqual(from_lovelaces(amount), Decimal("1.5"))
+        self.assertEqual(repr(amount), "Lovelace(1500000)")
+        self.assertEqual(str(amount), "1500000")
+        self.assertIsInstance(amount + 1, Lovelace)
+        self.assertIsInstance(1 - amount, Lovelace)
+        self.assertIsInstance(-amount, Lovelace)
+        self.assertIsInstance(sum([amount, amount]), Lovelace)
+        self.assertEqual(sum([amount, amount]), 3000000)
+
+    def test_lovelace_derived(self):
+        amount = Lovelace(3000000)
+        for derived, expected in (
+            (amount // 2, 1500000),
+            (amount / 2, 1500000),
+            (round(amount), 3000000),
+            (round(amount, -6), 3000000),
+            (amount * Decimal("0.5"), 1500000),
+            (amount + Decimal(1), 3000001),
+            (amount - Decimal(1), 2999999),
+            (amount // Decimal("0.7"), 4285714),
+            (amount % 7, 3),
+        ):
+            self.assertIsInstance(derived, Lovelace)
+            self.assertEqual(derived, expected)
+            self.assertEqual(to_lovelaces(derived), expected)
+        # ratios of amounts are plain numbers
+        self.assertNotIsInstance(amount / Lovelace(1000000), Lovelace)
+        self.assertNotIsInstance(amount // Lovelace(1000000), Lovelace)
+        for fn in (
+            lambda: amount / 7,
+            lambda: amount * Decimal("0.3333333"),
+            lambda: amount + Decimal("0.5"),
+        ):
+            self.assertRaises(ValueError, fn)
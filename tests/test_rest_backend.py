@@ -1,13 +1,31 @@
+import copy
+import datetime
+from dateutil.parser import isoparse
+from dateutil.tz import tzutc
 from decimal import Decimal
 import json
 import responses
+import threading
+import time
+import types
+import unittest
+import urllib
 
 from cardano import exceptions
 from cardano.address import Address
-from cardano.backends.walletrest import WalletREST
+from cardano.backends.walletrest import WalletREST, serializers
+from cardano.backends.walletrest.cache import WalletAddresses, WalletSnapshotCache
+from cardano.backends.walletrest.exceptions import NotFound
 from cardano.metadata import Metadata
-from cardano.simpletypes import Epoch, StakingStatus, AssetID
-from cardano.transaction import Transaction
+from cardano.numbers import Lovelace
+from cardano.simpletypes import (
+    AssetID,
+    BlockPosition,
+    Epoch,
+    StakingStatus,
+    WalletInfo,
+)
+from cardano.transaction import Transaction, TransactionManager, Input, Output
 from cardano.wallet import WalletService, Wallet
 
 from .base import JSONTestCase
@@ -167,6 +185,130 @@ class TestSinglewallet(JSONTestCase):
             self.assertGreater(balance.total, 0)
             self.assertIsNone(balance.reward)
 
+    @responses.activate
+    def test_wallet_snapshot_cache(self):
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce"),
+            json=self._read(
+                "test_retrieve_wallet_with_assets-00-GET_wallets_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/transactions"),
+            json=self._read(
+                "test_transfer-10-POST_transfer_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/addresses"),
+            json=self._read(
+                "test_transfer-20-GET_addresses_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+
+        def _wallet_calls():
+            return len(
+                [
+                    c
+                    for c in responses.calls
+                    if c.request.url.endswith(
+                        "eff9cc89621111677a501493ace8c3f05608c0ce"
+                    )
+                ]
+            )
+
+        service = WalletService(WalletREST(wallet_max_age=60))
+        wallet = service.wallet("eff9cc89621111677a501493ace8c3f05608c0ce")
+        self.assertEqual(wallet.balance().total, Decimal("1036.346521"))
+        self.assertEqual(len(wallet.assets()), 14)
+        self.assertAlmostEqual(wallet.sync_progress(), Decimal("0.9944"), places=4)
+        self.assertFalse(wallet.staking_status()[0].delegating)
+        self.assertEqual(_wallet_calls(), 1)
+        wallet.transfer(
+            "addr_test1qqr585tvlc7ylnqvz8pyqwauzrdu0mxag3m7q56grgmgu7sxu2hyfhlkwuxupa9d5085eunq2qywy7hvmvej456flknswgndm3",
+            1,
+            passphrase=self.passphrase,
+        )
+        wallet.balance()
+        wallet.sync_progress()
+        self.assertEqual(_wallet_calls(), 2)
+
+    @responses.activate
+    def test_wallet_info(self):
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce"),
+            json=self._read(
+                "test_retrieve_wallet_with_assets-00-GET_wallets_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        wallet = self.service.wallet("eff9cc89621111677a501493ace8c3f05608c0ce")
+        info = wallet.info()
+        self.assertIsInstance(info, WalletInfo)
+        self.assertEqual(info.id, "eff9cc89621111677a501493ace8c3f05608c0ce")
+        self.assertEqual(info.name, "test wallet")
+        self.assertEqual(info.balance, wallet.balance())
+        self.assertEqual(info.assets, wallet.assets())
+        self.assertEqual(
+            (info.staking_status, info.staking_next), wallet.staking_status()
+        )
+        self.assertEqual(info.sync_progress, wallet.sync_progress())
+        self.assertEqual(
+            info.tip,
+            BlockPosition(
+                epoch=149,
+                slot=415161,
+                absolute_slot=34413561,
+                height=2827011,
+                time=datetime.datetime(2021, 8, 12, 15, 39, 37, tzinfo=tzutc()),
+            ),
+        )
+        self.assertEqual(info.address_pool_gap, 20)
+
+    @responses.activate
+    def test_coalesce_requests(self):
+        wdata = self._read(
+            "test_retrieve_wallet-00-GET_wallets_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+        )
+
+        def _slow_wallet(request):
+            time.sleep(0.2)
+            return (200, {}, json.dumps(wdata))
+
+        responses.add_callback(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce"),
+            callback=_slow_wallet,
+            content_type="application/json",
+        )
+        backend = WalletREST(coalesce_requests=True)
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    backend.balance("eff9cc89621111677a501493ace8c3f05608c0ce")
+                )
+            )
+            for i in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(results), 5)
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(len(responses.calls), 1)
+        # completed requests are not reused
+        backend.balance("eff9cc89621111677a501493ace8c3f05608c0ce")
+        self.assertEqual(len(responses.calls), 2)
+
     @responses.activate
     def test_list_addresses(self):
         responses.add(
@@ -277,6 +419,9 @@ class TestSinglewallet(JSONTestCase):
         txns = wallet.transactions()
         self.assertEqual(len(txns), 1)
         self.assertIsInstance(txns[0], Transaction)
+        page = wallet.transactions(limit=1, order="ascending")
+        self.assertEqual([tx.txid for tx in page], [txns[0].txid])
+        self.assertEqual(wallet.transactions(limit=1, offset=1), [])
 
     @responses.activate
     def test_list_transactions_with_assets(self):
@@ -310,6 +455,628 @@ class TestSinglewallet(JSONTestCase):
         for tx in txns:
             self.assertIsInstance(tx, Transaction)
 
+    @responses.activate
+    def test_list_transactions_lovelace(self):
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce"),
+            json=self._read(
+                "test_list_transactions_with_assets-00-GET_wallets_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/transactions"),
+            json=self._read(
+                "test_list_transactions_with_assets-10-GET_transactions_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/addresses"),
+            json=self._read(
+                "test_list_transactions_with_assets-20-GET_addresses_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        wid = "eff9cc89621111677a501493ace8c3f05608c0ce"
+        decimal_wallet = self.service.wallet(wid)
+        lovelace_wallet = WalletService(WalletREST(lovelace_amounts=True)).wallet(wid)
+        balance = lovelace_wallet.balance()
+        self.assertIsInstance(balance.total, Lovelace)
+        self.assertEqual(balance.total.ada, decimal_wallet.balance().total)
+        for ltx, dtx in zip(
+            lovelace_wallet.transactions(), decimal_wallet.transactions()
+        ):
+            self.assertIsInstance(ltx.fee, Lovelace)
+            self.assertEqual(ltx.fee.ada, dtx.fee)
+            for attr in ("amount_in", "amount_out", "local_outputs_sum"):
+                self.assertIsInstance(getattr(ltx, attr), Lovelace)
+                self.assertEqual(getattr(ltx, attr).ada, getattr(dtx, attr))
+            self.assertEqual(ltx.assets, dtx.assets)
+
+    @responses.activate
+    def test_list_transactions_lazy(self):
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce"),
+            json=self._read(
+                "test_list_transactions_with_assets-00-GET_wallets_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/transactions"),
+            json=self._read(
+                "test_list_transactions_with_assets-10-GET_transactions_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/addresses"),
+            json=self._read(
+                "test_list_transactions_with_assets-20-GET_addresses_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        eager = self.service.wallet(
+            "eff9cc89621111677a501493ace8c3f05608c0ce"
+        ).transactions()
+        lazy = (
+            WalletService(WalletREST(lazy_transactions=True))
+            .wallet("eff9cc89621111677a501493ace8c3f05608c0ce")
+            .transactions()
+        )
+        self.assertEqual(len(lazy), len(eager))
+        for ltx, etx in zip(lazy, eager):
+            self.assertEqual(ltx.txid, etx.txid)
+            self.assertEqual(ltx.amount_in, etx.amount_in)
+            self.assertEqual(ltx.amount_out, etx.amount_out)
+            self.assertEqual(ltx.outputs, etx.outputs)
+            self.assertEqual(
+                [(o.txid, o.index) for o in ltx.outputs],
+                [(etx.txid, i) for i in range(len(etx.outputs))],
+            )
+            self.assertEqual(ltx.inputs, etx.inputs)
+            self.assertTrue(all(i.index is not None for i in ltx.inputs))
+            self.assertEqual(ltx.local_outputs, etx.local_outputs)
+            self.assertEqual(ltx.metadata, etx.metadata)
+
+    @responses.activate
+    def test_list_transactions_streamed(self):
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/transactions"),
+            json=self._read(
+                "test_list_transactions_with_assets-10-GET_transactions_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/addresses"),
+            json=self._read(
+                "test_list_transactions_with_assets-20-GET_addresses_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        backend = self.service.backend
+        txns = backend.transactions("eff9cc89621111677a501493ace8c3f05608c0ce")
+        backend.stream_chunk_size = 16
+        backend.invalidate_addresses()
+        small_txns = backend.transactions("eff9cc89621111677a501493ace8c3f05608c0ce")
+        self.assertEqual(len(small_txns), 4)
+        for tx, stx in zip(txns, small_txns):
+            self.assertEqual(tx.txid, stx.txid)
+            self.assertEqual(tx.amount_in, stx.amount_in)
+            self.assertEqual(tx.amount_out, stx.amount_out)
+            self.assertEqual(tx.fee, stx.fee)
+            self.assertEqual(tx.metadata, stx.metadata)
+
+    @responses.activate
+    def test_streamed_request_error(self):
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/addresses"),
+            json={
+                "code": "no_such_wallet",
+                "message": "I couldn't find a wallet with the given id: eff9cc89621111677a501493ace8c3f05608c0ce",
+            },
+            status=404,
+        )
+        with self.assertRaises(NotFound):
+            self.service.backend.addresses("eff9cc89621111677a501493ace8c3f05608c0ce")
+
+    extra_txdata = ()
+
+    def _txwindow_callback(self, request):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)
+        start = isoparse(query["start"][0]) if "start" in query else None
+        end = isoparse(query["end"][0]) if "end" in query else None
+
+        def _time(txd):
+            return isoparse((txd.get("inserted_at") or txd["pending_since"])["time"])
+
+        txdata = list(
+            reversed(
+                self._read(
+                    "test_list_transactions_with_assets-10-GET_transactions_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+                )
+            )
+        )
+        txdata.extend(self.extra_txdata)
+        txns = [
+            txd
+            for txd in txdata
+            if (start is None or start <= _time(txd))
+            and (end is None or _time(txd) <= end)
+        ]
+        return (200, {}, json.dumps(txns))
+
+    @responses.activate
+    def test_iter_transactions(self):
+        responses.add_callback(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/transactions"),
+            callback=self._txwindow_callback,
+            content_type="application/json",
+        )
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/addresses"),
+            json=self._read(
+                "test_list_transactions_with_assets-20-GET_addresses_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        txmanager = TransactionManager(
+            "eff9cc89621111677a501493ace8c3f05608c0ce", self.service.backend
+        )
+        # one of the transactions is exactly at the border of the first two windows
+        txns = txmanager.iter(
+            start=datetime.datetime(2021, 3, 9, 13, 6, 56),
+            end=datetime.datetime(2021, 4, 5, tzinfo=datetime.timezone.utc),
+            window=datetime.timedelta(days=7),
+        )
+        self.assertIsInstance(txns, types.GeneratorType)
+        txns = list(txns)
+        self.assertEqual(
+            [tx.txid for tx in txns],
+            [
+                "0b048162778e29e98d833d948a3be7f18f9ce8693d7ee407c7d38b6ef2a5a264",
+                "88633270f854eea5b2f35a863d748b294299deecf62ec9629ff08fca87fff45c",
+                "a7a16a0653a6a397eb822ff8a3f610b5dabc82c5da2425fcc267f983f0edec88",
+                "d194e4944f84792b37cb4ceb4f6efc2c6107adc52a05b7bffa6b2d72571a4570",
+            ],
+        )
+        txcalls = [c for c in responses.calls if "/transactions?" in c.request.url]
+        self.assertEqual(len(txcalls), 4)
+        self.assertIn("start=2021-03-09T13%3A06%3A56Z", txcalls[0].request.url)
+        self.assertIn("end=2021-04-05T00%3A00%3A00Z", txcalls[-1].request.url)
+        addrcalls = [c for c in responses.calls if "/addresses" in c.request.url]
+        # a later window has outputs to addresses not seen before, which may have been
+        # created after the set was retrieved along with the first window
+        self.assertEqual(len(addrcalls), 2)
+        self.assertEqual(
+            len(
+                list(
+                    txmanager.iter(
+                        start=datetime.datetime(2021, 3, 9, 13, 6, 56),
+                        end=datetime.datetime(2021, 4, 5),
+                        window=datetime.timedelta(days=7),
+                        txid="88633270f854eea5b2f35a863d748b294299deecf62ec9629ff08fca87fff45c",
+                    )
+                )
+            ),
+            1,
+        )
+        for window in (datetime.timedelta(0), datetime.timedelta(days=-1)):
+            with self.assertRaises(ValueError):
+                next(txmanager.iter(window=window))
+
+    @responses.activate
+    def test_iter_transactions_new_address(self):
+        responses.add_callback(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/transactions"),
+            callback=self._txwindow_callback,
+            content_type="application/json",
+        )
+        addrdata = self._read(
+            "test_list_transactions_with_assets-20-GET_addresses_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+        )
+        newaddr = "addr_test1qqaaeru7xswhg9n9653ajpcryxl0334ryfp3kpuvd6aw0hhd56vd3zqzthdaweyrktfm3h5cz4je9h5j6s0f24pryswqukuem0"
+        # the address is created by the wallet after the first window is retrieved
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/addresses"),
+            json=[a for a in addrdata if a["id"] != newaddr],
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/addresses"),
+            json=addrdata,
+            status=200,
+        )
+        txns = list(
+            self.service.backend.iter_transactions(
+                "eff9cc89621111677a501493ace8c3f05608c0ce",
+                start=datetime.datetime(2021, 3, 9, 13, 6, 56),
+                end=datetime.datetime(2021, 4, 5, tzinfo=datetime.timezone.utc),
+                window=datetime.timedelta(days=7),
+            )
+        )
+        self.assertEqual(txns[-1].txid[:6], "d194e4")
+        self.assertIn(newaddr, [out.address for out in txns[-1].local_outputs])
+        self.assertGreater(txns[-1].amount_in, 0)
+
+    @responses.activate
+    def test_iter_transactions_default_start(self):
+        responses.add(
+            responses.GET,
+            self._url("network/parameters"),
+            json=self._read("test_iter_transactions-00-GET_network_parameters.json"),
+            status=200,
+        )
+        responses.add_callback(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/transactions"),
+            callback=self._txwindow_callback,
+            content_type="application/json",
+        )
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/addresses"),
+            json=self._read(
+                "test_list_transactions_with_assets-20-GET_addresses_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        txmanager = TransactionManager(
+            "eff9cc89621111677a501493ace8c3f05608c0ce", self.service.backend
+        )
+        for i in range(2):
+            txns = list(txmanager.iter(window=datetime.timedelta(days=36500)))
+            self.assertEqual(len(txns), 4)
+        txcalls = [c for c in responses.calls if "/transactions?" in c.request.url]
+        self.assertEqual(len(txcalls), 2)
+        self.assertIn("start=2019-07-24T20%3A20%3A16Z", txcalls[0].request.url)
+        self.assertNotIn("end=", txcalls[0].request.url)
+        netcalls = [c for c in responses.calls if "network/parameters" in c.request.url]
+        self.assertEqual(len(netcalls), 1)
+
+    @responses.activate
+    def test_list_transactions_pushdown(self):
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce"),
+            json=self._read(
+                "test_list_transactions_with_assets-00-GET_wallets_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            self._url("network/parameters"),
+            json=self._read("test_iter_transactions-00-GET_network_parameters.json"),
+            status=200,
+        )
+        responses.add_callback(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/transactions"),
+            callback=self._txwindow_callback,
+            content_type="application/json",
+        )
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/addresses"),
+            json=self._read(
+                "test_list_transactions_with_assets-20-GET_addresses_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        wallet = self.service.wallet("eff9cc89621111677a501493ace8c3f05608c0ce")
+
+        def _last_query():
+            txcalls = [c for c in responses.calls if "/transactions" in c.request.url]
+            return urllib.parse.parse_qs(
+                urllib.parse.urlparse(txcalls[-1].request.url).query
+            )
+
+        txns = wallet.transactions(min_epoch=121)
+        self.assertEqual(_last_query()["start"], ["2021-03-20T20:20:16Z"])
+        self.assertNotIn("end", _last_query())
+        self.assertEqual([tx.inserted_at.epoch for tx in txns], [123, 122])
+        txns = wallet.transactions(min_epoch=120, max_epoch=120)
+        self.assertEqual(_last_query()["start"], ["2021-03-15T20:20:16Z"])
+        self.assertEqual(_last_query()["end"], ["2021-03-20T20:20:16Z"])
+        self.assertEqual([tx.inserted_at.epoch for tx in txns], [120])
+        # the time bounds are combined with the epoch ones
+        txns = wallet.transactions(
+            max_epoch=122, min_time=datetime.datetime(2021, 3, 16, 13, 6, 56)
+        )
+        self.assertEqual(_last_query()["start"], ["2021-03-16T13:06:56Z"])
+        self.assertEqual(_last_query()["end"], ["2021-03-30T20:20:16Z"])
+        self.assertEqual([tx.inserted_at.epoch for tx in txns], [122, 120])
+        # the epochs before Shelley cannot be translated, the range is left open
+        txns = wallet.transactions(min_epoch=10, max_epoch=Decimal("inf"))
+        self.assertNotIn("start", _last_query())
+        self.assertEqual(len(txns), 4)
+        # empty range is not even queried
+        ncalls = len(responses.calls)
+        self.assertEqual(
+            wallet.transactions(
+                min_time=datetime.datetime(2021, 4, 1),
+                max_time=datetime.datetime(2021, 3, 1),
+            ),
+            [],
+        )
+        self.assertEqual(len(responses.calls), ncalls)
+        self.assertEqual(
+            len([c for c in responses.calls if "network/parameters" in c.request.url]),
+            1,
+        )
+
+    @responses.activate
+    def test_transactions_by_id(self):
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce"),
+            json=self._read(
+                "test_list_transactions_with_assets-00-GET_wallets_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        for txd in self._read(
+            "test_list_transactions_with_assets-10-GET_transactions_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+        ):
+            responses.add(
+                responses.GET,
+                self._url(
+                    "wallets/eff9cc89621111677a501493ace8c3f05608c0ce/transactions/{:s}".format(
+                        txd["id"]
+                    )
+                ),
+                json=txd,
+                status=200,
+            )
+        responses.add(
+            responses.GET,
+            self._url(
+                "wallets/eff9cc89621111677a501493ace8c3f05608c0ce/transactions/7000bceff12b142009d6967259bddfb93afea9c3d1bfac7cc3a0306785c24ee8"
+            ),
+            json={
+                "code": "no_such_transaction",
+                "message": "I couldn't find a transaction with the given id: 7000bceff12b142009d6967259bddfb93afea9c3d1bfac7cc3a0306785c24ee8",
+            },
+            status=404,
+        )
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/addresses"),
+            json=self._read(
+                "test_list_transactions_with_assets-20-GET_addresses_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        wallet = self.service.wallet("eff9cc89621111677a501493ace8c3f05608c0ce")
+        (tx,) = wallet.transactions(
+            txid="88633270f854eea5b2f35a863d748b294299deecf62ec9629ff08fca87fff45c"
+        )
+        self.assertIsInstance(tx, Transaction)
+        self.assertEqual(
+            tx.txid, "88633270f854eea5b2f35a863d748b294299deecf62ec9629ff08fca87fff45c"
+        )
+        self.assertEqual(len(tx.local_outputs), 1)
+        txns = wallet.transactions(
+            txid=[
+                "0b048162778e29e98d833d948a3be7f18f9ce8693d7ee407c7d38b6ef2a5a264",
+                "7000bceff12b142009d6967259bddfb93afea9c3d1bfac7cc3a0306785c24ee8",
+                "d194e4944f84792b37cb4ceb4f6efc2c6107adc52a05b7bffa6b2d72571a4570",
+                "a7a16a0653a6a397eb822ff8a3f610b5dabc82c5da2425fcc267f983f0edec88",
+            ]
+        )
+        self.assertEqual(
+            [tx.txid for tx in txns],
+            [
+                "d194e4944f84792b37cb4ceb4f6efc2c6107adc52a05b7bffa6b2d72571a4570",
+                "a7a16a0653a6a397eb822ff8a3f610b5dabc82c5da2425fcc267f983f0edec88",
+                "0b048162778e29e98d833d948a3be7f18f9ce8693d7ee407c7d38b6ef2a5a264",
+            ],
+        )
+        # other criteria are still applied
+        self.assertEqual(
+            len(
+                wallet.transactions(
+                    txid="88633270f854eea5b2f35a863d748b294299deecf62ec9629ff08fca87fff45c",
+                    min_epoch=121,
+                )
+            ),
+            0,
+        )
+        self.assertFalse(
+            [
+                c
+                for c in responses.calls
+                if c.request.url.endswith("/transactions")
+                or "/transactions?" in c.request.url
+            ]
+        )
+
+    @responses.activate
+    def test_transactions_by_id_no_wallet(self):
+        responses.add(
+            responses.GET,
+            self._url(
+                "wallets/eff9cc89621111677a501493ace8c3f05608c0ce/transactions/88633270f854eea5b2f35a863d748b294299deecf62ec9629ff08fca87fff45c"
+            ),
+            json={
+                "code": "no_such_wallet",
+                "message": "I couldn't find a wallet with the given id: eff9cc89621111677a501493ace8c3f05608c0ce",
+            },
+            status=404,
+        )
+        with self.assertRaises(NotFound):
+            self.service.backend.transactions_by_id(
+                "eff9cc89621111677a501493ace8c3f05608c0ce",
+                ["88633270f854eea5b2f35a863d748b294299deecf62ec9629ff08fca87fff45c"],
+            )
+
+    @responses.activate
+    def test_incremental_sync(self):
+        responses.add_callback(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/transactions"),
+            callback=self._txwindow_callback,
+            content_type="application/json",
+        )
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/addresses"),
+            json=self._read(
+                "test_list_transactions_with_assets-20-GET_addresses_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        txmanager = TransactionManager(
+            "eff9cc89621111677a501493ace8c3f05608c0ce",
+            self.service.backend,
+            incremental=True,
+        )
+
+        def _last_query():
+            return urllib.parse.parse_qs(
+                urllib.parse.urlparse(responses.calls[-1].request.url).query
+            )
+
+        self.assertEqual(len(txmanager()), 4)
+        self.assertNotIn("start", _last_query())
+        # nothing new, only the newest transaction is listed again
+        self.assertEqual(txmanager.sync(), [])
+        self.assertEqual(_last_query()["start"], ["2021-04-01T10:29:13Z"])
+        self.assertEqual(len(txmanager()), 4)
+
+        # a new transaction appears in the mempool
+        txd = copy.deepcopy(
+            self._read(
+                "test_list_transactions_with_assets-10-GET_transactions_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            )[0]
+        )
+        txd["id"] = "7000bceff12b142009d6967259bddfb93afea9c3d1bfac7cc3a0306785c24ee8"
+        txd["status"] = "pending"
+        inserted_at = txd.pop("inserted_at")
+        txd["pending_since"] = dict(
+            inserted_at, absolute_slot_number=25010210, time="2021-04-02T10:00:00Z"
+        )
+        self.extra_txdata = [txd]
+        changed = txmanager.sync()
+        self.assertEqual([tx.txid for tx in changed], [txd["id"]])
+        self.assertEqual(len(txmanager()), 4)
+        self.assertEqual(len(txmanager(unconfirmed=True)), 5)
+
+        # the pending transaction gets into the ledger, the query starts at the earlier time
+        txd = copy.deepcopy(txd)
+        txd["status"] = "in_ledger"
+        txd["inserted_at"] = dict(
+            inserted_at, absolute_slot_number=25010220, time="2021-04-02T10:00:10Z"
+        )
+        self.extra_txdata = [txd]
+        changed = txmanager.sync()
+        self.assertEqual(_last_query()["start"], ["2021-04-01T10:29:13Z"])
+        self.assertEqual(len(changed), 1)
+        self.assertEqual(changed[0].status, "in_ledger")
+        self.assertEqual(len(txmanager(unconfirmed=True, confirmed=False)), 0)
+        self.assertEqual(txmanager()[0].txid, txd["id"])
+        self.assertEqual(txmanager.sync(), [])
+        self.assertEqual(_last_query()["start"], ["2021-04-02T09:00:10Z"])
+
+        # a pending transaction dropped from the mempool disappears from the history
+        confirmed = txd
+        txd = copy.deepcopy(txd)
+        txd["id"] = "b5876751c9cec196db1d98c2e9335b94ef5974ece7b57f2afed337f9be7ceaad"
+        txd["status"] = "pending"
+        txd["pending_since"]["time"] = "2021-04-02T10:05:00Z"
+        del txd["inserted_at"]
+        self.extra_txdata = [confirmed, txd]
+        self.assertEqual(len(txmanager.sync()), 1)
+        self.assertEqual(len(txmanager(unconfirmed=True)), 6)
+        self.extra_txdata = [confirmed]
+        self.assertEqual(txmanager.sync(), [])
+        self.assertEqual([tx.txid for tx in txmanager.removed], [txd["id"]])
+        self.assertEqual(len(txmanager(unconfirmed=True)), 5)
+        self.assertEqual(txmanager.removed, [])
+
+        # a rollback within the margin removes a transaction older than the newest one
+        newer = copy.deepcopy(confirmed)
+        newer["id"] = "c5876751c9cec196db1d98c2e9335b94ef5974ece7b57f2afed337f9be7ceaad"
+        newer["inserted_at"]["absolute_slot_number"] = 25011000
+        newer["inserted_at"]["time"] = "2021-04-02T10:30:00Z"
+        self.extra_txdata = [confirmed, newer]
+        self.assertEqual([tx.txid for tx in txmanager.sync()], [newer["id"]])
+        self.extra_txdata = [newer]
+        self.assertEqual(txmanager.sync(), [])
+        self.assertEqual(_last_query()["start"], ["2021-04-02T09:30:00Z"])
+        self.assertEqual([tx.txid for tx in txmanager.removed], [confirmed["id"]])
+        self.assertEqual(len(txmanager(unconfirmed=True)), 5)
+
+        # a rollback removes the newest transaction from the ledger
+        self.extra_txdata = []
+        self.assertEqual(txmanager.sync(), [])
+        self.assertEqual([tx.txid for tx in txmanager.removed], [newer["id"]])
+        self.assertEqual(len(txmanager(unconfirmed=True)), 4)
+        self.assertNotIn(confirmed["id"], [tx.txid for tx in txmanager()])
+        # the next query starts before the newest transaction still in the ledger
+        self.assertEqual(_last_query()["start"], ["2021-04-01T10:29:13Z"])
+
+    @responses.activate
+    def test_list_transactions_caches_addresses(self):
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce"),
+            json=self._read(
+                "test_list_transactions_with_assets-00-GET_wallets_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/transactions"),
+            json=self._read(
+                "test_list_transactions_with_assets-10-GET_transactions_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            self._url("wallets/eff9cc89621111677a501493ace8c3f05608c0ce/addresses"),
+            json=self._read(
+                "test_list_transactions_with_assets-20-GET_addresses_eff9cc89621111677a501493ace8c3f05608c0ce.json"
+            ),
+            status=200,
+        )
+
+        def _address_calls():
+            return len(
+                [c for c in responses.calls if c.request.url.endswith("/addresses")]
+            )
+
+        wallet = self.service.wallet("eff9cc89621111677a501493ace8c3f05608c0ce")
+        txns = wallet.transactions()
+        self.assertEqual(_address_calls(), 1)
+        self.assertEqual(
+            [tx.amount_in for tx in wallet.transactions()],
+            [tx.amount_in for tx in txns],
+        )
+        self.assertEqual(_address_calls(), 1)
+        self.service.backend.invalidate_addresses(wallet.wid)
+        wallet.transactions()
+        self.assertEqual(_address_calls(), 2)
+
     @responses.activate
     def test_transfer(self):
         responses.add(
@@ -966,3 +1733,76 @@ class TestDoublewallet(JSONTestCase):
         self.assertEqual(len(tx_in.local_outputs), 1)  # payment
 
         assetsb = self.walb.assets()
+
+
+class TestWalletAddresses(unittest.TestCase):
+    used = "addr_test1qqr585tvlc7ylnqvz8pyqwauzrdu0mxag3m7q56grgmgu7sxu2hyfhlkwuxupa9d5085eunq2qywy7hvmvej456flknswgndm3"
+    unused = "addr_test1qqd86dlwasc5kwe39m0qvu4v6krd24qek0g9pv9f2kq9x28d56vd3zqzthdaweyrktfm3h5cz4je9h5j6s0f24pryswqgepa9e"
+    other = "addr_test1qpyppguxp7vlr77eywsvx9f9l0w07fkx7echm0wldaud9ucxu2hyfhlkwuxupa9d5085eunq2qywy7hvmvej456flkns8556zj"
+
+    def test_receive_to_unused(self):
+        addresses = WalletAddresses([(self.used, True), (self.unused, False)])
+        self.assertFalse(addresses.addresses_may_have_grown([self.used], [self.used]))
+        received, outputs = [self.unused], [self.unused]
+        self.assertTrue(addresses.addresses_may_have_grown(received, outputs))
+        addresses.learn_addresses(received, outputs)
+        self.assertFalse(addresses.addresses_may_have_grown(received, outputs))
+
+    def test_spend_to_unknown(self):
+        addresses = WalletAddresses([(self.used, True), (self.unused, False)])
+        self.assertTrue(addresses.addresses_may_have_grown([], [self.other]))
+        addresses.learn_addresses([], [self.other])
+        self.assertIn(self.other, addresses.foreign)
+        self.assertFalse(addresses.addresses_may_have_grown([], [self.other]))
+
+    def test_receive_to_new(self):
+        # an address created after the set was retrieved, paid by a foreign transaction
+        addresses = WalletAddresses([(self.used, True), (self.unused, False)])
+        self.assertTrue(addresses.addresses_may_have_grown([], [self.other, self.used]))
+        addresses.learn_addresses([], [self.other, self.used])
+        self.assertIn(self.other, addresses.foreign)
+        self.assertNotIn(self.used, addresses.foreign)
+        self.assertFalse(addresses.addresses_may_have_grown([], [self.other]))
+
+    def test_foreign_bounded(self):
+        addresses = WalletAddresses([(self.used, True)])
+        addresses.max_foreign = 1
+        addresses.learn_addresses([], [self.other])
+        self.assertEqual(addresses.foreign, {self.other})
+        addresses.learn_addresses([], [self.unused])
+        self.assertEqual(addresses.foreign, set())
+
+
+class TestWalletSnapshotCache(unittest.TestCase):
+    def test_invalidated_during_request(self):
+        cache = WalletSnapshotCache(60)
+        generation = cache.generation("w")
+        # the wallet changes while the document is being retrieved
+        cache.invalidate("w")
+        self.assertEqual(cache.set("w", "stale", generation), "stale")
+        self.assertIsNone(cache.get("w"))
+        generation = cache.generation("w")
+        cache.invalidate()
+        cache.set("w", "stale", generation)
+        self.assertIsNone(cache.get("w"))
+        cache.set("w", "fresh", cache.generation("w"))
+        self.assertEqual(cache.get("w"), "fresh")
+
+
+class TestSerializers(unittest.TestCase):
+    def test_testnet_byron_address(self):
+        addr = "37btjrVyb4KEgoGCHJ7XFaJRLBRiVuvcrQWPpp4HeaxdTxhKwQjXHNKL43NhXaQNa862BmxSFXZFKqPqbxRc3kCUeTRMwjJevFeCKokBG7A7num5Wh"
+        out = serializers.get_output(
+            {"address": addr, "amount": {"quantity": 1000000, "unit": "lovelace"}}
+        )
+        self.assertIs(type(out.address), Address)
+        self.assertEqual(out.address, addr)
+        inp = serializers.get_input(
+            {
+                "id": "00" * 32,
+                "index": 0,
+                "address": addr,
+                "amount": {"quantity": 1000000, "unit": "lovelace"},
+            }
+        )
+        self.assertEqual(inp.address, addr)
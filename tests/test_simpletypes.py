@@ -1,7 +1,9 @@
 from binascii import hexlify
+import copy
+import pickle
 import unittest
 
-from cardano.simpletypes import AssetID
+from cardano.simpletypes import AssetID, MultiAsset
 
 
 class TestCodec(unittest.TestCase):
@@ -98,3 +100,72 @@ class TestComparisons(unittest.TestCase):
             name, "6b8d07d69639e9413dd637a1a815a7323c69c86abbafb66dbfdb1aa7"
         )
         self.assertNotEqual(asset1, None)
+
+
+class TestInterning(unittest.TestCase):
+    policy = "6b8d07d69639e9413dd637a1a815a7323c69c86abbafb66dbfdb1aa7"
+
+    def test_same_object(self):
+        asset = AssetID(hexlify(b"coin"), self.policy)
+        self.assertIs(AssetID("636f696e", self.policy), asset)
+        self.assertIsNot(AssetID("636f696f", self.policy), asset)
+        self.assertFalse(hasattr(asset, "__dict__"))
+        self.assertEqual(hash(asset), hash("636f696e:{}".format(self.policy)))
+        self.assertIs(pickle.loads(pickle.dumps(asset)), asset)
+        self.assertIs(copy.deepcopy(asset), asset)
+
+    def test_subclass_defaults(self):
+        class Coin(AssetID):
+            asset_name = "636f696e"
+            policy_id = self.policy
+
+        coin = Coin(None, None)
+        self.assertEqual(coin, AssetID("636f696e", self.policy))
+        self.assertIsNot(coin, AssetID("636f696e", self.policy))
+        self.assertIs(Coin(None, None), coin)
+        self.assertEqual(coin.name_bytes, b"coin")
+
+
+class TestMultiAsset(unittest.TestCase):
+    policy = "6b8d07d69639e9413dd637a1a815a7323c69c86abbafb66dbfdb1aa7"
+
+    def setUp(self):
+        self.coin = AssetID(hexlify(b"coin"), self.policy)
+        self.nft = AssetID(hexlify(b"nft"), self.policy)
+
+    def test_construction(self):
+        bundle = MultiAsset([(self.coin, 5), (self.nft, 1), (self.coin, -5)])
+        self.assertEqual(list(bundle), [(self.nft, 1)])
+        self.assertEqual(bundle, {self.nft: 1})
+        self.assertEqual(bundle, MultiAsset({self.nft: 1}))
+        self.assertEqual(hash(bundle), hash(MultiAsset({self.nft: 1})))
+        self.assertEqual(bundle[self.coin], 0)
+        self.assertNotIn(self.coin, bundle)
+        self.assertFalse(MultiAsset())
+        self.assertEqual(
+            MultiAsset([(self.coin, 5), (self.nft, 1)]).by_policy(),
+            {self.policy: {"636f696e": 5, "6e6674": 1}},
+        )
+
+    def test_arithmetic(self):
+        a = MultiAsset([(self.coin, 5), (self.nft, 1)])
+        b = MultiAsset([(self.coin, 3)])
+        self.assertEqual(a + b, {self.coin: 8, self.nft: 1})
+        self.assertEqual(a - b, {self.coin: 2, self.nft: 1})
+        self.assertEqual(b - a, -(a - b))
+        self.assertEqual(a - a, MultiAsset())
+        self.assertEqual(sum([a, b]), a + b)
+        self.assertEqual(MultiAsset.total([a, b, -b]), a)
+
+    def test_comparison(self):
+        a = MultiAsset([(self.coin, 5), (self.nft, 1)])
+        b = MultiAsset([(self.coin, 3)])
+        self.assertTrue(b <= a)
+        self.assertTrue(b < a)
+        self.assertTrue(a >= b)
+        self.assertTrue(a > b)
+        self.assertTrue(a <= a)
+        self.assertFalse(a < a)
+        c = MultiAsset([(self.coin, 6)])
+        self.assertFalse(a <= c)
+        self.assertFalse(c <= a)
@@ -1,8 +1,16 @@
 from decimal import Decimal
 import unittest
 
-from cardano.simpletypes import BlockPosition
-from cardano.transaction import Transaction, Input, Output, TxFilter, validate_txid
+from cardano.simpletypes import AssetID, BlockPosition
+from cardano.transaction import (
+    Deferred,
+    Transaction,
+    TransactionIndex,
+    Input,
+    Output,
+    TxFilter,
+    validate_txid,
+)
 
 
 class BasicTransactionTests(unittest.TestCase):
@@ -78,6 +86,31 @@ class BasicTransactionTests(unittest.TestCase):
         self.assertIsInstance(tx.amount_out, Decimal)
         self.assertEqual(tx.amount_out, Decimal("0"))
 
+    def test_slots(self):
+        tx = Transaction(
+            txid="88633270f854eea5b2f35a863d748b294299deecf62ec9629ff08fca87fff45c"
+        )
+        self.assertFalse(hasattr(tx, "__dict__"))
+        self.assertFalse(hasattr(Input("00" * 32), "__dict__"))
+        self.assertFalse(hasattr(Output(), "__dict__"))
+
+    def test_deferred(self):
+        calls = []
+
+        def decode(tx):
+            calls.append(tx)
+            return [Output(amount=Decimal(1))]
+
+        tx = Transaction(
+            txid="88633270f854eea5b2f35a863d748b294299deecf62ec9629ff08fca87fff45c",
+            outputs=Deferred(decode),
+            local_outputs=Deferred(lambda tx: tx.outputs[:1]),
+        )
+        self.assertEqual(calls, [])
+        self.assertEqual(tx.amount_in, Decimal(1))
+        self.assertEqual(len(tx.outputs), 1)
+        self.assertEqual(calls, [tx])
+
 
 class TransactionIOTests(unittest.TestCase):
     def test_amount_calculation_outgoing(self):
@@ -142,6 +175,50 @@ class TransactionIOTests(unittest.TestCase):
         self.assertEqual(tx.amount_in, 30)
         self.assertEqual(tx.amount_out, 0)
 
+    def test_assets_and_cached_sums(self):
+        addr = "addr_test1qqr585tvlc7ylnqvz8pyqwauzrdu0mxag3m7q56grgmgu7sxu2hyfhlkwuxupa9d5085eunq2qywy7hvmvej456flknswgndm3"
+        nft = AssetID(
+            "4e4654", "5d34cd53e5e2a9d9bf91bc8bc2ac45be8e7ba4e3bc8ab6c0f3c4b5a6"
+        )
+        coin = AssetID("", "b9a1e4ad0e1a3f6a4bc3d71c4c2b8c4e5b1f6a3b2c9d8e7f6a5b4c3d")
+        inp = Input("00" * 32, addr, Decimal(10), [(nft, 1), (coin, 100)], index=0)
+        out = Output(addr, Decimal("8.5"), [(coin, 40)], txid="ff" * 32, index=0)
+        tx = Transaction(
+            "ff" * 32,
+            fee=Decimal("0.5"),
+            inputs=[inp],
+            outputs=[out],
+            local_inputs=[inp],
+            local_outputs=[out],
+        )
+        self.assertEqual(tx.assets, {nft: -1, coin: -60})
+        self.assertEqual(tx.amount_out, Decimal("1"))
+        self.assertEqual(tx.local_outputs_sum, Decimal("8.5"))
+        tx.fee = Decimal("1.5")
+        self.assertEqual(tx.amount_out, Decimal("0"))
+        tx.local_inputs = []
+        self.assertEqual(tx.amount_in, Decimal("8.5"))
+        self.assertEqual(tx.assets, {coin: 40})
+
+    def test_io_equality(self):
+        addr = "addr_test1qqr585tvlc7ylnqvz8pyqwauzrdu0mxag3m7q56grgmgu7sxu2hyfhlkwuxupa9d5085eunq2qywy7hvmvej456flknswgndm3"
+        txid = "ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff"
+        inp = Input(txid, addr, Decimal(10), index=0)
+        self.assertEqual(inp, Input(txid, index=0))
+        self.assertNotEqual(inp, Input(txid, addr, Decimal(10), index=1))
+        self.assertEqual(len({inp, Input(txid, index=0), Input(txid, index=1)}), 2)
+        out = Output(addr, Decimal(10), txid=txid, index=0)
+        self.assertEqual(out, Output(addr, Decimal(10), txid=txid, index=0))
+        self.assertEqual(hash(out), hash(Output(addr, Decimal(10), txid=txid, index=0)))
+        self.assertNotEqual(out, Output(addr, Decimal(10), txid=txid, index=1))
+        self.assertNotEqual(out, Output(addr, Decimal(11), txid=txid, index=0))
+        self.assertNotEqual(out, inp)
+        refetched = {Output(addr, Decimal(10), txid=txid, index=i) for i in range(3)}
+        self.assertEqual(
+            refetched - {Output(addr, Decimal(10), txid=txid, index=i) for i in (0, 1)},
+            {Output(addr, Decimal(10), txid=txid, index=2)},
+        )
+
 
 class TestFilter(unittest.TestCase):
     def setUp(self):
@@ -251,6 +328,29 @@ class TestFilter(unittest.TestCase):
             ],
         )
 
+    def test_pages(self):
+        filter_ = TxFilter(unconfirmed=True)
+        everything = [tx.txid for tx in filter_.filter(self.txset)]
+        for limit in (None, 0, 1, 3, 10):
+            for offset in (0, 1, 5):
+                self.assertEqual(
+                    [
+                        tx.txid
+                        for tx in filter_.filter(self.txset, limit=limit, offset=offset)
+                    ],
+                    everything[offset:][:limit],
+                )
+                self.assertEqual(
+                    [
+                        tx.txid
+                        for tx in filter_.filter(
+                            self.txset, limit=limit, offset=offset, order="ascending"
+                        )
+                    ],
+                    everything[::-1][offset:][:limit],
+                )
+        self.assertRaises(ValueError, filter_.filter, self.txset, order="random")
+
     def test_zeros(self):
         filter_min = TxFilter(min_epoch=0, min_slot=0, min_absolute_slot=0)
         filter_max = TxFilter(
@@ -312,6 +412,18 @@ class TestFilter(unittest.TestCase):
         ).filter(self.txset)
         self.assertEqual(len(filtered), 2)
 
+    def test_dest_addr_not_in_inputs(self):
+        filtered = TxFilter(
+            dest_addr="addr_test1qpyppguxp7vlr77eywsvx9f9l0w07fkx7echm0wldaud9ucxu2hyfhlkwuxupa9d5085eunq2qywy7hvmvej456flkns8556zj",
+            unconfirmed=True,
+        ).filter(self.txset)
+        self.assertEqual(len(filtered), 2)
+        filtered = TxFilter(
+            src_addr="addr_test1qpyppguxp7vlr77eywsvx9f9l0w07fkx7echm0wldaud9ucxu2hyfhlkwuxupa9d5085eunq2qywy7hvmvej456flkns8556zj",
+            unconfirmed=True,
+        ).filter(self.txset)
+        self.assertEqual(len(filtered), 0)
+
     def test_epoch_range_min(self):
         filtered = TxFilter(min_epoch=131).filter(self.txset)
         self.assertEqual(len(filtered), 1)
@@ -367,3 +479,86 @@ class TestFilter(unittest.TestCase):
             max_absolute_slot=23000000, min_absolute_slot=22907000
         ).filter(self.txset)
         self.assertEqual(len(filtered), 1)
+
+
+class TestIndexedFilter(TestFilter):
+    def setUp(self):
+        super(TestIndexedFilter, self).setUp()
+        self.txlist = self.txset
+        self.txset = TransactionIndex(self.txlist)
+
+    def test_same_as_list(self):
+        for params in (
+            {"unconfirmed": True},
+            {"min_epoch": 122},
+            {"max_height": 2447816},
+            {"min_absolute_slot": 22596550, "max_absolute_slot": 24478170},
+            {
+                "dest_addr": "addr_test1qpyppguxp7vlr77eywsvx9f9l0w07fkx7echm0wldaud9ucxu2hyfhlkwuxupa9d5085eunq2qywy7hvmvej456flkns8556zj",
+                "unconfirmed": True,
+            },
+        ):
+            for page in ({}, {"limit": 2, "offset": 1, "order": "ascending"}):
+                self.assertEqual(
+                    [tx.txid for tx in TxFilter(**params).filter(self.txset, **page)],
+                    [tx.txid for tx in TxFilter(**params).filter(self.txlist, **page)],
+                )
+
+    def test_replace_and_remove(self):
+        self.assertEqual(len(self.txset), 7)
+        pending = self.txset.get(
+            "52e9167c6292f74b08c9a6e8e9c1f68220ad1d08a404b6f906c51e67bea4699c"
+        )
+        confirmed = Transaction(
+            txid=pending.txid,
+            status="in_ledger",
+            inserted_at=BlockPosition(
+                epoch=140, slot=1, absolute_slot=28000001, height=2500000
+            ),
+            inputs=pending.inputs,
+            outputs=pending.outputs,
+        )
+        self.txset.add(confirmed)
+        self.assertEqual(len(self.txset), 7)
+        self.assertIs(TxFilter(min_epoch=140).filter(self.txset)[0], confirmed)
+        self.assertEqual(
+            len(TxFilter(unconfirmed=True, confirmed=False).filter(self.txset)), 1
+        )
+        self.assertIs(self.txset.remove(confirmed.txid), confirmed)
+        self.assertIsNone(self.txset.remove(confirmed.txid))
+        self.assertNotIn(confirmed.txid, self.txset)
+        self.assertEqual(len(self.txset), 6)
+        self.assertEqual(
+            len(
+                TxFilter(
+                    src_addr="addr_test1qqr585tvlc7ylnqvz8pyqwauzrdu0mxag3m7q56grgmgu7sxu2hyfhlkwuxupa9d5085eunq2qywy7hvmvej456flknswgndm3",
+                    unconfirmed=True,
+                ).filter(self.txset)
+            ),
+            0,
+        )
+        self.assertEqual(len(TxFilter(min_epoch=140).filter(self.txset)), 0)
+
+    def test_deferred_indexed_lazily(self):
+        address = "addr_test1qpyppguxp7vlr77eywsvx9f9l0w07fkx7echm0wldaud9ucxu2hyfhlkwuxupa9d5085eunq2qywy7hvmvej456flkns8556zj"
+        calls = []
+
+        def decode(tx):
+            calls.append(tx)
+            return [Output(address=address, amount=Decimal(1))]
+
+        tx = Transaction(
+            txid="ff" * 32,
+            inputs=Deferred(lambda tx: []),
+            outputs=Deferred(decode),
+        )
+        self.txset.add(tx)
+        self.assertEqual(calls, [])
+        self.assertIn(
+            tx, TxFilter(dest_addr=address, unconfirmed=True).filter(self.txset)
+        )
+        self.assertEqual(calls, [tx])
+        self.assertIs(self.txset.remove(tx.txid), tx)
+        self.assertNotIn(
+            tx, TxFilter(dest_addr=address, unconfirmed=True).filter(self.txset)
+        )